@@ -28,3 +28,10 @@ from django.apps import AppConfig
 
 class ParcoursDoctoralConfig(AppConfig):
     name = 'parcours_doctoral'
+
+    def ready(self):
+        # Register the system checks
+        from parcours_doctoral import checks  # noqa: F401
+
+        # Connect the signal receivers
+        from parcours_doctoral.services import dashboard  # noqa: F401
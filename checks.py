@@ -0,0 +1,46 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from django.conf import settings
+from django.core.checks import Warning, register
+
+MIDDLEWARE_PATH = 'parcours_doctoral.middleware.ServiceRequestContextMiddleware'
+
+
+@register()
+def check_service_request_context_middleware(app_configs, **kwargs):
+    """Warn if the middleware opening the service context of each request is not installed."""
+    if MIDDLEWARE_PATH in settings.MIDDLEWARE:
+        return []
+    return [
+        Warning(
+            'The service context middleware is not installed.',
+            hint=(
+                f"Add '{MIDDLEWARE_PATH}' to the MIDDLEWARE setting: without it, the service calls are neither "
+                "memoized during the requests nor bounded by the request timeout."
+            ),
+            id='parcours_doctoral.W001',
+        )
+    ]
@@ -33,6 +33,7 @@ from django.utils.translation import gettext_lazy as _
 from osis_document_components.fields import FileUploadField
 
 from parcours_doctoral.contrib.views.autocomplete import LANGUAGE_UNDECIDED
+from parcours_doctoral.services.deadline import check_deadline, optional_lookup
 from parcours_doctoral.services.organisation import EntitiesService
 from parcours_doctoral.services.reference import (
     AcademicYearService,
@@ -63,6 +64,12 @@ DATE_FORMAT = '%d/%m/%Y'
 TIME_FORMAT = '%H:%M'
 
 
+def get_value_choices(value):
+    """Return the unique initial choice of a value whose label cannot be loaded, the value being used as label."""
+    return EMPTY_CHOICE if not value else EMPTY_CHOICE + ((value, value),)
+
+
+@optional_lookup(lambda iso_code=None, person=None, loaded_country=None: get_value_choices(iso_code))
 def get_country_initial_choices(iso_code=None, person=None, loaded_country=None):
     """Return the unique initial choice for a country when data is either set from initial or from webservice."""
     if not iso_code and not loaded_country:
@@ -75,6 +82,7 @@ def get_country_initial_choices(iso_code=None, person=None, loaded_country=None)
     )
 
 
+@optional_lookup(lambda code, person: get_value_choices(code))
 def get_language_initial_choices(code, person):
     """Return the unique initial choice for a language when data is either set from initial or from webservice."""
     if not code:
@@ -113,10 +121,13 @@ def get_thesis_location_initial_choices(value):
     return EMPTY_CHOICE if not value else EMPTY_CHOICE + ((value, value),)
 
 
+@optional_lookup(lambda uuid, person: get_value_choices(uuid))
 def get_scholarship_choices(uuid, person):
     """Return the unique initial choice for the campus."""
     if not uuid:
         return EMPTY_CHOICE
+    # The scholarship service does not check the deadline of the request itself
+    check_deadline()
     scholarship = ScholarshipService.get_scholarship(
         person=person,
         scholarship_uuid=uuid,
@@ -43,8 +43,12 @@ from parcours_doctoral.services.organisation import EntitiesService
 from parcours_doctoral.services.reference import (
     CountriesService,
     LanguageService,
+    SuperiorInstituteService,
     SuperiorNonUniversityService,
     UniversityService,
+    countries_index,
+    get_superior_institutes_index,
+    languages_index,
 )
 from parcours_doctoral.utils import (
     format_entity_title,
@@ -75,6 +79,8 @@ TRUTHY_VALUES = [True, "True", "true"]
 class PaginatedAutocompleteMixin:
     paginate_by = 20
     page_kwargs = 'page'
+    # Set by get_list when the total number of results is known
+    more = None
 
     def get_page(self):
         try:
@@ -94,12 +100,22 @@ class PaginatedAutocompleteMixin:
     def results(self, results):
         raise NotImplementedError
 
+    def paginate_list(self, results):
+        """Return the current page of the complete list of results and remember if there are other pages."""
+        pagination_kwargs = self.get_webservice_pagination_kwargs()
+        end = pagination_kwargs['offset'] + pagination_kwargs['limit']
+        self.more = len(results) > end
+        return results[pagination_kwargs['offset'] : end]
+
+    def has_more(self, results):
+        if self.more is not None:
+            return self.more
+        return len(results) >= self.paginate_by
+
     def get(self, request, *args, **kwargs):
         """Return option list json response."""
         results = self.get_list()
-        return JsonResponse(
-            {'results': self.results(results), 'pagination': {'more': len(results) >= self.paginate_by}}
-        )
+        return JsonResponse({'results': self.results(results), 'pagination': {'more': self.has_more(results)}})
 
 
 class ScholarshipAutocomplete(PaginatedAutocompleteMixin, autocomplete.Select2ListView):
@@ -127,6 +143,9 @@ class CountryAutocomplete(PaginatedAutocompleteMixin, autocomplete.Select2ListVi
     urlpatterns = 'country'
 
     def get_list(self):
+        countries = countries_index.search(search=self.q, person=self.request.user.person)
+        if countries is not None:
+            return self.paginate_list(countries)
         return CountriesService.get_countries(
             person=self.request.user.person,
             search=self.q,
@@ -195,6 +214,9 @@ class LanguageAutocomplete(PaginatedAutocompleteMixin, autocomplete.Select2ListV
     urlpatterns = 'language'
 
     def get_list(self):
+        languages = languages_index.search(search=self.q, person=self.request.user.person)
+        if languages is not None:
+            return self.paginate_list(languages)
         return LanguageService.get_languages(
             person=self.request.user.person,
             search=self.q,
@@ -316,6 +338,16 @@ class SuperiorInstituteAutocomplete(PaginatedAutocompleteMixin, autocomplete.Sel
             additional_filters['country_iso_code'] = country
         elif is_belgian:
             additional_filters['country_iso_code'] = CountryIsoCodes.BELGIQUE
+
+        # The universities and the superior non universities are merged and sorted by name in a single list
+        index = get_superior_institutes_index(
+            additional_filters.get('country_iso_code', ''),
+            person=self.request.user.person,
+        )
+        institutes = index.search(search=self.q, person=self.request.user.person) if index is not None else None
+        if institutes is not None:
+            return self.paginate_list(institutes)
+
         additional_filters.update(self.get_webservice_pagination_kwargs())
 
         universities = UniversityService.get_universities(
@@ -345,6 +377,9 @@ class SuperiorInstituteAutocomplete(PaginatedAutocompleteMixin, autocomplete.Sel
         else:
             superior_non_universities = []
 
+        SuperiorInstituteService.remember_types(universities, StudyType.UNIVERSITY.name)
+        SuperiorInstituteService.remember_types(superior_non_universities, StudyType.NON_UNIVERSITY.name)
+
         return sorted(
             itertools.chain(universities, superior_non_universities),
             key=lambda institute: institute.name,
@@ -27,12 +27,18 @@ from typing import List
 
 from django.shortcuts import resolve_url
 from django.utils.functional import cached_property
-from django.views.generic import RedirectView, TemplateView
-from osis_document_components.enums import PostProcessingWanted
+from django.views.generic import RedirectView
 from osis_parcours_doctoral_sdk.model.admissibility_dto import AdmissibilityDTO
-
-from parcours_doctoral.contrib.views.mixins import LoadViewMixin
+from osis_parcours_doctoral_sdk.model.jury_dto import JuryDTO
+
+from parcours_doctoral.contrib.views.mixins import (
+    AsyncLoadViewMixin,
+    AsyncTemplateView,
+    LoadViewMixin,
+    PdfDeliveryMixin,
+)
 from parcours_doctoral.services.doctorate import DoctorateJuryService, DoctorateService
+from parcours_doctoral.services.documents import DocumentTokenService
 
 __all__ = [
     'AdmissibilityDetailView',
@@ -55,33 +61,37 @@ class AdmissibilityCommonViewMixin(LoadViewMixin):
     def current_admissibility(self) -> AdmissibilityDTO:
         return next((admissibility for admissibility in self.admissibilities if admissibility.est_active), None)
 
+    @cached_property
+    def jury(self) -> JuryDTO:
+        return DoctorateJuryService.retrieve_jury(
+            person=self.request.user.person,
+            uuid=self.doctorate_uuid,
+        )
+
     def get_context_data(self, **kwargs):
         context_data = super().get_context_data(**kwargs)
 
         context_data['all_admissibilities'] = self.admissibilities
         context_data['current_admissibility'] = self.current_admissibility
 
-        jury = DoctorateJuryService.retrieve_jury(
-            person=self.request.user.person,
-            uuid=self.doctorate_uuid,
-        )
-
-        context_data['supervisors'] = [member for member in jury.membres if member.est_promoteur]
+        context_data['supervisors'] = [member for member in self.jury.membres if member.est_promoteur]
 
         return context_data
 
 
-class AdmissibilityDetailView(AdmissibilityCommonViewMixin, TemplateView):
+class AdmissibilityDetailView(AsyncLoadViewMixin, AdmissibilityCommonViewMixin, AsyncTemplateView):
     urlpatterns = 'admissibility'
     template_name = 'parcours_doctoral/details/admissibility.html'
     permission_link_to_check = 'retrieve_admissibility'
+    prefetched_properties = ['admissibilities', 'jury']
 
 
-class AdmissibilityMinutesCanvasView(LoadViewMixin, RedirectView):
+class AdmissibilityMinutesCanvasView(PdfDeliveryMixin, LoadViewMixin, RedirectView):
     urlpatterns = 'admissibility-minutes-canvas'
     permission_link_to_check = 'retrieve_admissibility_minutes_canvas'
+    document_kind = 'admissibility_minutes_canvas'
 
-    def get_redirect_url(self, *args, **kwargs):
+    def get_document_url(self):
         return DoctorateService.get_admissibility_minutes_canvas(
             person=self.request.user.person,
             doctorate_uuid=self.doctorate_uuid,
@@ -94,8 +104,14 @@ class AdmissibilityMinutesView(AdmissibilityCommonViewMixin, RedirectView):
     }
     permission_link_to_check = 'retrieve_admissibility'
 
+    @cached_property
+    def minutes_tokens(self):
+        # The tokens of the minutes of all the admissibilities are requested at once, the next ones being then cached
+        return DocumentTokenService.get_tokens(
+            admissibility.proces_verbal[0] for admissibility in self.admissibilities if admissibility.proces_verbal
+        )
+
     def get_redirect_url(self, *args, **kwargs):
-        from osis_document_components.services import get_remote_token
         from osis_document_components.utils import get_file_url
 
         admissibility_uuid = str(self.kwargs['admissibility_id'])
@@ -105,11 +121,9 @@ class AdmissibilityMinutesView(AdmissibilityCommonViewMixin, RedirectView):
         )
 
         if current_admissibility and current_admissibility.proces_verbal:
-            reading_token = get_remote_token(
-                current_admissibility.proces_verbal[0],
-                wanted_post_process=PostProcessingWanted.ORIGINAL.name,
-            )
+            reading_token = self.minutes_tokens.get(str(current_admissibility.proces_verbal[0]))
 
-            return get_file_url(reading_token)
+            if reading_token:
+                return get_file_url(reading_token)
 
         return resolve_url('parcours_doctoral:admissibility', pk=self.doctorate_uuid)
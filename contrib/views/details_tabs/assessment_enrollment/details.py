@@ -24,9 +24,7 @@
 #
 # ##############################################################################
 
-from django.views.generic import TemplateView
-
-from parcours_doctoral.contrib.views.mixins import LoadViewMixin
+from parcours_doctoral.contrib.views.mixins import AsyncLoadViewMixin, AsyncTemplateView
 from parcours_doctoral.services.training import DoctorateTrainingService
 
 __namespace__ = False
@@ -36,7 +34,7 @@ __all__ = [
 ]
 
 
-class AssessmentEnrollmentDetailsView(LoadViewMixin, TemplateView):
+class AssessmentEnrollmentDetailsView(AsyncLoadViewMixin, AsyncTemplateView):
     urlpatterns = 'details'
     template_name = 'parcours_doctoral/details/training/assessment_enrollment.html'
     permission_link_to_check = 'retrieve_assessment_enrollment'
@@ -27,14 +27,18 @@ from typing import List
 
 from django.shortcuts import resolve_url
 from django.utils.functional import cached_property
-from django.views.generic import RedirectView, TemplateView
+from django.views.generic import RedirectView
 from osis_document_components.enums import PostProcessingWanted
 from osis_parcours_doctoral_sdk.model.authorization_distribution_dto import (
     AuthorizationDistributionDTO,
 )
 from osis_parcours_doctoral_sdk.model.private_defense_dto import PrivateDefenseDTO
 
-from parcours_doctoral.contrib.views.mixins import LoadViewMixin
+from parcours_doctoral.contrib.views.mixins import (
+    AsyncLoadViewMixin,
+    AsyncTemplateView,
+    LoadViewMixin,
+)
 from parcours_doctoral.services.doctorate import DoctorateJuryService, DoctorateService
 
 __all__ = [
@@ -45,6 +49,7 @@ __namespace__ = False
 
 
 class AuthorizationDistributionCommonViewMixin(LoadViewMixin):
+
     @cached_property
     def authorization_distribution(self) -> AuthorizationDistributionDTO:
         return DoctorateService.get_authorization_distribution(
@@ -61,7 +66,12 @@ class AuthorizationDistributionCommonViewMixin(LoadViewMixin):
         return resolve_url('parcours_doctoral:authorization-distribution', pk=self.doctorate_uuid)
 
 
-class AuthorizationDistributionDetailView(AuthorizationDistributionCommonViewMixin, TemplateView):
+class AuthorizationDistributionDetailView(
+    AsyncLoadViewMixin,
+    AuthorizationDistributionCommonViewMixin,
+    AsyncTemplateView,
+):
     urlpatterns = 'authorization-distribution'
     template_name = 'parcours_doctoral/details/authorization_distribution.html'
     permission_link_to_check = 'retrieve_authorization_distribution'
+    prefetched_properties = ['authorization_distribution']
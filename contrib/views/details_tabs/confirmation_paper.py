@@ -24,12 +24,17 @@
 #
 # ##############################################################################
 
-from django.views.generic import TemplateView, RedirectView
-from osis_document_components.enums import PostProcessingWanted
+from django.utils.functional import cached_property
+from django.views.generic import RedirectView
 
 from osis_document_components.utils import get_file_url
-from parcours_doctoral.contrib.views.mixins import LoadViewMixin
+from parcours_doctoral.contrib.views.mixins import (
+    AsyncLoadViewMixin,
+    AsyncTemplateView,
+    LoadViewMixin,
+)
 from parcours_doctoral.services.doctorate import DoctorateService
+from parcours_doctoral.services.documents import DocumentTokenService
 
 __all__ = [
     'ConfirmationPaperDetailView',
@@ -38,23 +43,26 @@ __all__ = [
 __namespace__ = False
 
 
-class ConfirmationPaperDetailView(LoadViewMixin, TemplateView):
+class ConfirmationPaperDetailView(AsyncLoadViewMixin, AsyncTemplateView):
     urlpatterns = {'confirmation-paper': 'confirmation'}
     template_name = 'parcours_doctoral/details/confirmation_papers.html'
     permission_link_to_check = 'retrieve_confirmation'
+    prefetched_properties = ['confirmation_papers']
 
-    def get_context_data(self, **kwargs):
-        context_data = super().get_context_data(**kwargs)
-
-        all_confirmation_papers = DoctorateService.get_confirmation_papers(
+    @cached_property
+    def confirmation_papers(self):
+        return DoctorateService.get_confirmation_papers(
             person=self.request.user.person,
             uuid=self.doctorate_uuid,
         )
 
-        if all_confirmation_papers:
-            context_data['current_confirmation_paper'] = all_confirmation_papers.pop(0)
+    def get_context_data(self, **kwargs):
+        context_data = super().get_context_data(**kwargs)
+
+        if self.confirmation_papers:
+            context_data['current_confirmation_paper'] = self.confirmation_papers[0]
 
-        context_data['previous_confirmation_papers'] = all_confirmation_papers
+        context_data['previous_confirmation_papers'] = self.confirmation_papers[1:]
 
         return context_data
 
@@ -64,17 +72,12 @@ class ConfirmationPaperCanvasExportView(LoadViewMixin, RedirectView):
     permission_link_to_check = 'retrieve_confirmation'
 
     def get(self, request, *args, **kwargs):
-        from osis_document_components.services import get_remote_token
-
         canvas_uuid = DoctorateService.get_last_confirmation_paper_canvas(
             person=self.request.user.person,
             uuid=self.doctorate_uuid,
         ).uuid
 
-        reading_token = get_remote_token(
-            canvas_uuid,
-            wanted_post_process=PostProcessingWanted.ORIGINAL.name,
-        )
+        reading_token = DocumentTokenService.get_token(canvas_uuid)
 
         self.url = get_file_url(reading_token)
 
@@ -24,24 +24,29 @@
 #
 # ##############################################################################
 
-from django.views.generic import TemplateView
+from django.utils.functional import cached_property
 
-from parcours_doctoral.contrib.views.mixins import LoadViewMixin
+from parcours_doctoral.contrib.views.mixins import AsyncLoadViewMixin, AsyncTemplateView
 from parcours_doctoral.services.doctorate import DoctorateService
 
 __all__ = ['ExtensionRequestDetailView']
 
 
-class ExtensionRequestDetailView(LoadViewMixin, TemplateView):
+class ExtensionRequestDetailView(AsyncLoadViewMixin, AsyncTemplateView):
     template_name = 'parcours_doctoral/details/extension_request.html'
     permission_link_to_check = 'update_confirmation_extension'
+    prefetched_properties = ['last_confirmation_paper']
 
-    def get_context_data(self, **kwargs):
-        context_data = super().get_context_data(**kwargs)
-
-        context_data['confirmation_paper'] = DoctorateService.get_last_confirmation_paper(
+    @cached_property
+    def last_confirmation_paper(self):
+        return DoctorateService.get_last_confirmation_paper(
             person=self.request.user.person,
             uuid=self.doctorate_uuid,
         )
 
+    def get_context_data(self, **kwargs):
+        context_data = super().get_context_data(**kwargs)
+
+        context_data['confirmation_paper'] = self.last_confirmation_paper
+
         return context_data
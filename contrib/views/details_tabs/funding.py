@@ -25,14 +25,13 @@
 # ##############################################################################
 
 from django.utils.translation import gettext_lazy as _
-from django.views.generic import TemplateView
 
-from parcours_doctoral.contrib.views.mixins import LoadViewMixin
+from parcours_doctoral.contrib.views.mixins import AsyncLoadViewMixin, AsyncTemplateView
 
 __all__ = ['FundingDetailView']
 
 
-class FundingDetailView(LoadViewMixin, TemplateView):
+class FundingDetailView(AsyncLoadViewMixin, AsyncTemplateView):
     template_name = 'parcours_doctoral/details/funding.html'
     permission_link_to_check = 'retrieve_funding'
 
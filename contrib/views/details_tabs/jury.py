@@ -44,7 +44,11 @@ from parcours_doctoral.contrib.forms.jury.approvals import (
     JuryApprovalByPdfForm,
     JuryApprovalForm,
 )
-from parcours_doctoral.contrib.views.mixins import LoadViewMixin
+from parcours_doctoral.contrib.views.mixins import (
+    AsyncLoadViewMixin,
+    AsyncTemplateView,
+    LoadViewMixin,
+)
 from parcours_doctoral.services.doctorate import DoctorateJuryService
 from parcours_doctoral.services.mixins import WebServiceFormMixin
 
@@ -101,10 +105,11 @@ class LoadJuryViewMixin(LoadViewMixin):
         return context
 
 
-class JuryPreparationDetailView(LoadJuryViewMixin, TemplateView):
+class JuryPreparationDetailView(AsyncLoadViewMixin, LoadJuryViewMixin, AsyncTemplateView):
     urlpatterns = 'jury-preparation'
     template_name = 'parcours_doctoral/details/jury/preparation.html'
     permission_link_to_check = 'retrieve_jury_preparation'
+    prefetched_properties = ['jury']
 
 
 class JuryDetailView(LoadJuryViewMixin, WebServiceFormMixin, FormView):
@@ -112,6 +117,7 @@ class JuryDetailView(LoadJuryViewMixin, WebServiceFormMixin, FormView):
     template_name = 'parcours_doctoral/forms/jury/jury.html'
     permission_link_to_check = 'list_jury_members'
     form_class = JuryApprovalForm
+    prefetched_properties = ['jury']
 
     def get(self, request, *args, **kwargs):
         # If not signing in progress and ability to update jury, redirect on update page
@@ -51,6 +51,7 @@ class ManuscriptValidationView(LoadViewMixin, WebServiceFormMixin, FormView):
     template_name = 'parcours_doctoral/forms/manuscript_validation.html'
     extra_context = {'submit_label': gettext_lazy('Submit my decision')}
     permission_link_to_check = 'retrieve_manuscript_validation'
+    prefetched_properties = ['authorization_distribution']
 
     @cached_property
     def authorization_distribution(self) -> AuthorizationDistributionDTO:
@@ -27,12 +27,18 @@ from typing import List
 
 from django.shortcuts import resolve_url
 from django.utils.functional import cached_property
-from django.views.generic import RedirectView, TemplateView
-from osis_document_components.enums import PostProcessingWanted
+from django.views.generic import RedirectView
+from osis_parcours_doctoral_sdk.model.jury_dto import JuryDTO
 from osis_parcours_doctoral_sdk.model.private_defense_dto import PrivateDefenseDTO
 
-from parcours_doctoral.contrib.views.mixins import LoadViewMixin
+from parcours_doctoral.contrib.views.mixins import (
+    AsyncLoadViewMixin,
+    AsyncTemplateView,
+    LoadViewMixin,
+    PdfDeliveryMixin,
+)
 from parcours_doctoral.services.doctorate import DoctorateJuryService, DoctorateService
+from parcours_doctoral.services.documents import DocumentTokenService
 
 __all__ = [
     'PrivateDefenseDetailView',
@@ -57,33 +63,37 @@ class PrivateDefenseCommonViewMixin(LoadViewMixin):
     def current_private_defense(self) -> PrivateDefenseDTO:
         return next((private_defense for private_defense in self.private_defenses if private_defense.est_active), None)
 
+    @cached_property
+    def jury(self) -> JuryDTO:
+        return DoctorateJuryService.retrieve_jury(
+            person=self.request.user.person,
+            uuid=self.doctorate_uuid,
+        )
+
     def get_context_data(self, **kwargs):
         context_data = super().get_context_data(**kwargs)
 
         context_data['all_private_defenses'] = self.private_defenses
         context_data['current_private_defense'] = self.current_private_defense
 
-        jury = DoctorateJuryService.retrieve_jury(
-            person=self.request.user.person,
-            uuid=self.doctorate_uuid,
-        )
-
-        context_data['supervisors'] = [member for member in jury.membres if member.est_promoteur]
+        context_data['supervisors'] = [member for member in self.jury.membres if member.est_promoteur]
 
         return context_data
 
 
-class PrivateDefenseDetailView(PrivateDefenseCommonViewMixin, TemplateView):
+class PrivateDefenseDetailView(AsyncLoadViewMixin, PrivateDefenseCommonViewMixin, AsyncTemplateView):
     urlpatterns = 'private-defense'
     template_name = 'parcours_doctoral/details/private_defenses.html'
     permission_link_to_check = 'retrieve_private_defense'
+    prefetched_properties = ['private_defenses', 'jury']
 
 
-class PrivateDefenseMinutesCanvasView(LoadViewMixin, RedirectView):
+class PrivateDefenseMinutesCanvasView(PdfDeliveryMixin, LoadViewMixin, RedirectView):
     urlpatterns = 'private-defense-minutes-canvas'
     permission_link_to_check = 'retrieve_private_defense_minutes_canvas'
+    document_kind = 'private_defense_minutes_canvas'
 
-    def get_redirect_url(self, *args, **kwargs):
+    def get_document_url(self):
         return DoctorateService.get_private_defense_minutes_canvas(
             person=self.request.user.person,
             uuid=self.doctorate_uuid,
@@ -96,8 +106,16 @@ class PrivateDefenseMinutesView(PrivateDefenseCommonViewMixin, RedirectView):
     }
     permission_link_to_check = ['retrieve_private_defense', 'retrieve_private_public_defenses']
 
+    @cached_property
+    def minutes_tokens(self):
+        # The tokens of the minutes of all the private defenses are requested at once, the next ones being then cached
+        return DocumentTokenService.get_tokens(
+            private_defense.proces_verbal[0]
+            for private_defense in self.private_defenses
+            if private_defense.proces_verbal
+        )
+
     def get_redirect_url(self, *args, **kwargs):
-        from osis_document_components.services import get_remote_token
         from osis_document_components.utils import get_file_url
 
         private_defense_uuid = str(self.kwargs['private_defense_id'])
@@ -111,11 +129,9 @@ class PrivateDefenseMinutesView(PrivateDefenseCommonViewMixin, RedirectView):
         )
 
         if current_private_defense and current_private_defense.proces_verbal:
-            reading_token = get_remote_token(
-                current_private_defense.proces_verbal[0],
-                wanted_post_process=PostProcessingWanted.ORIGINAL.name,
-            )
+            reading_token = self.minutes_tokens.get(str(current_private_defense.proces_verbal[0]))
 
-            return get_file_url(reading_token)
+            if reading_token:
+                return get_file_url(reading_token)
 
         return resolve_url('parcours_doctoral:private-defense', pk=self.doctorate_uuid)
@@ -24,11 +24,10 @@
 #
 # ##############################################################################
 
-from django.views.generic import TemplateView
-
 from parcours_doctoral.contrib.views.details_tabs.private_defense import (
     PrivateDefenseCommonViewMixin,
 )
+from parcours_doctoral.contrib.views.mixins import AsyncLoadViewMixin, AsyncTemplateView
 
 __all__ = [
     'PrivatePublicDefensesDetailView',
@@ -37,7 +36,8 @@ __all__ = [
 __namespace__ = False
 
 
-class PrivatePublicDefensesDetailView(PrivateDefenseCommonViewMixin, TemplateView):
+class PrivatePublicDefensesDetailView(AsyncLoadViewMixin, PrivateDefenseCommonViewMixin, AsyncTemplateView):
     urlpatterns = 'private-public-defenses'
     template_name = 'parcours_doctoral/details/private_public_defenses.html'
     permission_link_to_check = 'retrieve_private_public_defenses'
+    prefetched_properties = ['private_defenses', 'jury']
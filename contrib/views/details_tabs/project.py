@@ -24,13 +24,11 @@
 #
 # ##############################################################################
 
-from django.views.generic import TemplateView
-
-from parcours_doctoral.contrib.views.mixins import LoadViewMixin
+from parcours_doctoral.contrib.views.mixins import AsyncLoadViewMixin, AsyncTemplateView
 
 __all__ = ['ProjectDetailView']
 
 
-class ProjectDetailView(LoadViewMixin, TemplateView):
+class ProjectDetailView(AsyncLoadViewMixin, AsyncTemplateView):
     template_name = 'parcours_doctoral/details/project.html'
     permission_link_to_check = 'retrieve_project'
@@ -24,11 +24,16 @@
 #
 # ##############################################################################
 from django.shortcuts import resolve_url
-from django.views.generic import RedirectView, TemplateView
-from osis_document_components.enums import PostProcessingWanted
+from django.views.generic import RedirectView
 
-from parcours_doctoral.contrib.views.mixins import LoadViewMixin
+from parcours_doctoral.contrib.views.mixins import (
+    AsyncLoadViewMixin,
+    AsyncTemplateView,
+    LoadViewMixin,
+    PdfDeliveryMixin,
+)
 from parcours_doctoral.services.doctorate import DoctorateService
+from parcours_doctoral.services.documents import DocumentTokenService
 
 __all__ = [
     'PublicDefenseDetailView',
@@ -39,17 +44,18 @@ __all__ = [
 __namespace__ = False
 
 
-class PublicDefenseDetailView(LoadViewMixin, TemplateView):
+class PublicDefenseDetailView(AsyncLoadViewMixin, AsyncTemplateView):
     urlpatterns = 'public-defense'
     template_name = 'parcours_doctoral/details/public_defense.html'
     permission_link_to_check = 'retrieve_public_defense'
 
 
-class PublicDefenseMinutesCanvasView(LoadViewMixin, RedirectView):
+class PublicDefenseMinutesCanvasView(PdfDeliveryMixin, LoadViewMixin, RedirectView):
     urlpatterns = 'public-defense-minutes-canvas'
     permission_link_to_check = 'retrieve_public_defense_minutes_canvas'
+    document_kind = 'public_defense_minutes_canvas'
 
-    def get_redirect_url(self, *args, **kwargs):
+    def get_document_url(self):
         return DoctorateService.get_public_defense_minutes_canvas(
             person=self.request.user.person,
             uuid=self.doctorate_uuid,
@@ -61,16 +67,13 @@ class PublicDefenseMinutesView(LoadViewMixin, RedirectView):
     permission_link_to_check = ['retrieve_public_defense', 'retrieve_private_public_defenses']
 
     def get_redirect_url(self, *args, **kwargs):
-        from osis_document_components.services import get_remote_token
         from osis_document_components.utils import get_file_url
 
         doctorate = self.doctorate
         if doctorate and doctorate.proces_verbal_soutenance_publique:
-            reading_token = get_remote_token(
-                doctorate.proces_verbal_soutenance_publique[0],
-                wanted_post_process=PostProcessingWanted.ORIGINAL.name,
-            )
+            reading_token = DocumentTokenService.get_token(doctorate.proces_verbal_soutenance_publique[0])
 
-            return get_file_url(reading_token)
+            if reading_token:
+                return get_file_url(reading_token)
 
         return resolve_url('parcours_doctoral:public-defense', pk=self.doctorate_uuid)
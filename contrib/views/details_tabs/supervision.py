@@ -40,7 +40,7 @@ from parcours_doctoral.contrib.forms.supervision import (
     DoctorateApprovalForm,
     DoctorateMemberSupervisionForm,
 )
-from parcours_doctoral.contrib.views.mixins import LoadViewMixin
+from parcours_doctoral.contrib.views.mixins import LoadViewMixin, PdfDeliveryMixin
 from parcours_doctoral.services.doctorate import (
     DoctorateService,
     DoctorateSupervisionService,
@@ -60,6 +60,7 @@ class SupervisionDetailView(LoadViewMixin, WebServiceFormMixin, FormView):
     permission_link_to_check = 'retrieve_supervision'
     form_class = DoctorateApprovalForm
     rejecting = False
+    prefetched_properties = ['supervision']
 
     @cached_property
     def supervision(self):
@@ -147,11 +148,12 @@ class SupervisionDetailView(LoadViewMixin, WebServiceFormMixin, FormView):
         return self.request.POST.get('redirect_to') or self.request.get_full_path()
 
 
-class SupervisionCanvasView(LoadViewMixin, RedirectView):
+class SupervisionCanvasView(PdfDeliveryMixin, LoadViewMixin, RedirectView):
     urlpatterns = 'supervision-canvas'
     permission_link_to_check = 'retrieve_supervision_canvas'
+    document_kind = 'supervision_canvas'
 
-    def get_redirect_url(self, *args, **kwargs):
+    def get_document_url(self):
         return DoctorateService.get_supervision_canvas(
             person=self.person,
             uuid_doctorate=self.doctorate_uuid,
@@ -30,7 +30,7 @@ from typing import Tuple, Union
 from django.forms import Form
 from django.http import Http404
 from django.shortcuts import resolve_url
-from django.template import Context, Template
+from django.template import Context
 from django.utils.functional import cached_property
 from django.utils.translation import get_language
 from django.views.generic import FormView
@@ -45,7 +45,9 @@ from parcours_doctoral.contrib.enums.training import (
 from parcours_doctoral.contrib.forms.training import *
 from parcours_doctoral.contrib.views.mixins import LoadViewMixin
 from parcours_doctoral.services.mixins import WebServiceFormMixin
+from parcours_doctoral.services.pdf import enqueue_training_recaps
 from parcours_doctoral.services.training import DoctorateTrainingService
+from parcours_doctoral.utils.templates import get_inline_template
 
 __all__ = [
     "TrainingActivityAddView",
@@ -59,6 +61,19 @@ __namespace__ = {
     'course-enrollment': 'course-enrollment',
 }
 
+ACTIVITY_TITLE_TEMPLATE = """{% load parcours_doctoral %}
+{% firstof 0 activity.category|lower|add:'.html' as template_name %}
+{% include "parcours_doctoral/details/training/_activity_title.html" %}
+"""
+
+
+def render_activity_title(activity, request):
+    return (
+        get_inline_template(ACTIVITY_TITLE_TEMPLATE)
+        .render(Context({'activity': activity, 'request': request}))
+        .strip()
+    )
+
 
 class TrainingActivityFormMixin(LoadViewMixin, WebServiceFormMixin, FormMixin, ABC):
     template_name = "parcours_doctoral/forms/training.html"
@@ -208,6 +223,7 @@ class TrainingActivityEditView(TrainingActivityFormMixin, FormView):
             **data,
         )
         self.activity_uuid = response['uuid']
+        enqueue_training_recaps(self.person, self.doctorate_uuid)
 
 
 class TrainingActivityDeleteView(LoadViewMixin, WebServiceFormMixin, FormView):
@@ -234,16 +250,7 @@ class TrainingActivityDeleteView(LoadViewMixin, WebServiceFormMixin, FormView):
         ).to_dict()
 
     def get_context_data(self, **kwargs):
-        kwargs['object'] = (
-            Template(
-                """{% load parcours_doctoral %}
-            {% firstof 0 activity.category|lower|add:'.html' as template_name %}
-            {% include "parcours_doctoral/details/training/_activity_title.html" %}
-            """
-            )
-            .render(Context({'activity': self.activity, 'request': self.request}))
-            .strip()
-        )
+        kwargs['object'] = render_activity_title(self.activity, self.request)
         return super().get_context_data(**kwargs)
 
     def get_success_url(self):
@@ -268,6 +275,7 @@ class TrainingActivityAssentView(LoadViewMixin, WebServiceFormMixin, FormView):
             activity_uuid=str(self.kwargs['activity_id']),
             **data,
         )
+        enqueue_training_recaps(self.person, self.doctorate_uuid)
 
     def get_initial(self):
         assent = self.activity['reference_promoter_assent']
@@ -278,16 +286,7 @@ class TrainingActivityAssentView(LoadViewMixin, WebServiceFormMixin, FormView):
 
     def get_context_data(self, **kwargs):
         kwargs['activity'] = self.activity
-        kwargs['object'] = (
-            Template(
-                """{% load parcours_doctoral %}
-            {% firstof 0 activity.category|lower|add:'.html' as template_name %}
-            {% include "parcours_doctoral/details/training/_activity_title.html" %}
-            """
-            )
-            .render(Context({'activity': self.activity, 'request': self.request}))
-            .strip()
-        )
+        kwargs['object'] = render_activity_title(self.activity, self.request)
         return super().get_context_data(**kwargs)
 
     @cached_property
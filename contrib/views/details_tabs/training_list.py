@@ -27,14 +27,20 @@
 from copy import copy
 
 from django.utils.functional import cached_property
-from django.views.generic import FormView, RedirectView, TemplateView
+from django.views.generic import FormView, RedirectView
 
 from frontoffice.settings.osis_sdk.utils import MultipleApiBusinessException
 from parcours_doctoral.contrib.enums import StatutActivite
 from parcours_doctoral.contrib.forms.training import BatchActivityForm
-from parcours_doctoral.contrib.views.mixins import LoadViewMixin
+from parcours_doctoral.contrib.views.mixins import (
+    AsyncLoadViewMixin,
+    AsyncTemplateView,
+    LoadViewMixin,
+    PdfDeliveryMixin,
+)
 from parcours_doctoral.services.doctorate import DoctorateService
 from parcours_doctoral.services.mixins import WebServiceFormMixin
+from parcours_doctoral.services.pdf import TRAINING_RECAP_DOCUMENT_KIND, enqueue_training_recaps
 from parcours_doctoral.services.training import DoctorateTrainingService
 from parcours_doctoral.utils.utils import get_categories
 
@@ -53,13 +59,13 @@ class DoctoralTrainingListView(LoadViewMixin, WebServiceFormMixin, FormView):
     template_name = 'parcours_doctoral/training_list.html'
     form_class = BatchActivityForm
     permission_link_to_check = 'retrieve_doctorate_training'
+    prefetched_properties = ['activities', 'training_config']
 
     def get_context_data(self, **kwargs):
         context_data = super().get_context_data(**kwargs)
         context_data['activities'] = self.activities
         context_data['statuses'] = StatutActivite.choices()
-        config = DoctorateTrainingService.get_config(person=self.person, uuid=self.doctorate_uuid)
-        context_data['categories'] = get_categories(config)
+        context_data['categories'] = get_categories(self.training_config)
         context_data['categories_labels_dict'] = dict(context_data['categories'])
         context_data['activities_form'] = context_data.pop('form')  # Trick template
         return context_data
@@ -71,6 +77,10 @@ class DoctoralTrainingListView(LoadViewMixin, WebServiceFormMixin, FormView):
             uuid=self.doctorate_uuid,
         )
 
+    @cached_property
+    def training_config(self):
+        return DoctorateTrainingService.get_config(person=self.person, uuid=self.doctorate_uuid)
+
     def get_success_url(self):
         return self.request.POST.get('redirect_to') or self.request.get_full_path()
 
@@ -83,7 +93,9 @@ class DoctoralTrainingListView(LoadViewMixin, WebServiceFormMixin, FormView):
         return {'activity_uuids': data['activity_ids']}
 
     def call_webservice(self, data):
-        return DoctorateTrainingService.submit_activities(self.person, self.doctorate_uuid, **data)
+        result = DoctorateTrainingService.submit_activities(self.person, self.doctorate_uuid, **data)
+        enqueue_training_recaps(self.person, self.doctorate_uuid)
+        return result
 
     def form_valid(self, form):
         data = self.prepare_data(copy(form.cleaned_data))
@@ -125,7 +137,7 @@ class CourseEnrollmentListView(DoctoralTrainingListView):
         )
 
 
-class AssessmentEnrollmentListView(LoadViewMixin, TemplateView):
+class AssessmentEnrollmentListView(AsyncLoadViewMixin, AsyncTemplateView):
     urlpatterns = 'assessment-enrollment'
     template_name = "parcours_doctoral/assessment_enrollment.html"
     permission_link_to_check = 'retrieve_assessment_enrollment'
@@ -154,11 +166,12 @@ class AssessmentEnrollmentListView(LoadViewMixin, TemplateView):
         return context_data
 
 
-class TrainingRecapPdfView(LoadViewMixin, RedirectView):
+class TrainingRecapPdfView(PdfDeliveryMixin, LoadViewMixin, RedirectView):
     urlpatterns = {'training-recap-pdf': 'training-recap-pdf/<str:status>'}
     permission_link_to_check = 'retrieve_doctorate_training'
+    document_kind = TRAINING_RECAP_DOCUMENT_KIND
 
-    def get_redirect_url(self, *args, **kwargs):
+    def get_document_url(self):
         return DoctorateService.get_training_recap_pdf(
             person=self.person,
             uuid_doctorate=self.doctorate_uuid,
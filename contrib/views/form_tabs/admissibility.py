@@ -40,6 +40,8 @@ __all__ = ['AdmissibilityFormView']
 
 
 class AdmissibilityFormView(AdmissibilityCommonViewMixin, WebServiceFormMixin, FormView):
+    prefetched_properties = ['admissibilities', 'jury']
+
     @property
     def permission_link_to_check(self):
         return 'update_admissibility' if self.is_doctorate_student else 'submit_admissibility_minutes_and_opinions'
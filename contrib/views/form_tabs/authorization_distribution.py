@@ -51,6 +51,7 @@ class AuthorizationDistributionFormView(AuthorizationDistributionCommonViewMixin
     template_name = 'parcours_doctoral/forms/authorization_distribution.html'
     permission_link_to_check = 'update_authorization_distribution'
     form_class = AuthorizationDistributionForm
+    prefetched_properties = ['authorization_distribution']
     error_mapping = {
         AuthorizationDistributionBusinessException.SourcesFinancementsNonCompleteesException: 'sources_financement',
         AuthorizationDistributionBusinessException.ResumeAnglaisNonCompleteException: 'resume_anglais',
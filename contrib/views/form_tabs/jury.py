@@ -55,6 +55,7 @@ class JuryPreparationFormView(LoadJuryViewMixin, WebServiceFormMixin, FormView):
     template_name = 'parcours_doctoral/forms/jury/preparation.html'
     form_class = JuryPreparationForm
     permission_link_to_check = 'update_jury_preparation'
+    prefetched_properties = ['jury']
 
     def get_form_kwargs(self):
         kwargs = super().get_form_kwargs()
@@ -81,6 +82,7 @@ class JuryPreparationFormView(LoadJuryViewMixin, WebServiceFormMixin, FormView):
 
 class JuryFormView(LoadJuryViewMixin, WebServiceFormMixin, FormView):
     form_class = JuryMembreForm
+    prefetched_properties = ['jury']
     error_mapping = {
         JuryBusinessException.NonDocteurSansJustificationException: "justification_non_docteur",
         JuryBusinessException.MembreExterneSansInstitutionException: "institution",
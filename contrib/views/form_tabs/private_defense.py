@@ -40,6 +40,8 @@ __all__ = ['PrivateDefenseFormView']
 
 
 class PrivateDefenseFormView(PrivateDefenseCommonViewMixin, WebServiceFormMixin, FormView):
+    prefetched_properties = ['private_defenses', 'jury']
+
     @property
     def permission_link_to_check(self):
         return 'update_private_defense' if self.is_doctorate_student else 'submit_private_defense_minutes'
@@ -45,6 +45,7 @@ __namespace__ = False
 
 class PrivatePublicDefensesFormView(PrivateDefenseCommonViewMixin, WebServiceFormMixin, FormView):
     urlpatterns = 'private-public-defenses'
+    prefetched_properties = ['private_defenses', 'jury']
 
     @property
     def permission_link_to_check(self):
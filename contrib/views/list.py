@@ -23,8 +23,7 @@
 #    see http://www.gnu.org/licenses/.
 #
 # ##############################################################################
-from django.views.generic import TemplateView
-
+from parcours_doctoral.contrib.views.mixins import AsyncTemplateView
 from parcours_doctoral.services.doctorate import DoctorateService
 from parcours_doctoral.templatetags.parcours_doctoral import TAB_TREE
 
@@ -35,7 +34,7 @@ __all__ = [
 __namespace__ = False
 
 
-class DoctorateListView(TemplateView):
+class DoctorateListView(AsyncTemplateView):
     urlpatterns = {'list': 'list'}
     template_name = 'parcours_doctoral/doctorate_list.html'
 
@@ -47,7 +46,7 @@ class DoctorateListView(TemplateView):
         return context
 
 
-class DoctorateMemberListView(TemplateView):
+class DoctorateMemberListView(AsyncTemplateView):
     urlpatterns = {'supervised-list': 'supervised'}
     template_name = 'parcours_doctoral/supervised_list.html'
 
@@ -23,26 +23,66 @@
 #  see http://www.gnu.org/licenses/.
 #
 # ##############################################################################
+import asyncio
+import inspect
+from functools import partial
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from django.contrib.auth.mixins import PermissionRequiredMixin
+from django.http import HttpResponseGone, HttpResponseRedirect, StreamingHttpResponse
 from django.shortcuts import resolve_url
 from django.utils.functional import cached_property
+from django.views.generic import TemplateView
 from django.views.generic.base import ContextMixin
 
+from parcours_doctoral.services.asynchronous import AsyncDoctorateService
 from parcours_doctoral.services.doctorate import DoctorateService
-from parcours_doctoral.templatetags.parcours_doctoral import can_make_action
+from parcours_doctoral.services.pdf import (
+    STREAMED_HEADERS,
+    RemoteFileContent,
+    make_document_key,
+    open_remote_file,
+    pdf_delivery_cache,
+)
+from parcours_doctoral.utils.concurrency import run_concurrently
+from parcours_doctoral.utils.permissions import get_doctorate_permissions
 
 
 class LoadViewMixin(PermissionRequiredMixin, ContextMixin):
     permission_link_to_check: str | list[str] = ''  # For a list, give access if one action is possible
+    prefetched_properties: list[str] = []  # Cached properties used to render the view, loaded concurrently
+
+    def dispatch(self, request, *args, **kwargs):
+        # The permissions are checked first so that nothing else is loaded for the users who cannot access the view
+        if not self.has_permission():
+            return self.handle_no_permission()
+        if request.method in {'GET', 'HEAD'} and request.user.is_authenticated:
+            self.prefetch(*self.prefetched_properties)
+        return super().dispatch(request, *args, **kwargs)
+
+    def prefetch(self, *property_names):
+        """
+        Concurrently load the doctorate and the specified cached properties, if they are not loaded yet. A failing
+        property is left unloaded so that the error is raised when it is accessed.
+
+        The doctorate is usually already loaded to check the permissions.
+        """
+        if self.doctorate_uuid:
+            property_names = ('doctorate', *property_names)
+
+        property_names = [name for name in dict.fromkeys(property_names) if name not in self.__dict__]
+
+        # The person is retrieved from the database so it must be loaded in the current thread
+        if len(property_names) > 1 and self.person:
+            run_concurrently(*(partial(getattr, self, name) for name in property_names))
 
     def has_permission(self):
         if self.doctorate_uuid and self.permission_link_to_check:
-            doctorate = self.doctorate
-
             if isinstance(self.permission_link_to_check, str):
-                return can_make_action(doctorate, self.permission_link_to_check)
+                return self.permissions.can_make_action(self.permission_link_to_check)
 
-            return any(can_make_action(doctorate=doctorate, action_name=act) for act in self.permission_link_to_check)
+            return any(self.permissions.can_make_action(action_name) for action_name in self.permission_link_to_check)
 
         return True
 
@@ -76,8 +116,110 @@ class LoadViewMixin(PermissionRequiredMixin, ContextMixin):
             uuid=self.doctorate_uuid,
         )
 
+    @cached_property
+    def permissions(self):
+        """Permissions of the user on the doctorate, shared with the template tags of the request."""
+        return get_doctorate_permissions(self.doctorate)
+
     def _get_url(self, tab_name, update=False):
         """Return the URL for the given tab."""
         kwargs = {'pk': self.doctorate_uuid} if self.doctorate_uuid else {}
         with_update = ':update' if update else ''
         return resolve_url(f'parcours_doctoral{with_update}:{tab_name}', **kwargs)
+
+
+class AsyncLoadViewMixin(LoadViewMixin):
+    """
+    Variant of LoadViewMixin for the views whose handlers are asynchronous (see AsyncTemplateView).
+
+    The doctorate (through the asynchronous services) and then the prefetched properties are loaded in worker threads,
+    so that the event loop can serve other requests while waiting for the backend.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        is_authenticated = await sync_to_async(lambda: request.user.is_authenticated)()
+
+        # The permissions are checked first so that nothing else is loaded for the users who cannot access the view
+        if is_authenticated and self.doctorate_uuid and 'doctorate' not in self.__dict__:
+            person = await sync_to_async(getattr)(self, 'person')
+            self.doctorate = await AsyncDoctorateService.get_doctorate(person=person, uuid=self.doctorate_uuid)
+        if not await sync_to_async(self.has_permission)():
+            return await sync_to_async(self.handle_no_permission)()
+
+        if request.method in {'GET', 'HEAD'} and is_authenticated:
+            await self.aprefetch(*self.prefetched_properties)
+
+        # The properties are already loaded, so the synchronous prefetch of LoadViewMixin is skipped
+        response = await sync_to_async(super(LoadViewMixin, self).dispatch)(request, *args, **kwargs)
+        if inspect.isawaitable(response):
+            response = await response
+        return response
+
+    async def aprefetch(self, *property_names):
+        """Asynchronous variant of LoadViewMixin.prefetch."""
+        if self.doctorate_uuid:
+            property_names = ('doctorate', *property_names)
+
+        property_names = [name for name in dict.fromkeys(property_names) if name not in self.__dict__]
+
+        if property_names:
+            # The person is retrieved from the database so it must be loaded in the thread of the request
+            await sync_to_async(getattr)(self, 'person')
+            await asyncio.gather(
+                *(sync_to_async(getattr, thread_sensitive=False)(self, name) for name in property_names),
+                return_exceptions=True,
+            )
+
+
+class AsyncTemplateView(TemplateView):
+    """TemplateView whose GET handler is asynchronous, the context data being computed in the thread of the request."""
+
+    async def get(self, request, *args, **kwargs):
+        context = await sync_to_async(self.get_context_data)(**kwargs)
+        return self.render_to_response(context)
+
+
+class PdfDeliveryMixin:
+    """
+    Deliver a document generated by the backend, to be used with LoadViewMixin and RedirectView.
+
+    The url of the document is cached by doctorate, user, kind of document and content version of the doctorate, so
+    that the document is only generated again once the doctorate has changed. The user is redirected to the document
+    or, if PARCOURS_DOCTORAL_PDF_STREAMING is set, the document is streamed by chunks through the portal, the requested
+    range being forwarded.
+    """
+
+    document_kind = ''
+
+    def get_document_url(self):
+        raise NotImplementedError
+
+    def get_document_key(self):
+        return make_document_key(self.document_kind, self.person.pk, **self.kwargs)
+
+    def get_redirect_url(self, *args, **kwargs):
+        return pdf_delivery_cache.get_or_load(
+            key=self.get_document_key(),
+            doctorate_uuid=self.doctorate_uuid,
+            loader=self.get_document_url,
+        )
+
+    def get(self, request, *args, **kwargs):
+        if not getattr(settings, 'PARCOURS_DOCTORAL_PDF_STREAMING', False):
+            return super().get(request, *args, **kwargs)
+
+        url = self.get_redirect_url(*args, **kwargs)
+        if not url:
+            return HttpResponseGone()
+
+        remote_file = open_remote_file(url, range_header=request.headers.get('Range'))
+        if remote_file.status not in {200, 206, 416}:
+            # Let the user be informed of the error by the document server
+            remote_file.release_conn()
+            return HttpResponseRedirect(url)
+
+        response = StreamingHttpResponse(RemoteFileContent(remote_file), status=remote_file.status)
+        for header in STREAMED_HEADERS:
+            if header in remote_file.headers:
+                response[header] = remote_file.headers[header]
+        return response
@@ -0,0 +1,121 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import logging
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.translation import gettext_lazy as _
+
+from parcours_doctoral.services.budget import check_service_calls
+from parcours_doctoral.services.context import service_request_context
+from parcours_doctoral.services.deadline import ServiceUnavailable
+
+__all__ = [
+    "ServiceRequestContextMiddleware",
+]
+
+logger = logging.getLogger(__name__)
+
+# Number of seconds after which the backends are not called anymore while processing a request
+DEFAULT_REQUEST_TIMEOUT = 20
+
+
+class ServiceRequestContextMiddleware:
+    """
+    Open a service context for each request so that the read-only service calls are memoized while it is processed.
+
+    It must be added to the MIDDLEWARE setting, and supports both the synchronous and the asynchronous requests.
+
+    A summary of the service calls made during the request is logged (at the debug level) and, if the
+    PARCOURS_DOCTORAL_SERVER_TIMING setting is enabled (by default in debug mode), added to the response in a
+    Server-Timing header. The calls are then checked against the budget and the N+1 patterns (see check_service_calls).
+
+    The backend calls must be made within PARCOURS_DOCTORAL_REQUEST_TIMEOUT seconds (0 for no deadline) from the
+    start of the request: the timeout of each call is bounded by the time left, and the calls fail with
+    DeadlineExceeded once it is spent (see parcours_doctoral.services.deadline).
+
+    A request whose backend calls could not be made (see ServiceUnavailable), because of an open circuit breaker, a
+    full bulkhead or the deadline, is answered with a 503 response instead of an error.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with service_request_context(timeout=self.get_timeout()) as context:
+            response = self.get_response(request)
+            self.add_summary(request, response, context)
+            check_service_calls(context, f'{request.method} {request.path}')
+            return response
+
+    async def __acall__(self, request):
+        with service_request_context(timeout=self.get_timeout()) as context:
+            response = await self.get_response(request)
+            self.add_summary(request, response, context)
+            check_service_calls(context, f'{request.method} {request.path}')
+            return response
+
+    @staticmethod
+    def process_exception(request, exception):
+        if isinstance(exception, ServiceUnavailable):
+            logger.warning("%s %s: service unavailable (%s)", request.method, request.path, exception)
+            return HttpResponse(
+                _("The service is temporarily unavailable, please try again later."),
+                status=503,
+            )
+
+    @staticmethod
+    def get_timeout():
+        return getattr(settings, 'PARCOURS_DOCTORAL_REQUEST_TIMEOUT', DEFAULT_REQUEST_TIMEOUT)
+
+    @staticmethod
+    def add_summary(request, response, context):
+        summary = context.get_summary()
+        if not summary:
+            return
+
+        logger.debug(
+            "%s %s: %s service calls in %.1f ms (%s)",
+            request.method,
+            request.path,
+            sum(method_summary['count'] for method_summary in summary.values()),
+            sum(method_summary['duration'] for method_summary in summary.values()) * 1000,
+            ', '.join(f"{name} x{method_summary['count']}" for name, method_summary in summary.items()),
+        )
+
+        if getattr(settings, 'PARCOURS_DOCTORAL_SERVER_TIMING', settings.DEBUG):
+            response['Server-Timing'] = ', '.join(
+                f'{name};dur={method_summary["duration"] * 1000:.1f};desc="{method_summary["count"]} calls"'
+                for name, method_summary in summary.items()
+            )
@@ -0,0 +1,83 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from asgiref.sync import sync_to_async
+
+from parcours_doctoral.services.doctorate import (
+    DoctorateJuryService,
+    DoctorateService,
+    DoctorateSupervisionService,
+)
+from parcours_doctoral.services.reference import (
+    CountriesService,
+    LanguageService,
+    SuperiorInstituteService,
+)
+from parcours_doctoral.services.training import DoctorateTrainingService
+
+__all__ = [
+    "AsyncService",
+    "AsyncCountriesService",
+    "AsyncDoctorateJuryService",
+    "AsyncDoctorateService",
+    "AsyncDoctorateSupervisionService",
+    "AsyncDoctorateTrainingService",
+    "AsyncLanguageService",
+    "AsyncSuperiorInstituteService",
+]
+
+
+class AsyncService:
+    """
+    Asynchronous variant of a service class, for the asynchronous views.
+
+    Each class method of the service becomes a coroutine function which calls it in a worker thread, so that the event
+    loop is not blocked while waiting for the backend. The calls share the pooled api clients of the synchronous
+    services, as well as the language and the service context of the current request.
+    """
+
+    def __init__(self, service):
+        self.service = service
+
+    def __getattr__(self, name):
+        attribute = getattr(self.service, name)
+        if not callable(attribute):
+            return attribute
+        # The service calls do not access the database so they can run in any thread
+        async_method = sync_to_async(attribute, thread_sensitive=False)
+        setattr(self, name, async_method)
+        return async_method
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.service.__name__})'
+
+
+AsyncDoctorateService = AsyncService(DoctorateService)
+AsyncDoctorateSupervisionService = AsyncService(DoctorateSupervisionService)
+AsyncDoctorateJuryService = AsyncService(DoctorateJuryService)
+AsyncDoctorateTrainingService = AsyncService(DoctorateTrainingService)
+AsyncCountriesService = AsyncService(CountriesService)
+AsyncLanguageService = AsyncService(LanguageService)
+AsyncSuperiorInstituteService = AsyncService(SuperiorInstituteService)
@@ -24,13 +24,15 @@
 #
 # ##############################################################################
 import osis_learning_unit_sdk
+import osis_parcours_doctoral_sdk
 from osis_learning_unit_sdk.api import learning_units_api
-from osis_parcours_doctoral_sdk import ApiClient, ApiException
+from osis_parcours_doctoral_sdk import ApiException
 from osis_parcours_doctoral_sdk.api import autocomplete_api
 
 from frontoffice.settings.osis_sdk import learning_unit as learning_unit_sdk
 from frontoffice.settings.osis_sdk import parcours_doctoral as parcours_doctoral_sdk
 from frontoffice.settings.osis_sdk.utils import build_mandatory_auth_headers
+from parcours_doctoral.services.clients import get_api_client
 from parcours_doctoral.services.mixins import ServiceMeta
 from reference.services.academic_year import AcademicYearService
 
@@ -38,11 +40,12 @@ from reference.services.academic_year import AcademicYearService
 class DoctorateAutocompleteAPIClient:
     def __new__(cls):
         api_config = parcours_doctoral_sdk.build_configuration()
-        return autocomplete_api.AutocompleteApi(ApiClient(configuration=api_config))
+        return autocomplete_api.AutocompleteApi(get_api_client(osis_parcours_doctoral_sdk, api_config))
 
 
 class DoctorateAutocompleteService(metaclass=ServiceMeta):
     api_exception_cls = ApiException
+    bulkhead = 'autocomplete'
 
     @classmethod
     def autocomplete_tutors(cls, person, **kwargs):
@@ -60,10 +63,8 @@ class DoctorateAutocompleteService(metaclass=ServiceMeta):
 
     @classmethod
     def autocomplete_learning_unit_years(cls, search_term, person):
-        configuration = learning_unit_sdk.build_configuration()
-        with osis_learning_unit_sdk.ApiClient(configuration) as api_client:
-            api_instance = learning_units_api.LearningUnitsApi(api_client)
-        return api_instance.learningunits_list(
+        api_client = get_api_client(osis_learning_unit_sdk, learning_unit_sdk.build_configuration())
+        return learning_units_api.LearningUnitsApi(api_client).learningunits_list(
             year=AcademicYearService.get_current_academic_year(person=person).year,
             search_term=search_term,
             **build_mandatory_auth_headers(person),
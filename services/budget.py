@@ -0,0 +1,93 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import logging
+import warnings
+
+from django.conf import settings
+
+__all__ = [
+    "ServiceCallBudgetExceeded",
+    "ServiceCallWarning",
+    "check_service_calls",
+    "get_service_call_problems",
+]
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REPEAT_LIMIT = 5
+
+
+class ServiceCallWarning(UserWarning):
+    """Too many service calls have been made while processing a request."""
+
+
+class ServiceCallBudgetExceeded(Exception):
+    """Too many service calls have been made while processing a request, and the checks are strict."""
+
+
+def get_service_call_problems(context, budget=None, repeat_limit=DEFAULT_REPEAT_LIMIT):
+    """
+    Return the descriptions of the problems of the service calls recorded in the context: more calls than the budget,
+    identical calls made several times, or a service method called more than the repeat limit (N+1 pattern).
+    """
+    problems = []
+
+    if budget is not None and len(context.calls) > budget:
+        problems.append(f'{len(context.calls)} service calls for a budget of {budget}')
+
+    for (name, arguments), count in context.get_repeated_calls().items():
+        problems.append(f'{name} called {count} times with the same arguments {arguments}')
+
+    if repeat_limit is not None:
+        for name, count in context.get_frequent_calls(repeat_limit).items():
+            problems.append(f'{name} called {count} times (N+1 pattern?)')
+
+    return problems
+
+
+def check_service_calls(context, description):
+    """
+    Check the service calls made while processing a request, if PARCOURS_DOCTORAL_SERVICE_CALL_CHECKS is enabled (by
+    default in debug mode), against PARCOURS_DOCTORAL_SERVICE_CALL_BUDGET (no budget by default) and
+    PARCOURS_DOCTORAL_SERVICE_CALL_REPEAT_LIMIT. The problems raise a ServiceCallWarning, or a ServiceCallBudgetExceeded
+    exception if PARCOURS_DOCTORAL_SERVICE_CALL_CHECKS_STRICT is enabled.
+    """
+    if not getattr(settings, 'PARCOURS_DOCTORAL_SERVICE_CALL_CHECKS', settings.DEBUG):
+        return
+
+    problems = get_service_call_problems(
+        context,
+        budget=getattr(settings, 'PARCOURS_DOCTORAL_SERVICE_CALL_BUDGET', None),
+        repeat_limit=getattr(settings, 'PARCOURS_DOCTORAL_SERVICE_CALL_REPEAT_LIMIT', DEFAULT_REPEAT_LIMIT),
+    )
+    if not problems:
+        return
+
+    message = '{}: {}'.format(description, '; '.join(problems))
+    if getattr(settings, 'PARCOURS_DOCTORAL_SERVICE_CALL_CHECKS_STRICT', False):
+        raise ServiceCallBudgetExceeded(message)
+    logger.warning(message)
+    warnings.warn(message, ServiceCallWarning, stacklevel=2)
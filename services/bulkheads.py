@@ -0,0 +1,228 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import contextlib
+import functools
+import logging
+import threading
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+from parcours_doctoral.services.deadline import (
+    ServiceUnavailable,
+    check_deadline,
+    get_remaining_time,
+)
+from parcours_doctoral.services.metrics import BULKHEAD_ACTIVE_CALLS, BULKHEAD_REJECTIONS
+
+__all__ = [
+    "Bulkhead",
+    "BulkheadFull",
+    "BulkheadRegistry",
+    "bulkhead_registry",
+    "get_bulkhead",
+    "isolated",
+]
+
+logger = logging.getLogger(__name__)
+
+# Behaviours of a full bulkhead: the call is rejected with BulkheadFull, or made anyway (the limits being only logged)
+REJECTION_RAISE = 'raise'
+REJECTION_BYPASS = 'bypass'
+REJECTIONS = [REJECTION_RAISE, REJECTION_BYPASS]
+
+# Name of the entry of PARCOURS_DOCTORAL_BULKHEADS which overrides these limits for all the bulkheads
+DEFAULT_BULKHEAD_NAME = 'default'
+
+# Limits of a bulkhead whose limits are not configured in PARCOURS_DOCTORAL_BULKHEADS
+DEFAULT_BULKHEAD_LIMITS = {
+    # Number of concurrent calls of the dependency in the process (0 for no limit)
+    'max_concurrent': 10,
+    # Number of calls which can wait for a free slot, the other ones being rejected immediately
+    'max_queue': 20,
+    # Number of seconds a call can wait for a free slot before being rejected
+    'queue_timeout': 5,
+    # Behaviour when the call cannot get a slot (see REJECTIONS)
+    'rejection': REJECTION_RAISE,
+}
+
+
+class BulkheadFull(ServiceUnavailable):
+    """Too many calls of a dependency are in progress or waiting, so the call is rejected without being made."""
+
+    outcome = 'rejected'
+
+    def __init__(self, name):
+        self.name = name
+        super().__init__(f'Too many concurrent calls of {name}')
+
+
+class Bulkhead:
+    """Bound the number of concurrent calls of a dependency, so that a slow dependency cannot use all the workers."""
+
+    def __init__(self, name, max_concurrent, max_queue, queue_timeout, rejection=REJECTION_RAISE):
+        if rejection not in REJECTIONS:
+            raise ImproperlyConfigured(f"The rejection of the bulkhead {name} must be one of {REJECTIONS}")
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.rejection = rejection
+        self.active = 0
+        self.waiting = 0
+        self._semaphore = threading.BoundedSemaphore(max_concurrent) if max_concurrent else None
+        self._lock = threading.Lock()
+
+    def _reject(self):
+        if self.rejection == REJECTION_BYPASS:
+            logger.warning(
+                'Call of %s made without a slot: %s calls in progress, %s waiting',
+                self.name,
+                self.active,
+                self.waiting,
+            )
+            return False
+        logger.warning('Call of %s rejected: %s calls in progress, %s waiting', self.name, self.active, self.waiting)
+        BULKHEAD_REJECTIONS.labels(self.name).inc()
+        raise BulkheadFull(self.name)
+
+    def _update_active(self, delta):
+        with self._lock:
+            self.active += delta
+            BULKHEAD_ACTIVE_CALLS.labels(self.name).set(self.active)
+
+    def acquire(self):
+        """
+        Wait for a free slot, and return if a slot has been taken (to be released). If the queue is full or if the wait
+        is too long, BulkheadFull is raised, unless the bulkhead lets the call through without a slot. The wait is
+        bounded by the deadline of the current request, DeadlineExceeded being raised when it has passed.
+        """
+        if self._semaphore is None:
+            return False
+        if not self._semaphore.acquire(blocking=False):
+            with self._lock:
+                if self.waiting >= self.max_queue:
+                    return self._reject()
+                self.waiting += 1
+            timeout = self.queue_timeout
+            remaining_time = get_remaining_time()
+            if remaining_time is not None:
+                timeout = max(0, min(timeout, remaining_time))
+            try:
+                acquired = self._semaphore.acquire(timeout=timeout)
+            finally:
+                with self._lock:
+                    self.waiting -= 1
+            if not acquired:
+                check_deadline()
+                return self._reject()
+        self._update_active(1)
+        return True
+
+    def release(self):
+        if self._semaphore is None:
+            return
+        self._update_active(-1)
+        self._semaphore.release()
+
+    @contextlib.contextmanager
+    def slot(self):
+        acquired = self.acquire()
+        try:
+            yield
+        finally:
+            if acquired:
+                self.release()
+
+
+class BulkheadRegistry:
+    """
+    Process-wide registry of the bulkheads, whose limits and rejection behaviour are read from
+    PARCOURS_DOCTORAL_BULKHEADS on first use: the entry of the bulkhead overrides the 'default' entry, which overrides
+    DEFAULT_BULKHEAD_LIMITS.
+    """
+
+    def __init__(self):
+        self._bulkheads = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_limits(name):
+        configured_limits = getattr(settings, 'PARCOURS_DOCTORAL_BULKHEADS', {})
+        return {
+            **DEFAULT_BULKHEAD_LIMITS,
+            **configured_limits.get(DEFAULT_BULKHEAD_NAME, {}),
+            **configured_limits.get(name, {}),
+        }
+
+    def get_bulkhead(self, name) -> Bulkhead:
+        bulkhead = self._bulkheads.get(name)
+        if bulkhead is None:
+            with self._lock:
+                bulkhead = self._bulkheads.get(name)
+                if bulkhead is None:
+                    bulkhead = self._bulkheads[name] = Bulkhead(name, **self.get_limits(name))
+        return bulkhead
+
+    def clear(self):
+        with self._lock:
+            self._bulkheads = {}
+
+
+bulkhead_registry = BulkheadRegistry()
+
+# Names of the bulkheads whose slots are held by the current thread
+_held_bulkheads = threading.local()
+
+
+def get_bulkhead(name) -> Bulkhead:
+    """Return the bulkhead of the dependency."""
+    return bulkhead_registry.get_bulkhead(name)
+
+
+def isolated(func, name):
+    """
+    Make the calls of the decorated service method within the bulkhead of its dependency.
+
+    A service method called by another one of the same dependency uses the slot of the calling method, so that the
+    nested calls cannot wait for each other.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        held = getattr(_held_bulkheads, 'names', None)
+        if held is None:
+            held = _held_bulkheads.names = set()
+        if name in held:
+            return func(*args, **kwargs)
+        with get_bulkhead(name).slot():
+            held.add(name)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                held.discard(name)
+
+    return wrapper
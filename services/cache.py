@@ -0,0 +1,334 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.translation import get_language
+
+__all__ = [
+    "DoctorateDataCache",
+    "ReferenceDataCache",
+]
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 60 * 60
+DEFAULT_MAX_LOCAL_ENTRIES = 2000
+LOAD_LOCK_TIMEOUT = 10
+LOAD_WAIT_INTERVAL = 0.05
+DEFAULT_DOCTORATE_TIMEOUT = 30
+DEFAULT_MAX_DOCTORATE_ENTRIES = 1000
+DOCTORATE_VERSION_TIMEOUT = 24 * 60 * 60
+
+_MISSING = object()
+
+
+class ReferenceDataCache:
+    """
+    Cache of data that do not depend on the connected user (countries, languages, institutes...).
+
+    The entries are stored per language (unless they are not localized), in a bounded in-memory LRU and in the Django
+    cache so that they are shared by all the processes, and expire after PARCOURS_DOCTORAL_REFERENCE_CACHE_TIMEOUT
+    seconds (0 disables the cache). The values which cannot be safely pickled in the Django cache (such as the SDK
+    models, which could not be read by processes using another version of the SDK) are stored there as plain data,
+    converted by the dump and load functions.
+    The concurrent loads of the same missing entry are merged so that a single call reaches the backend.
+    """
+
+    def __init__(self, namespace, default_timeout=DEFAULT_TIMEOUT, localized=True, dump=None, load=None):
+        self.namespace = namespace
+        self.default_timeout = default_timeout
+        self.localized = localized
+        self.dump = dump
+        self.load = load
+        self._local_entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._load_locks = {}
+
+    @property
+    def timeout(self):
+        return getattr(settings, 'PARCOURS_DOCTORAL_REFERENCE_CACHE_TIMEOUT', self.default_timeout)
+
+    @property
+    def max_local_entries(self):
+        return getattr(settings, 'PARCOURS_DOCTORAL_REFERENCE_CACHE_MAX_ENTRIES', DEFAULT_MAX_LOCAL_ENTRIES)
+
+    def make_key(self, key, language=None):
+        if not self.localized:
+            return f'parcours_doctoral:{self.namespace}:{key}'
+        return 'parcours_doctoral:{namespace}:{language}:{key}'.format(
+            namespace=self.namespace,
+            language=language or get_language(),
+            key=key,
+        )
+
+    def _get_local(self, full_key):
+        with self._lock:
+            entry = self._local_entries.get(full_key)
+            if entry is None:
+                return _MISSING
+            expiry, value = entry
+            if expiry < time.monotonic():
+                del self._local_entries[full_key]
+                return _MISSING
+            self._local_entries.move_to_end(full_key)
+            return value
+
+    def _set_local(self, full_key, value, timeout):
+        with self._lock:
+            self._local_entries[full_key] = (time.monotonic() + timeout, value)
+            self._local_entries.move_to_end(full_key)
+            while len(self._local_entries) > self.max_local_entries:
+                self._local_entries.popitem(last=False)
+
+    def _load_shared(self, full_key, data):
+        if self.load is None or data is _MISSING:
+            return data
+        try:
+            return self.load(data)
+        except Exception:
+            logger.exception("Unable to read the entry '%s' from the cache", full_key)
+            return _MISSING
+
+    def _get_shared(self, full_key):
+        try:
+            data = cache.get(full_key, _MISSING)
+        except Exception:
+            logger.exception("Unable to read the entry '%s' from the cache", full_key)
+            return _MISSING
+        return self._load_shared(full_key, data)
+
+    def _set_shared(self, full_key, value, timeout):
+        try:
+            cache.set(full_key, self.dump(value) if self.dump else value, timeout)
+        except Exception:
+            logger.exception("Unable to write the entry '%s' in the cache", full_key)
+
+    def get(self, key, default=None, language=None):
+        """Return the cached value of the key or the default value."""
+        full_key = self.make_key(key, language)
+        value = self._get_local(full_key)
+        if value is _MISSING:
+            value = self._get_shared(full_key)
+            if value is _MISSING:
+                return default
+            self._set_local(full_key, value, self.timeout)
+        return value
+
+    def get_many(self, keys, language=None):
+        """Return the cached values of the keys which are in the cache, by key."""
+        keys_by_full_key = {self.make_key(key, language): key for key in keys}
+        values = {}
+        missing_full_keys = []
+        for full_key, key in keys_by_full_key.items():
+            value = self._get_local(full_key)
+            if value is _MISSING:
+                missing_full_keys.append(full_key)
+            else:
+                values[key] = value
+        if missing_full_keys:
+            try:
+                shared_values = cache.get_many(missing_full_keys)
+            except Exception:
+                logger.exception("Unable to read the entries from the cache")
+                shared_values = {}
+            for full_key, data in shared_values.items():
+                value = self._load_shared(full_key, data)
+                if value is _MISSING:
+                    continue
+                self._set_local(full_key, value, self.timeout)
+                values[keys_by_full_key[full_key]] = value
+        return values
+
+    def set(self, key, value, language=None):
+        timeout = self.timeout
+        if not timeout:
+            return
+        full_key = self.make_key(key, language)
+        self._set_local(full_key, value, timeout)
+        self._set_shared(full_key, value, timeout)
+
+    def set_many(self, values, language=None):
+        timeout = self.timeout
+        if not timeout:
+            return
+        full_values = {self.make_key(key, language): value for key, value in values.items()}
+        for full_key, value in full_values.items():
+            self._set_local(full_key, value, timeout)
+        try:
+            if self.dump:
+                full_values = {full_key: self.dump(value) for full_key, value in full_values.items()}
+            cache.set_many(full_values, timeout)
+        except Exception:
+            logger.exception("Unable to write the entries in the cache")
+
+    def delete(self, key, language=None):
+        full_key = self.make_key(key, language)
+        with self._lock:
+            self._local_entries.pop(full_key, None)
+        cache.delete(full_key)
+
+    def clear_local(self):
+        with self._lock:
+            self._local_entries.clear()
+
+    @contextmanager
+    def _single_flight(self, full_key):
+        """Serialize the loads of the same entry, in this process and, when possible, between processes."""
+        with self._lock:
+            lock_entry = self._load_locks.setdefault(full_key, [threading.Lock(), 0])
+            lock_entry[1] += 1
+        try:
+            with lock_entry[0]:
+                shared_lock_key = f'{full_key}:lock'
+                try:
+                    has_shared_lock = cache.add(shared_lock_key, True, LOAD_LOCK_TIMEOUT)
+                except Exception:
+                    has_shared_lock = True
+                if not has_shared_lock:
+                    # Another process is loading the entry: wait for it a moment
+                    deadline = time.monotonic() + LOAD_LOCK_TIMEOUT
+                    while time.monotonic() < deadline and self._get_shared(full_key) is _MISSING:
+                        time.sleep(LOAD_WAIT_INTERVAL)
+                try:
+                    yield
+                finally:
+                    if has_shared_lock:
+                        cache.delete(shared_lock_key)
+        finally:
+            with self._lock:
+                lock_entry[1] -= 1
+                if not lock_entry[1]:
+                    del self._load_locks[full_key]
+
+    def get_or_load(self, key, loader):
+        """Return the cached value of the key, or load, cache and return it."""
+        if not self.timeout:
+            return loader()
+
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        with self._single_flight(self.make_key(key)):
+            value = self.get(key, _MISSING)
+            if value is _MISSING:
+                value = loader()
+                self.set(key, value)
+        return value
+
+
+class DoctorateDataCache:
+    """
+    Cache of the data of the doctorates loaded by each user, kept in memory between the requests.
+
+    The entries expire after PARCOURS_DOCTORAL_DOCTORATE_CACHE_TIMEOUT seconds (0 disables the cache) and are only used
+    while the version of their doctorate is unchanged. This version is stored in the Django cache and changed by every
+    write on the doctorate made through the services (see ServiceMeta), whatever the process or the user.
+    """
+
+    def __init__(self, namespace, default_timeout=DEFAULT_DOCTORATE_TIMEOUT):
+        self.namespace = namespace
+        self.default_timeout = default_timeout
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def timeout(self):
+        return getattr(settings, 'PARCOURS_DOCTORAL_DOCTORATE_CACHE_TIMEOUT', self.default_timeout)
+
+    @property
+    def max_entries(self):
+        return getattr(settings, 'PARCOURS_DOCTORAL_DOCTORATE_CACHE_MAX_ENTRIES', DEFAULT_MAX_DOCTORATE_ENTRIES)
+
+    @staticmethod
+    def make_version_key(doctorate_uuid):
+        return f'parcours_doctoral:doctorate_version:{doctorate_uuid}'
+
+    @classmethod
+    def get_version(cls, doctorate_uuid):
+        """Return the current version of the doctorate, or None if it cannot be read."""
+        version_key = cls.make_version_key(doctorate_uuid)
+        try:
+            version = cache.get(version_key)
+            if version is None:
+                # A forgotten version is replaced by a new one, so that no entry is used anymore
+                cache.add(version_key, uuid.uuid4().hex, DOCTORATE_VERSION_TIMEOUT)
+                version = cache.get(version_key)
+        except Exception:
+            logger.exception("Unable to read the version of the doctorate '%s' from the cache", doctorate_uuid)
+            return None
+        return version
+
+    @classmethod
+    def invalidate(cls, doctorate_uuid):
+        """Change the version of the doctorate so that its cached data are loaded again."""
+        if not getattr(settings, 'PARCOURS_DOCTORAL_DOCTORATE_CACHE_TIMEOUT', DEFAULT_DOCTORATE_TIMEOUT):
+            return
+        try:
+            cache.set(cls.make_version_key(doctorate_uuid), uuid.uuid4().hex, DOCTORATE_VERSION_TIMEOUT)
+        except Exception:
+            logger.exception("Unable to change the version of the doctorate '%s' in the cache", doctorate_uuid)
+
+    def get_or_load(self, key, doctorate_uuid, loader):
+        """Return the cached value of the key if the doctorate has not changed since, or load, cache and return it."""
+        timeout = self.timeout
+        if not timeout:
+            return loader()
+
+        # The version is read before loading so that a concurrent write makes the loaded value outdated
+        version = self.get_version(doctorate_uuid)
+        if version is None:
+            return loader()
+
+        full_key = (key, get_language())
+        with self._lock:
+            entry = self._entries.get(full_key)
+            if entry is not None:
+                expiry, entry_version, value = entry
+                if expiry >= time.monotonic() and entry_version == version:
+                    self._entries.move_to_end(full_key)
+                    return value
+                del self._entries[full_key]
+
+        value = loader()
+
+        with self._lock:
+            self._entries[full_key] = (time.monotonic() + timeout, version, value)
+            self._entries.move_to_end(full_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,169 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+
+import functools
+import socket
+import threading
+
+from django.conf import settings
+from urllib3.connection import HTTPConnection
+
+from parcours_doctoral.services.deadline import (
+    DeadlineExceeded,
+    get_remaining_time,
+    get_request_timeout,
+)
+from parcours_doctoral.services.metrics import record_response
+
+__all__ = [
+    "ApiClientRegistry",
+    "api_client_registry",
+    "get_api_client",
+]
+
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_KEEPALIVE_IDLE = 60
+
+
+class ApiClientRegistry:
+    """
+    Process-wide registry of long-lived SDK api clients, keyed by SDK and configuration.
+
+    Each api client owns a urllib3 pool manager, which is thread-safe, so that a single instance can be shared by all
+    the threads of the process and the connections to the backends are kept alive between calls.
+    """
+
+    def __init__(self):
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_client_key(sdk, configuration):
+        return (
+            sdk.__name__,
+            configuration.host,
+            tuple(sorted(configuration.api_key.items())),
+            tuple(sorted(configuration.api_key_prefix.items())),
+            configuration.username,
+            configuration.password,
+        )
+
+    @staticmethod
+    def configure_pool(configuration):
+        """Apply the pool size and the keep-alive options to a configuration before the client is built."""
+        configuration.connection_pool_maxsize = getattr(
+            settings,
+            'PARCOURS_DOCTORAL_SDK_POOL_MAXSIZE',
+            DEFAULT_POOL_MAXSIZE,
+        )
+        keepalive_idle = getattr(settings, 'PARCOURS_DOCTORAL_SDK_KEEPALIVE_IDLE', DEFAULT_KEEPALIVE_IDLE)
+        if keepalive_idle:
+            socket_options = HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+            if hasattr(socket, 'TCP_KEEPIDLE'):
+                socket_options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, keepalive_idle))
+            configuration.socket_options = socket_options
+        return configuration
+
+    @staticmethod
+    def instrument_client(client):
+        """
+        Report the status and the size of the backend responses to the service call being measured, and bound the
+        timeout of the requests by the deadline of the current request (see parcours_doctoral.services.deadline).
+        """
+        rest_client = client.rest_client
+        request = rest_client.request
+
+        @functools.wraps(request)
+        def instrumented_request(*args, **kwargs):
+            kwargs['_request_timeout'] = get_request_timeout(kwargs.get('_request_timeout'))
+            try:
+                response = request(*args, **kwargs)
+            except Exception as exception:
+                record_response(getattr(exception, 'status', None), len(getattr(exception, 'body', None) or b''))
+                remaining_time = get_remaining_time()
+                if remaining_time is not None and remaining_time <= 0:
+                    # The request has been interrupted by the bounded timeout
+                    raise DeadlineExceeded from exception
+                raise
+            # The body of a response which is not preloaded is not read here
+            preloaded = kwargs.get('_preload_content', True)
+            record_response(response.status, len(response.data or b'') if preloaded else 0)
+            return response
+
+        rest_client.request = instrumented_request
+
+    def get_client(self, sdk, configuration):
+        """Return the shared api client of the SDK module for this configuration, building it on first use."""
+        key = self.get_client_key(sdk, configuration)
+        client = self._clients.get(key)
+        if client is None:
+            with self._lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = sdk.ApiClient(configuration=self.configure_pool(configuration))
+                    self.instrument_client(client)
+                    self._clients[key] = client
+        return client
+
+    def get_statistics(self):
+        """Return the usage of the connection pools of every registered client, to help sizing them."""
+        statistics = []
+        for (sdk_name, host, *_), client in list(self._clients.items()):
+            pool_manager = client.rest_client.pool_manager
+            pools = []
+            for pool_key in list(pool_manager.pools.keys()):
+                pool = pool_manager.pools.get(pool_key)
+                if pool is None:
+                    continue
+                pools.append(
+                    {
+                        'scheme': pool.scheme,
+                        'host': pool.host,
+                        'port': pool.port,
+                        'maxsize': pool.pool.maxsize if pool.pool else 0,
+                        # The queue of the pool is filled with None up to its size, for the connections to open
+                        'idle_connections': sum(conn is not None for conn in list(pool.pool.queue)) if pool.pool else 0,
+                        'opened_connections': pool.num_connections,
+                        'requests': pool.num_requests,
+                    }
+                )
+            statistics.append({'sdk': sdk_name, 'host': host, 'pools': pools})
+        return statistics
+
+    def clear(self):
+        """Close and forget all the registered clients."""
+        with self._lock:
+            clients, self._clients = self._clients, {}
+        for client in clients.values():
+            client.rest_client.pool_manager.clear()
+
+
+api_client_registry = ApiClientRegistry()
+
+
+def get_api_client(sdk, configuration):
+    """Return the shared api client of the SDK module for this configuration."""
+    return api_client_registry.get_client(sdk, configuration)
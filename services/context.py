@@ -0,0 +1,129 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+
+import contextvars
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+__all__ = [
+    "ServiceRequestContext",
+    "get_service_context",
+    "service_request_context",
+]
+
+_current_context = contextvars.ContextVar('parcours_doctoral_service_context', default=None)
+
+
+class ServiceRequestContext:
+    """State shared by all the service calls made while processing a single HTTP request."""
+
+    def __init__(self, timeout=None):
+        self.lock = threading.RLock()
+        # Time (see time.monotonic) after which the backends must not be called anymore during the request
+        self.deadline = time.monotonic() + timeout if timeout else None
+        self._results = {}
+        self._keys_by_doctorate = {}
+        self.calls = []
+
+    def get_remaining_time(self):
+        """Return the number of seconds left before the deadline of the request, or None if there is no deadline."""
+        if self.deadline is None:
+            return None
+        return self.deadline - time.monotonic()
+
+    def get_result(self, key):
+        """Return a tuple (found, result) for the specified call key."""
+        with self.lock:
+            if key in self._results:
+                return True, self._results[key]
+            return False, None
+
+    def store_result(self, key, result, doctorate_uuid=None):
+        with self.lock:
+            self._results[key] = result
+            if doctorate_uuid:
+                self._keys_by_doctorate.setdefault(str(doctorate_uuid), set()).add(key)
+
+    def record_call(self, call):
+        """Add a measured service call (see parcours_doctoral.services.metrics) to the calls of the request."""
+        with self.lock:
+            self.calls.append(call)
+
+    def get_summary(self):
+        """Return the number and the total duration of the service calls, by service method."""
+        summary = {}
+        with self.lock:
+            calls = list(self.calls)
+        for call in calls:
+            method_summary = summary.setdefault(call.name, {'count': 0, 'duration': 0, 'response_size': 0})
+            method_summary['count'] += 1
+            method_summary['duration'] += call.duration
+            method_summary['response_size'] += call.response_size
+        return summary
+
+    def get_repeated_calls(self):
+        """Return the number of calls of the service methods called several times with the same arguments."""
+        with self.lock:
+            counts = Counter((call.name, call.arguments) for call in self.calls)
+        return {call: count for call, count in counts.items() if count > 1}
+
+    def get_frequent_calls(self, limit):
+        """Return the number of calls of the service methods called more than the limit, whatever their arguments."""
+        with self.lock:
+            counts = Counter(call.name for call in self.calls)
+        return {name: count for name, count in counts.items() if count > limit}
+
+    def invalidate(self, doctorate_uuid):
+        """Forget the results of the calls related to the specified doctorate."""
+        with self.lock:
+            for key in self._keys_by_doctorate.pop(str(doctorate_uuid), set()):
+                self._results.pop(key, None)
+
+
+def get_service_context():
+    """Return the context of the request being processed, if any."""
+    return _current_context.get()
+
+
+@contextmanager
+def service_request_context(timeout=None):
+    """
+    Open a service context for the duration of the block, or reuse the enclosing one. The backend calls of a new
+    context must be made within the timeout, if any.
+    """
+    context = _current_context.get()
+    if context is not None:
+        yield context
+        return
+
+    context = ServiceRequestContext(timeout=timeout)
+    token = _current_context.set(context)
+    try:
+        yield context
+    finally:
+        _current_context.reset(token)
@@ -0,0 +1,154 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import logging
+import time
+import uuid
+
+from django.conf import settings
+from django.contrib.auth.signals import user_logged_out
+from django.core.cache import cache
+from django.dispatch import receiver
+
+from base.models.person import Person
+from parcours_doctoral.services.cache import ReferenceDataCache
+from parcours_doctoral.services.jobs import enqueue
+
+__all__ = [
+    "dashboard_links_cache",
+    "get_dashboard_links",
+    "get_dashboard_links_version",
+    "invalidate_dashboard_links",
+    "refresh_dashboard_links",
+]
+
+DEFAULT_DASHBOARD_LINKS_TIMEOUT = 60 * 60
+DEFAULT_DASHBOARD_LINKS_REFRESH_DELAY = 5 * 60
+# Number of seconds during which the version of the links of a user, changed on logout, is kept
+DASHBOARD_LINKS_VERSION_TIMEOUT = 24 * 60 * 60
+
+logger = logging.getLogger(__name__)
+
+
+class DashboardLinksCache(ReferenceDataCache):
+    """
+    Cache of the dashboard links of the users, which expire after PARCOURS_DOCTORAL_DASHBOARD_LINKS_CACHE_TIMEOUT
+    seconds (0 disables the cache) and are refreshed in background once they are older than
+    PARCOURS_DOCTORAL_DASHBOARD_LINKS_REFRESH_DELAY seconds.
+
+    The links are only kept in the Django cache, so that they are forgotten by all the processes on logout. The links
+    loaded before a logout, for instance by a background refresh, are not cached (see get_dashboard_links_version).
+    """
+
+    # No entry is kept in the memory of the process, where it would not be deleted on a logout handled by another one
+    max_local_entries = 0
+
+    @property
+    def timeout(self):
+        return getattr(settings, 'PARCOURS_DOCTORAL_DASHBOARD_LINKS_CACHE_TIMEOUT', self.default_timeout)
+
+    @property
+    def refresh_delay(self):
+        return getattr(
+            settings,
+            'PARCOURS_DOCTORAL_DASHBOARD_LINKS_REFRESH_DELAY',
+            DEFAULT_DASHBOARD_LINKS_REFRESH_DELAY,
+        )
+
+
+dashboard_links_cache = DashboardLinksCache(
+    'dashboard_links',
+    default_timeout=DEFAULT_DASHBOARD_LINKS_TIMEOUT,
+    localized=False,
+)
+
+
+def make_version_key(user_id):
+    return f'parcours_doctoral:dashboard_links_version:{user_id}'
+
+
+def get_dashboard_links_version(user_id):
+    """Return the version of the dashboard links of the user, which is changed when the user logs out."""
+    try:
+        return cache.get(make_version_key(user_id), '')
+    except Exception:
+        logger.exception("Unable to read the version of the dashboard links of the user '%s'", user_id)
+        return None
+
+
+def load_dashboard_links(person, version=None):
+    """
+    Request the dashboard links of the person to the backend and cache them, unless the user has logged out since the
+    specified version of the links (by default, the current one) has been read.
+    """
+    from parcours_doctoral.services.doctorate import DoctorateService
+
+    if version is None:
+        version = get_dashboard_links_version(person.user_id)
+    links = DoctorateService.get_dashboard_links(person)
+    if version is not None and get_dashboard_links_version(person.user_id) == version:
+        dashboard_links_cache.set(person.user_id, {'links': links, 'loaded_at': time.time()})
+    return links
+
+
+def refresh_dashboard_links(person_id, version):
+    """Refresh the cached dashboard links of the person, if the user has not logged out since the refresh request."""
+    load_dashboard_links(Person.objects.select_related('user').get(pk=person_id), version=version)
+
+
+def get_dashboard_links(person):
+    """
+    Return the dashboard links of the person. The cached links are returned immediately, and refreshed in background
+    if they are too old, so that the backend is only called synchronously when the links are not cached.
+    """
+    if not dashboard_links_cache.timeout:
+        return load_dashboard_links(person)
+
+    entry = dashboard_links_cache.get(person.user_id)
+    if entry is None:
+        return load_dashboard_links(person)
+
+    if time.time() - entry['loaded_at'] >= dashboard_links_cache.refresh_delay:
+        enqueue(
+            'parcours_doctoral.services.dashboard.refresh_dashboard_links',
+            person_id=person.pk,
+            version=get_dashboard_links_version(person.user_id),
+        )
+    return entry['links']
+
+
+def invalidate_dashboard_links(user_id):
+    """Forget the cached dashboard links of the user, and the links being loaded."""
+    try:
+        cache.set(make_version_key(user_id), uuid.uuid4().hex, DASHBOARD_LINKS_VERSION_TIMEOUT)
+    except Exception:
+        logger.exception("Unable to change the version of the dashboard links of the user '%s'", user_id)
+    dashboard_links_cache.delete(user_id)
+
+
+@receiver(user_logged_out)
+def invalidate_dashboard_links_on_logout(sender, user, **kwargs):
+    if user is not None:
+        invalidate_dashboard_links(user.pk)
@@ -0,0 +1,111 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import functools
+
+from parcours_doctoral.services.context import get_service_context
+
+__all__ = [
+    "DeadlineExceeded",
+    "ServiceUnavailable",
+    "check_deadline",
+    "get_remaining_time",
+    "get_request_timeout",
+    "optional_lookup",
+    "within_deadline",
+]
+
+
+class ServiceUnavailable(Exception):
+    """The backend has not been called, as it is unavailable or as there is no time left to call it."""
+
+
+class DeadlineExceeded(ServiceUnavailable):
+    """The time budget of the request has been spent, so the backends are not called anymore."""
+
+    outcome = 'deadline_exceeded'
+
+
+def get_remaining_time():
+    """Return the number of seconds left before the deadline of the current request, or None if there is none."""
+    context = get_service_context()
+    if context is None:
+        return None
+    return context.get_remaining_time()
+
+
+def check_deadline():
+    """Raise DeadlineExceeded if the deadline of the current request has passed."""
+    remaining_time = get_remaining_time()
+    if remaining_time is not None and remaining_time <= 0:
+        raise DeadlineExceeded
+
+
+def get_request_timeout(request_timeout=None):
+    """
+    Return the timeout of a backend request, as expected by the SDK api clients (a total or a (connect, read) tuple),
+    bounded by the time left before the deadline of the current request.
+    """
+    remaining_time = get_remaining_time()
+    if remaining_time is None:
+        return request_timeout
+    if remaining_time <= 0:
+        raise DeadlineExceeded
+    if request_timeout is None:
+        return remaining_time
+    if isinstance(request_timeout, tuple):
+        return tuple(min(timeout, remaining_time) for timeout in request_timeout)
+    return min(request_timeout, remaining_time)
+
+
+def within_deadline(func):
+    """Fail fast with DeadlineExceeded instead of calling the decorated service method once the deadline has passed."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        check_deadline()
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+def optional_lookup(fallback):
+    """
+    Return a fallback value instead of failing when the decorated lookup cannot be made, because the deadline of the
+    request has passed or because the dependency is unavailable (see ServiceUnavailable). If the fallback is callable,
+    it is called with the arguments of the lookup.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except ServiceUnavailable:
+                return fallback(*args, **kwargs) if callable(fallback) else fallback
+
+        return wrapper
+
+    return decorator
@@ -102,7 +102,13 @@ from osis_parcours_doctoral_sdk.model.update_authorization_distribution import (
 from base.models.person import Person
 from frontoffice.settings.osis_sdk import parcours_doctoral as parcours_doctoral_sdk
 from frontoffice.settings.osis_sdk.utils import build_mandatory_auth_headers
-from parcours_doctoral.services.mixins import ServiceMeta
+from parcours_doctoral.services.cache import DoctorateDataCache
+from parcours_doctoral.services.clients import get_api_client
+from parcours_doctoral.services.mixins import (
+    ServiceMeta,
+    not_retried,
+    request_cached,
+)
 
 __all__ = [
     "DoctorateService",
@@ -112,17 +118,21 @@ __all__ = [
     "AuthorizationDistributionBusinessException",
 ]
 
+doctorate_cache = DoctorateDataCache('doctorate')
+
 
 class DoctorateAPIClient:
     def __new__(cls, api_config=None):
         api_config = api_config or parcours_doctoral_sdk.build_configuration()
-        return doctorate_api.DoctorateApi(osis_parcours_doctoral_sdk.ApiClient(configuration=api_config))
+        return doctorate_api.DoctorateApi(get_api_client(osis_parcours_doctoral_sdk, api_config))
 
 
 class DoctorateService(metaclass=ServiceMeta):
     api_exception_cls = ApiException
+    bulkhead = 'doctorate'
 
     @classmethod
+    @request_cached
     def get_dashboard_links(cls, person: Person):
         return (
             DoctorateAPIClient()
@@ -134,12 +144,14 @@ class DoctorateService(metaclass=ServiceMeta):
         )
 
     @classmethod
+    @request_cached
     def get_doctorates(cls, person: Person):
         return DoctorateAPIClient().list_doctorates(
             **build_mandatory_auth_headers(person),
         )
 
     @classmethod
+    @request_cached
     def get_supervised_doctorates(cls, person: Person):
         return DoctorateAPIClient().list_supervised_doctorates(
             **build_mandatory_auth_headers(person),
@@ -162,6 +174,7 @@ class DoctorateService(metaclass=ServiceMeta):
         )
 
     @classmethod
+    @request_cached
     def get_supervision(cls, person, uuid_doctorate) -> SupervisionDTO:
         return DoctorateAPIClient().retrieve_supervision(
             uuid=uuid_doctorate,
@@ -169,6 +182,8 @@ class DoctorateService(metaclass=ServiceMeta):
         )
 
     @classmethod
+    @request_cached
+    @not_retried
     def get_supervision_canvas(cls, person, uuid_doctorate) -> SupervisionCanvas:
         return DoctorateAPIClient().retrieve_supervision_canvas(
             uuid=uuid_doctorate,
@@ -176,6 +191,8 @@ class DoctorateService(metaclass=ServiceMeta):
         )
 
     @classmethod
+    @request_cached
+    @not_retried
     def get_training_recap_pdf(cls, person, uuid_doctorate, status) -> SupervisionCanvas:
         return DoctorateAPIClient().training_recap_pdf(
             uuid=uuid_doctorate,
@@ -184,13 +201,19 @@ class DoctorateService(metaclass=ServiceMeta):
         )
 
     @classmethod
+    @request_cached
     def get_doctorate(cls, person, uuid) -> ParcoursDoctoralDTO:
-        return DoctorateAPIClient().doctorate_retrieve(
-            uuid=uuid,
-            **build_mandatory_auth_headers(person),
+        return doctorate_cache.get_or_load(
+            key=(person.pk, str(uuid)),
+            doctorate_uuid=uuid,
+            loader=lambda: DoctorateAPIClient().doctorate_retrieve(
+                uuid=uuid,
+                **build_mandatory_auth_headers(person),
+            ),
         )
 
     @classmethod
+    @request_cached
     def get_confirmation_papers(cls, person, uuid) -> List[ConfirmationPaperDTO]:
         return DoctorateAPIClient().retrieve_confirmation_papers(
             uuid=uuid,
@@ -198,6 +221,7 @@ class DoctorateService(metaclass=ServiceMeta):
         )
 
     @classmethod
+    @request_cached
     def get_last_confirmation_paper(cls, person, uuid) -> ConfirmationPaperDTO:
         return DoctorateAPIClient().retrieve_last_confirmation_paper(
             uuid=uuid,
@@ -205,6 +229,8 @@ class DoctorateService(metaclass=ServiceMeta):
         )
 
     @classmethod
+    @request_cached
+    @not_retried
     def get_last_confirmation_paper_canvas(cls, person, uuid) -> ConfirmationPaperCanvas:
         return DoctorateAPIClient().retrieve_last_confirmation_paper_canvas(
             uuid=uuid,
@@ -236,6 +262,7 @@ class DoctorateService(metaclass=ServiceMeta):
         )
 
     @classmethod
+    @request_cached
     def get_admissibilities(cls, person, doctorate_uuid) -> List[AdmissibilityDTO]:
         return DoctorateAPIClient().retrieve_admissibilities(
             uuid=doctorate_uuid,
@@ -259,6 +286,8 @@ class DoctorateService(metaclass=ServiceMeta):
         )
 
     @classmethod
+    @request_cached
+    @not_retried
     def get_admissibility_minutes_canvas(cls, person, doctorate_uuid) -> AdmissibilityMinutesCanvas:
         return DoctorateAPIClient().retrieve_admissibility_minutes_canvas(
             uuid=doctorate_uuid,
@@ -292,6 +321,7 @@ class DoctorateService(metaclass=ServiceMeta):
         )
 
     @classmethod
+    @request_cached
     def get_private_defenses(cls, person, doctorate_uuid) -> List[PrivateDefenseDTO]:
         return DoctorateAPIClient().retrieve_private_defenses(
             uuid=doctorate_uuid,
@@ -299,6 +329,7 @@ class DoctorateService(metaclass=ServiceMeta):
         )
 
     @classmethod
+    @request_cached
     def get_private_defense(cls, person, doctorate_uuid, private_defense_uuid) -> PrivateDefenseDTO:
         return DoctorateAPIClient().retrieve_private_defense(
             uuid=doctorate_uuid,
@@ -315,6 +346,8 @@ class DoctorateService(metaclass=ServiceMeta):
         )
 
     @classmethod
+    @request_cached
+    @not_retried
     def get_private_defense_minutes_canvas(cls, person, uuid) -> PrivateDefenseMinutesCanvas:
         return DoctorateAPIClient().retrieve_private_defense_minutes_canvas(
             uuid=uuid,
@@ -333,6 +366,7 @@ class DoctorateService(metaclass=ServiceMeta):
         )
 
     @classmethod
+    @request_cached
     def get_authorization_distribution(cls, person, uuid) -> AuthorizationDistributionDTO:
         return DoctorateAPIClient().retrieve_authorization_distribution(
             uuid=uuid,
@@ -380,6 +414,8 @@ class DoctorateService(metaclass=ServiceMeta):
         )
 
     @classmethod
+    @request_cached
+    @not_retried
     def get_public_defense_minutes_canvas(cls, person, uuid) -> PublicDefenseMinutesCanvas:
         return DoctorateAPIClient().retrieve_public_defense_minutes_canvas(
             uuid=uuid,
@@ -397,6 +433,7 @@ class DoctorateService(metaclass=ServiceMeta):
 
 class ExternalDoctorateService(metaclass=ServiceMeta):
     api_exception_cls = ApiException
+    bulkhead = 'doctorate'
 
     @classmethod
     def build_config(cls):
@@ -413,6 +450,7 @@ class ExternalDoctorateService(metaclass=ServiceMeta):
         }
 
     @classmethod
+    @request_cached
     def get_supervision(cls, uuid, token):
         api_client = DoctorateAPIClient(api_config=cls.build_config())
         return api_client.retrieve_external_doctorate_supervision(
@@ -424,6 +462,7 @@ class ExternalDoctorateService(metaclass=ServiceMeta):
 
 class DoctorateSupervisionService(metaclass=ServiceMeta):
     api_exception_cls = ApiException
+    bulkhead = 'doctorate'
 
     @classmethod
     def build_config(cls):
@@ -440,10 +479,12 @@ class DoctorateSupervisionService(metaclass=ServiceMeta):
         }
 
     @classmethod
+    @request_cached
     def get_supervision(cls, person, uuid) -> SupervisionDTO:
         return DoctorateAPIClient().retrieve_supervision(uuid=uuid, **build_mandatory_auth_headers(person))
 
     @classmethod
+    @request_cached
     def get_external_supervision(cls, uuid, token):
         return DoctorateAPIClient(api_config=cls.build_config()).get_external_proposition(
             uuid=uuid,
@@ -452,6 +493,7 @@ class DoctorateSupervisionService(metaclass=ServiceMeta):
         )
 
     @classmethod
+    @request_cached
     def get_signature_conditions(cls, person, uuid) -> SupervisionDTO:
         return DoctorateAPIClient().retrieve_verify_project(
             uuid=uuid,
@@ -543,6 +585,7 @@ class DoctorateSupervisionService(metaclass=ServiceMeta):
 
 class DoctorateJuryService(metaclass=ServiceMeta):
     api_exception_cls = ApiException
+    bulkhead = 'doctorate'
 
     @classmethod
     def build_config(cls):
@@ -559,6 +602,7 @@ class DoctorateJuryService(metaclass=ServiceMeta):
         }
 
     @classmethod
+    @request_cached
     def retrieve_jury(cls, person, uuid, **kwargs) -> JuryDTO:
         return DoctorateAPIClient().retrieve_jury_preparation(
             uuid=uuid,
@@ -574,6 +618,7 @@ class DoctorateJuryService(metaclass=ServiceMeta):
         )
 
     @classmethod
+    @request_cached
     def list_jury_members(cls, person, uuid, **kwargs) -> List[MembreJuryIdentityDTO]:
         return DoctorateAPIClient().list_jury_members(
             uuid=uuid,
@@ -589,6 +634,7 @@ class DoctorateJuryService(metaclass=ServiceMeta):
         )
 
     @classmethod
+    @request_cached
     def retrieve_jury_member(cls, person, uuid, member_uuid, **kwargs) -> MembreJuryIdentityDTO:
         return DoctorateAPIClient().retrieve_jury_member(
             uuid=uuid,
@@ -630,6 +676,7 @@ class DoctorateJuryService(metaclass=ServiceMeta):
         )
 
     @classmethod
+    @request_cached
     def get_signature_conditions(cls, person, uuid) -> List:
         return DoctorateAPIClient().signature_conditions(
             uuid=uuid,
@@ -661,6 +708,7 @@ class DoctorateJuryService(metaclass=ServiceMeta):
         )
 
     @classmethod
+    @request_cached
     def get_external_jury(cls, uuid, token, **kwargs):
         return DoctorateAPIClient(api_config=cls.build_config()).get_external_jury(
             uuid=uuid,
@@ -0,0 +1,94 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from typing import Dict, Iterable, Optional
+
+from django.conf import settings
+from osis_document_components.enums import PostProcessingWanted
+
+from parcours_doctoral.services.bulkheads import BulkheadFull, get_bulkhead
+from parcours_doctoral.services.cache import ReferenceDataCache
+
+__all__ = [
+    "DocumentTokenService",
+    "document_tokens_cache",
+]
+
+# The reading tokens are cached during a part of their validity window only, so that a cached token can still be used
+DEFAULT_DOCUMENT_TOKEN_TIMEOUT = 10 * 60
+DEFAULT_WANTED_POST_PROCESS = PostProcessingWanted.ORIGINAL.name
+
+
+class DocumentTokenCache(ReferenceDataCache):
+    @property
+    def timeout(self):
+        return getattr(settings, 'PARCOURS_DOCTORAL_DOCUMENT_TOKEN_CACHE_TIMEOUT', self.default_timeout)
+
+
+document_tokens_cache = DocumentTokenCache(
+    'document_tokens',
+    default_timeout=DEFAULT_DOCUMENT_TOKEN_TIMEOUT,
+    localized=False,
+)
+
+
+class DocumentTokenService:
+    @classmethod
+    def get_tokens(cls, uuids: Iterable, wanted_post_process=DEFAULT_WANTED_POST_PROCESS) -> Dict[str, str]:
+        """
+        Return the reading tokens of the documents by uuid. The tokens which are not cached are requested to
+        osis-document in a single request, within the 'documents' bulkhead. The unknown documents, and the documents
+        whose tokens cannot be requested because osis-document is saturated, are not part of the result.
+        """
+        from osis_document_components.services import get_remote_tokens
+
+        uuids = [str(uuid) for uuid in dict.fromkeys(uuids) if uuid]
+        keys = {f'{wanted_post_process}:{uuid}': uuid for uuid in uuids}
+        tokens = {keys[key]: token for key, token in document_tokens_cache.get_many(keys).items()}
+
+        missing_uuids = [uuid for uuid in uuids if uuid not in tokens]
+        if missing_uuids:
+            loaded_tokens = {}
+            try:
+                with get_bulkhead('documents').slot():
+                    remote_tokens = get_remote_tokens(missing_uuids, wanted_post_process=wanted_post_process) or {}
+            except BulkheadFull:
+                return tokens
+            for uuid, token in remote_tokens.items():
+                # Depending on the wanted post process, the token can be returned with other data
+                token = token if isinstance(token, str) else token.get('token')
+                if token:
+                    loaded_tokens[str(uuid)] = token
+            document_tokens_cache.set_many(
+                {f'{wanted_post_process}:{uuid}': token for uuid, token in loaded_tokens.items()}
+            )
+            tokens.update(loaded_tokens)
+
+        return tokens
+
+    @classmethod
+    def get_token(cls, uuid, wanted_post_process=DEFAULT_WANTED_POST_PROCESS) -> Optional[str]:
+        """Return the reading token of a document, if it exists."""
+        return cls.get_tokens([uuid], wanted_post_process=wanted_post_process).get(str(uuid))
@@ -23,25 +23,28 @@
 #    see http://www.gnu.org/licenses/.
 #
 # ##############################################################################
-from osis_education_group_sdk import ApiClient, ApiException
+import osis_education_group_sdk
+from osis_education_group_sdk import ApiException
 from osis_education_group_sdk.api import trainings_api
 from osis_education_group_sdk.model.training_detailed import TrainingDetailed
 
 from frontoffice.settings.osis_sdk import education_group as education_group_sdk
 from frontoffice.settings.osis_sdk.utils import build_mandatory_auth_headers
-from parcours_doctoral.services.mixins import ServiceMeta
+from parcours_doctoral.services.clients import get_api_client
+from parcours_doctoral.services.mixins import ServiceMeta, request_cached
 
 
 class EducationGroupAPIClient:
     def __new__(cls):
         api_config = education_group_sdk.build_configuration()
-        return trainings_api.TrainingsApi(ApiClient(configuration=api_config))
+        return trainings_api.TrainingsApi(get_api_client(osis_education_group_sdk, api_config))
 
 
 class TrainingsService(metaclass=ServiceMeta):
     api_exception_cls = ApiException
 
     @classmethod
+    @request_cached
     def get_training(cls, person, year, acronym) -> TrainingDetailed:
         return EducationGroupAPIClient().trainings_read(
             year=year,
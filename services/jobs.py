@@ -0,0 +1,134 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict
+
+from django.conf import settings
+from django.db import connections
+from django.utils import translation
+from django.utils.module_loading import import_string
+
+__all__ = [
+    "ImmediateJobQueueBackend",
+    "Job",
+    "JobQueueBackend",
+    "LocalJobQueueBackend",
+    "enqueue",
+    "get_job_queue",
+]
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_JOB_QUEUE_BACKEND = 'parcours_doctoral.services.jobs.LocalJobQueueBackend'
+DEFAULT_JOB_QUEUE_WORKERS = 2
+
+
+@dataclass(frozen=True)
+class Job:
+    """A function to call in background, specified by its dotted path, with keyword arguments that can be serialized."""
+
+    function: str
+    kwargs: Dict = field(default_factory=dict)
+    language: str = ''
+
+    @property
+    def key(self):
+        """Identify the job so that the same job is only queued once."""
+        return self.function, self.language, repr(sorted(self.kwargs.items()))
+
+    def run(self):
+        with translation.override(self.language or None):
+            import_string(self.function)(**self.kwargs)
+
+
+class JobQueueBackend:
+    def enqueue(self, job: Job):
+        raise NotImplementedError
+
+
+class ImmediateJobQueueBackend(JobQueueBackend):
+    """Run the jobs as soon as they are queued, in the current thread (e.g. for the tests)."""
+
+    def enqueue(self, job: Job):
+        job.run()
+
+
+class LocalJobQueueBackend(JobQueueBackend):
+    """
+    Run the jobs in a pool of worker threads of the current process (PARCOURS_DOCTORAL_JOB_QUEUE_WORKERS). A job which
+    is already queued and not started yet is not queued again. The failures are logged.
+    """
+
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(
+            max_workers=getattr(settings, 'PARCOURS_DOCTORAL_JOB_QUEUE_WORKERS', DEFAULT_JOB_QUEUE_WORKERS),
+            thread_name_prefix='parcours-doctoral-jobs',
+        )
+        self._pending_keys = set()
+        self._lock = threading.Lock()
+
+    def enqueue(self, job: Job):
+        with self._lock:
+            if job.key in self._pending_keys:
+                return
+            self._pending_keys.add(job.key)
+        self._executor.submit(self._run, job)
+
+    def _run(self, job: Job):
+        # A job queued while this one is running may depend on changes which are not seen by this one
+        with self._lock:
+            self._pending_keys.discard(job.key)
+        try:
+            job.run()
+        except Exception:
+            logger.exception("The job '%s' failed", job.function)
+        finally:
+            # The database connections are opened by thread
+            connections.close_all()
+
+
+_job_queues = {}
+_job_queues_lock = threading.Lock()
+
+
+def get_job_queue() -> JobQueueBackend:
+    """Return the job queue whose backend is specified by PARCOURS_DOCTORAL_JOB_QUEUE_BACKEND."""
+    backend_path = getattr(settings, 'PARCOURS_DOCTORAL_JOB_QUEUE_BACKEND', DEFAULT_JOB_QUEUE_BACKEND)
+    job_queue = _job_queues.get(backend_path)
+    if job_queue is None:
+        with _job_queues_lock:
+            job_queue = _job_queues.get(backend_path)
+            if job_queue is None:
+                job_queue = _job_queues[backend_path] = import_string(backend_path)()
+    return job_queue
+
+
+def enqueue(function, **kwargs):
+    """Queue the call of the function, specified by its dotted path, in the current language."""
+    get_job_queue().enqueue(Job(function=function, kwargs=kwargs, language=translation.get_language() or ''))
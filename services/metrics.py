@@ -0,0 +1,198 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import contextvars
+import functools
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from django.core.exceptions import PermissionDenied
+from django.http import Http404
+from prometheus_client import Counter, Gauge, Histogram
+
+from frontoffice.settings.osis_sdk.utils import MultipleApiBusinessException
+from parcours_doctoral.services.context import get_service_context
+
+__all__ = [
+    "ServiceCall",
+    "get_current_call",
+    "instrument",
+    "record_response",
+    "BULKHEAD_ACTIVE_CALLS",
+    "BULKHEAD_REJECTIONS",
+    "CIRCUIT_BREAKER_STATE",
+    "CIRCUIT_BREAKER_TRIPS",
+    "SERVICE_CALLS",
+    "SERVICE_CALL_DURATION",
+    "SERVICE_CALL_RETRIES",
+    "SERVICE_RESPONSE_SIZE",
+]
+
+OUTCOME_SUCCESS = 'success'
+OUTCOME_BUSINESS_EXCEPTION = 'business_exception'
+OUTCOME_CLIENT_ERROR = '4xx'
+OUTCOME_SERVER_ERROR = '5xx'
+OUTCOME_ERROR = 'error'
+
+_current_call = contextvars.ContextVar('parcours_doctoral_service_call', default=None)
+
+# The metrics are registered in the default registry of the Prometheus client, to be exposed by the project (with the
+# multiprocess mode of the client if the project runs several worker processes)
+SERVICE_CALLS = Counter(
+    'parcours_doctoral_service_calls_total',
+    'Number of calls of the service methods',
+    ['service', 'method', 'outcome'],
+)
+SERVICE_CALL_DURATION = Histogram(
+    'parcours_doctoral_service_call_duration_seconds',
+    'Duration of the calls of the service methods',
+    ['service', 'method', 'outcome'],
+    buckets=[0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10],
+)
+SERVICE_RESPONSE_SIZE = Histogram(
+    'parcours_doctoral_service_response_size_bytes',
+    'Size of the backend responses received by the service methods',
+    ['service', 'method'],
+    buckets=[1024, 4096, 16384, 65536, 262144, 1048576, 4194304],
+)
+SERVICE_CALL_RETRIES = Counter(
+    'parcours_doctoral_service_call_retries_total',
+    'Number of retries of the idempotent calls of the service methods after a transient failure',
+    ['service', 'method'],
+)
+CIRCUIT_BREAKER_STATE = Gauge(
+    'parcours_doctoral_circuit_breaker_state',
+    'State of the circuit breakers of the backends (0: closed, 1: half-open, 2: open)',
+    ['backend', 'group'],
+    # The breakers are kept by each process: the worst state is reported
+    multiprocess_mode='livemax',
+)
+CIRCUIT_BREAKER_TRIPS = Counter(
+    'parcours_doctoral_circuit_breaker_trips_total',
+    'Number of times the circuit breakers of the backends have been opened',
+    ['backend', 'group'],
+)
+BULKHEAD_ACTIVE_CALLS = Gauge(
+    'parcours_doctoral_bulkhead_active_calls',
+    'Number of calls in progress within the bulkheads of the dependencies',
+    ['bulkhead'],
+    multiprocess_mode='livesum',
+)
+BULKHEAD_REJECTIONS = Counter(
+    'parcours_doctoral_bulkhead_rejections_total',
+    'Number of calls rejected by the bulkheads of the dependencies',
+    ['bulkhead'],
+)
+
+
+@dataclass
+class ServiceCall:
+    """Measurements of a call of a service method."""
+
+    service: str
+    method: str
+    arguments: str = ''
+    outcome: str = ''
+    status: Optional[int] = None
+    duration: float = 0
+    requests: int = 0
+    response_size: int = 0
+
+    @property
+    def name(self):
+        return f'{self.service}.{self.method}'
+
+
+def get_current_call() -> Optional[ServiceCall]:
+    """Return the call of the service method being executed, if any."""
+    return _current_call.get()
+
+
+def record_response(status, response_size):
+    """Add a backend response to the measurements of the current service call (see ApiClientRegistry)."""
+    call = _current_call.get()
+    if call is not None:
+        call.requests += 1
+        call.status = status
+        call.response_size += response_size
+
+
+def get_outcome(exception, status):
+    if exception is None:
+        return OUTCOME_SUCCESS
+    # Some exceptions define their own outcome (see parcours_doctoral.services.resilience)
+    if getattr(exception, 'outcome', None):
+        return exception.outcome
+    if isinstance(exception, MultipleApiBusinessException):
+        return OUTCOME_BUSINESS_EXCEPTION
+    if isinstance(exception, (Http404, PermissionDenied)) or (status and 400 <= status < 500):
+        return OUTCOME_CLIENT_ERROR
+    if status and status >= 500:
+        return OUTCOME_SERVER_ERROR
+    return OUTCOME_ERROR
+
+
+def instrument(func, service_name, method_name, get_arguments_key=None):
+    """
+    Measure the calls of the decorated service method and add them to the metrics and to the current request.
+
+    The arguments of the calls are only kept, as a key returned by get_arguments_key, during a request. The calls made
+    by another service method are measured as part of it.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if _current_call.get() is not None:
+            return func(*args, **kwargs)
+        call = ServiceCall(service=service_name, method=method_name)
+        if get_arguments_key is not None and get_service_context() is not None:
+            call.arguments = get_arguments_key(args, kwargs)
+        token = _current_call.set(call)
+        exception = None
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            exception = e
+            if call.status is None:
+                call.status = getattr(e, 'status', None)
+            raise
+        finally:
+            call.duration = time.perf_counter() - start
+            call.outcome = get_outcome(exception, call.status)
+            _current_call.reset(token)
+
+            SERVICE_CALLS.labels(service_name, method_name, call.outcome).inc()
+            SERVICE_CALL_DURATION.labels(service_name, method_name, call.outcome).observe(call.duration)
+            if call.requests:
+                SERVICE_RESPONSE_SIZE.labels(service_name, method_name).observe(call.response_size)
+
+            context = get_service_context()
+            if context is not None:
+                context.record_call(call)
+
+    return wrapper
+
@@ -23,19 +23,34 @@
 #  see http://www.gnu.org/licenses/.
 #
 # ##############################################################################
+import functools
+import inspect
 import re
 from copy import copy
 
 from django.contrib import messages
 from django.core.exceptions import PermissionDenied
+from django.utils.translation import get_language
 from django.utils.translation import gettext_lazy as _
 from osis_parcours_doctoral_sdk import OpenApiException
 
 from base.models.person import Person
 from frontoffice.settings.osis_sdk.utils import MultipleApiBusinessException, api_exception_handler
+from parcours_doctoral.services.bulkheads import isolated
+from parcours_doctoral.services.cache import DoctorateDataCache
+from parcours_doctoral.services.context import get_service_context
+from parcours_doctoral.services.deadline import within_deadline
+from parcours_doctoral.services.metrics import instrument
+from parcours_doctoral.services.resilience import resilient
 
 INVALID_LENGTH_RE = re.compile('Invalid value for `([^`]+)`, length must be less than or equal to `([^`]+)`')
 
+# Names of the service method parameters which contain the uuid of the doctorate
+DOCTORATE_UUID_PARAMETERS = ['uuid', 'uuid_doctorate', 'doctorate_uuid']
+
+# Names of the class methods of the services which do not call the backend, as the private ones
+SERVICE_HELPER_NAMES = ['build_config']
+
 
 class WebServiceFormMixin:
     error_mapping = {}
@@ -105,17 +120,141 @@ class WebServiceFormMixin:
         return self.request.user.person
 
 
+def request_cached(func):
+    """
+    Mark a read-only service class method whose results can be reused during the current request.
+
+    Must be applied under the @classmethod decorator.
+    """
+    func.request_cached = True
+    return func
+
+
+def not_retried(func):
+    """
+    Mark a read-only service class method which is not retried after a transient failure, as the backend does an
+    expensive work to answer it (the generation of a document for instance).
+
+    Must be applied under the @classmethod decorator.
+    """
+    func.retried = False
+    return func
+
+
+def _get_doctorate_uuid_parameter(signature):
+    return next((name for name in DOCTORATE_UUID_PARAMETERS if name in signature.parameters), None)
+
+
+def _get_arguments(signature, args, kwargs):
+    """Return the arguments of a service method call by name, the person being identified by its primary key."""
+    bound_arguments = signature.bind(*args, **kwargs)
+    bound_arguments.apply_defaults()
+    arguments = dict(bound_arguments.arguments)
+    arguments.pop('cls', None)
+    if 'person' in arguments:
+        arguments['person'] = getattr(arguments['person'], 'pk', arguments['person'])
+    return arguments
+
+
+def _get_arguments_key(signature, args, kwargs):
+    return repr(sorted(_get_arguments(signature, args, kwargs).items(), key=lambda item: item[0]))
+
+
+def _cache_in_request(func, signature, qualname):
+    """Memoize the results of the decorated method in the service context of the current request."""
+    doctorate_uuid_parameter = _get_doctorate_uuid_parameter(signature)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        context = get_service_context()
+        if context is None:
+            return func(*args, **kwargs)
+
+        arguments = _get_arguments(signature, args, kwargs)
+        key = (qualname, get_language(), repr(sorted(arguments.items(), key=lambda item: item[0])))
+
+        found, result = context.get_result(key)
+        if not found:
+            result = func(*args, **kwargs)
+            context.store_result(key, result, arguments.get(doctorate_uuid_parameter))
+        return result
+
+    return wrapper
+
+
+def _invalidate_request_cache(func, signature):
+    """Forget the memoized and cached results related to the doctorate once the decorated method has been called."""
+    doctorate_uuid_parameter = _get_doctorate_uuid_parameter(signature)
+    if doctorate_uuid_parameter is None:
+        return func
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            doctorate_uuid = signature.bind_partial(*args, **kwargs).arguments.get(doctorate_uuid_parameter)
+            if doctorate_uuid:
+                DoctorateDataCache.invalidate(doctorate_uuid)
+                context = get_service_context()
+                if context is not None:
+                    context.invalidate(doctorate_uuid)
+
+    return wrapper
+
+
 class ServiceMeta(type):
     """
     A metaclass that decorates all class methods with exception handler.
 
-    'api_exception_cls' must be specified as attribute
+    'api_exception_cls' must be specified as attribute.
+
+    The results of the class methods decorated with @request_cached are memoized during the current request (see
+    ServiceRequestContextMiddleware) and any other class method related to a doctorate forgets the memoized results of
+    this doctorate and changes its version in the shared cache (see DoctorateDataCache).
+
+    The helpers (see SERVICE_HELPER_NAMES) only get the exception handler. The other calls reach the backend:
+
+    The duration, outcome and response size of each call which is not memoized are measured, a nested call being part
+    of the calling one (see parcours_doctoral.services.metrics).
+
+    The calls are protected by a circuit breaker per backend (the SDK of 'api_exception_cls') and per service class,
+    and the @request_cached methods, which are read-only, are retried after a transient failure unless they are
+    decorated with @not_retried (see parcours_doctoral.services.resilience).
+
+    The calls are made within the bulkhead of the dependency named by the optional 'bulkhead' attribute, by default
+    the backend, so that a saturated dependency cannot use all the workers (see parcours_doctoral.services.bulkheads).
+
+    Once the deadline of the request has passed, the calls which are not memoized fail with DeadlineExceeded (see
+    parcours_doctoral.services.deadline).
     """
 
     def __new__(mcs, name, bases, attrs):
         if 'api_exception_cls' not in attrs:
             raise AttributeError("{name} must declare 'api_exception_cls' attribute".format(name=name))
+        backend = attrs['api_exception_cls'].__module__.split('.')[0]
         for attr_name, attr_value in attrs.items():
             if isinstance(attr_value, classmethod):
-                attrs[attr_name] = classmethod(api_exception_handler(attrs['api_exception_cls'])(attr_value.__func__))
+                func = attr_value.__func__
+                if attr_name.startswith('_') or attr_name in SERVICE_HELPER_NAMES:
+                    attrs[attr_name] = classmethod(api_exception_handler(attrs['api_exception_cls'])(func))
+                    continue
+                signature = inspect.signature(func)
+                wrapped = resilient(
+                    func,
+                    backend=backend,
+                    group=name,
+                    service_name=name,
+                    method_name=attr_name,
+                    idempotent=getattr(func, 'request_cached', False) and getattr(func, 'retried', True),
+                )
+                wrapped = isolated(wrapped, attrs.get('bulkhead') or backend)
+                wrapped = within_deadline(wrapped)
+                wrapped = api_exception_handler(attrs['api_exception_cls'])(wrapped)
+                wrapped = instrument(wrapped, name, attr_name, functools.partial(_get_arguments_key, signature))
+                if getattr(func, 'request_cached', False):
+                    wrapped = _cache_in_request(wrapped, signature, func.__qualname__)
+                else:
+                    wrapped = _invalidate_request_cache(wrapped, signature)
+                attrs[attr_name] = classmethod(wrapped)
         return super().__new__(mcs, name, bases, attrs)
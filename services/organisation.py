@@ -23,25 +23,29 @@
 #    see http://www.gnu.org/licenses/.
 #
 # ##############################################################################
-from osis_organisation_sdk import ApiClient, ApiException
+import osis_organisation_sdk
+from osis_organisation_sdk import ApiException
 from osis_organisation_sdk.api import entites_api
 
 from frontoffice.settings.osis_sdk import organisation as organisation_sdk
 from frontoffice.settings.osis_sdk.utils import build_mandatory_auth_headers
 from parcours_doctoral.constants import UCL_CODE
-from parcours_doctoral.services.mixins import ServiceMeta
+from parcours_doctoral.services.clients import get_api_client
+from parcours_doctoral.services.mixins import ServiceMeta, request_cached
 
 
 class EntitiesAPIClient:
     def __new__(cls):
         api_config = organisation_sdk.build_configuration()
-        return entites_api.EntitesApi(ApiClient(configuration=api_config))
+        return entites_api.EntitesApi(get_api_client(osis_organisation_sdk, api_config))
 
 
 class EntitiesService(metaclass=ServiceMeta):
     api_exception_cls = ApiException
+    bulkhead = 'organisation'
 
     @classmethod
+    @request_cached
     def get_ucl_entities(cls, person, entity_type, *args, **kwargs):
         return (
             EntitiesAPIClient()
@@ -56,6 +60,7 @@ class EntitiesService(metaclass=ServiceMeta):
         )
 
     @classmethod
+    @request_cached
     def get_ucl_entity(cls, person, uuid, *args, **kwargs):
         return EntitiesAPIClient().get_entity(
             uuid=uuid,
@@ -66,6 +71,7 @@ class EntitiesService(metaclass=ServiceMeta):
         )
 
     @classmethod
+    @request_cached
     def get_ucl_entity_addresses(cls, person, uuid, *args, **kwargs):
         # TODO will become (again) a list of results
         offset = 0
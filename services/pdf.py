@@ -0,0 +1,216 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import logging
+import threading
+
+import urllib3
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.translation import get_language
+
+from base.models.person import Person
+from parcours_doctoral.contrib.enums.training import StatutActivite
+from parcours_doctoral.services.cache import DEFAULT_DOCTORATE_TIMEOUT, DoctorateDataCache
+from parcours_doctoral.services.clients import DEFAULT_POOL_MAXSIZE
+from parcours_doctoral.services.deadline import get_request_timeout
+from parcours_doctoral.services.doctorate import DoctorateService
+from parcours_doctoral.services.jobs import enqueue
+
+__all__ = [
+    "PdfDeliveryCache",
+    "RemoteFileContent",
+    "enqueue_training_recaps",
+    "generate_training_recaps",
+    "make_document_key",
+    "open_remote_file",
+    "pdf_delivery_cache",
+]
+
+logger = logging.getLogger(__name__)
+
+# The documents may also be generated again after a change made in the back office, which does not change the content
+# version of the doctorate, so they are only cached for a short time
+DEFAULT_PDF_CACHE_TIMEOUT = 60
+DEFAULT_STREAMING_CHUNK_SIZE = 64 * 1024
+# Connect and read timeouts of the requests to the document server, in seconds
+DEFAULT_STREAMING_TIMEOUT = (5, 30)
+TRAINING_RECAP_DOCUMENT_KIND = 'training_recap'
+TRAINING_RECAP_STATUSES = [StatutActivite.SOUMISE.name, StatutActivite.ACCEPTEE.name]
+STREAMED_HEADERS = [
+    'Accept-Ranges',
+    'Content-Disposition',
+    'Content-Encoding',
+    'Content-Length',
+    'Content-Range',
+    'Content-Type',
+    'ETag',
+    'Last-Modified',
+]
+
+
+class PdfDeliveryCache(DoctorateDataCache):
+    """
+    Cache of the urls of the documents generated by the backend (recaps, canvases...), by doctorate, user, kind of
+    document and language, which are used while the content version of the doctorate is unchanged. The urls are signed
+    for the user who requested them, so they are never shared with the other users.
+
+    The urls are stored in the Django cache, so that a document generated by a process (for instance by a job run
+    outside of the web processes) is delivered by all the others.
+
+    The entries expire after PARCOURS_DOCTORAL_PDF_CACHE_TIMEOUT seconds (0 disables the cache), which bounds the time
+    during which a document generated again after a change made in the back office is not seen. As the content version
+    of the doctorates is only changed when the doctorate cache is enabled, this cache is disabled with it.
+    """
+
+    @property
+    def timeout(self):
+        if not getattr(settings, 'PARCOURS_DOCTORAL_DOCTORATE_CACHE_TIMEOUT', DEFAULT_DOCTORATE_TIMEOUT):
+            return 0
+        return getattr(settings, 'PARCOURS_DOCTORAL_PDF_CACHE_TIMEOUT', self.default_timeout)
+
+    def make_key(self, key, version):
+        return f'parcours_doctoral:{self.namespace}:{version}:{get_language()}:{key}'
+
+    def get_or_load(self, key, doctorate_uuid, loader):
+        """Return the cached url of the key if the doctorate has not changed since, or load, cache and return it."""
+        timeout = self.timeout
+        if not timeout:
+            return loader()
+
+        # The version is read before loading so that a concurrent write makes the loaded url outdated
+        version = self.get_version(doctorate_uuid)
+        if version is None:
+            return loader()
+
+        full_key = self.make_key(key, version)
+        try:
+            url = cache.get(full_key)
+        except Exception:
+            logger.exception("Unable to read the entry '%s' from the cache", full_key)
+            url = None
+        if url:
+            return url
+
+        url = loader()
+        if url:
+            try:
+                cache.set(full_key, url, timeout)
+            except Exception:
+                logger.exception("Unable to write the entry '%s' in the cache", full_key)
+        return url
+
+
+pdf_delivery_cache = PdfDeliveryCache('pdf', default_timeout=DEFAULT_PDF_CACHE_TIMEOUT)
+
+
+def make_document_key(document_kind, person_id, **arguments):
+    """
+    Return the cache key of a generated document depending on its kind, on the person it is generated for and on the
+    arguments of its url.
+    """
+    return ':'.join([document_kind, str(person_id)] + [f'{name}={value}' for name, value in sorted(arguments.items())])
+
+
+def generate_training_recaps(person_id, doctorate_uuid):
+    """Generate the training recaps of the doctorate which are not cached yet, and cache them."""
+    person = Person.objects.select_related('user').get(pk=person_id)
+    for status in TRAINING_RECAP_STATUSES:
+        pdf_delivery_cache.get_or_load(
+            key=make_document_key(TRAINING_RECAP_DOCUMENT_KIND, person_id, pk=doctorate_uuid, status=status),
+            doctorate_uuid=doctorate_uuid,
+            loader=lambda: DoctorateService.get_training_recap_pdf(
+                person=person,
+                uuid_doctorate=doctorate_uuid,
+                status=status,
+            ).url,
+        )
+
+
+def enqueue_training_recaps(person, doctorate_uuid):
+    """
+    Queue the generation of the training recaps of the doctorate, which are often downloaded right after a change of
+    the activities, so that they are then delivered from the cache.
+    """
+    if pdf_delivery_cache.timeout:
+        enqueue(
+            'parcours_doctoral.services.pdf.generate_training_recaps',
+            person_id=person.pk,
+            doctorate_uuid=str(doctorate_uuid),
+        )
+
+
+_pool_manager = None
+_pool_manager_lock = threading.Lock()
+
+
+def get_pool_manager() -> urllib3.PoolManager:
+    global _pool_manager
+    if _pool_manager is None:
+        with _pool_manager_lock:
+            if _pool_manager is None:
+                _pool_manager = urllib3.PoolManager(
+                    maxsize=getattr(settings, 'PARCOURS_DOCTORAL_SDK_POOL_MAXSIZE', DEFAULT_POOL_MAXSIZE),
+                )
+    return _pool_manager
+
+
+def open_remote_file(url, range_header=None) -> urllib3.HTTPResponse:
+    """
+    Request a remote file without loading its content, which must then be read by chunks (see RemoteFileContent).
+    The range of the request, if any, is forwarded.
+
+    The connect and read timeouts (PARCOURS_DOCTORAL_STREAMING_TIMEOUT) are bounded by the time left before the
+    deadline of the current request.
+    """
+    headers = {'Range': range_header} if range_header else {}
+    connect_timeout, read_timeout = get_request_timeout(
+        getattr(settings, 'PARCOURS_DOCTORAL_STREAMING_TIMEOUT', DEFAULT_STREAMING_TIMEOUT)
+    )
+    return get_pool_manager().request(
+        'GET',
+        url,
+        headers=headers,
+        preload_content=False,
+        timeout=urllib3.Timeout(connect=connect_timeout, read=read_timeout),
+    )
+
+
+class RemoteFileContent:
+    """Content of an opened remote file, read by chunks, whose connection is released when it is closed."""
+
+    def __init__(self, response: urllib3.HTTPResponse, chunk_size=None):
+        self.response = response
+        self.chunk_size = chunk_size or getattr(
+            settings,
+            'PARCOURS_DOCTORAL_STREAMING_CHUNK_SIZE',
+            DEFAULT_STREAMING_CHUNK_SIZE,
+        )
+
+    def __iter__(self):
+        return self.response.stream(self.chunk_size, decode_content=False)
+
+    def close(self):
+        self.response.release_conn()
@@ -23,11 +23,15 @@
 #    see http://www.gnu.org/licenses/.
 #
 # ##############################################################################
-from functools import lru_cache
-from typing import List
+import threading
+from collections import OrderedDict
+from functools import partial
+from typing import List, Optional
 
+import osis_reference_sdk
+from django.conf import settings
 from django.http import Http404
-from osis_reference_sdk import ApiClient, ApiException
+from osis_reference_sdk import ApiException
 from osis_reference_sdk.api import (
     academic_years_api,
     countries_api,
@@ -36,64 +40,120 @@ from osis_reference_sdk.api import (
     universities_api,
 )
 from osis_reference_sdk.models.academic_year import AcademicYear
+from osis_reference_sdk.models.country import Country
+from osis_reference_sdk.models.language import Language
+from osis_reference_sdk.models.superior_non_university import SuperiorNonUniversity
+from osis_reference_sdk.models.university import University
 
 from frontoffice.settings.osis_sdk import reference as reference_sdk
 from frontoffice.settings.osis_sdk.utils import build_mandatory_auth_headers
 from parcours_doctoral.contrib.enums.diploma import StudyType
-from parcours_doctoral.services.mixins import ServiceMeta
+from parcours_doctoral.services.cache import ReferenceDataCache
+from parcours_doctoral.services.clients import get_api_client
+from parcours_doctoral.services.mixins import ServiceMeta, request_cached
+from parcours_doctoral.services.reference_index import ReferenceIndex
+
+# Models of the reference data, by name
+REFERENCE_MODELS = {model.__name__: model for model in [Country, Language, SuperiorNonUniversity, University]}
+
+
+def dump_reference_model(model):
+    """Return the reference model as plain data, which can be read by the processes using another version of the SDK."""
+    if model is None:
+        return None
+    model_name = type(model).__name__
+    if REFERENCE_MODELS.get(model_name) is not type(model):
+        raise TypeError(f'{model_name} is not a reference model')
+    return {'model': model_name, 'data': model.to_dict()}
+
+
+def load_reference_model(data):
+    """Return the reference model dumped by dump_reference_model."""
+    if data is None:
+        return None
+    return REFERENCE_MODELS[data['model']]._from_openapi_data(**data['data'])
+
+
+reference_data_cache = ReferenceDataCache('reference', dump=dump_reference_model, load=load_reference_model)
+
+# Type (university or not) of the superior institutes by uuid, to request the right endpoint
+institute_types_cache = ReferenceDataCache('institute_types', default_timeout=24 * 60 * 60, localized=False)
+
+
+def make_reference_key(name, **kwargs):
+    """Return the cache key of a reference data depending on its name and on the filters used to load it."""
+    return ':'.join([name] + [f'{key}={value}' for key, value in sorted(kwargs.items())])
 
 
 class CountriesAPIClient:
     def __new__(cls):
         api_config = reference_sdk.build_configuration()
-        return countries_api.CountriesApi(ApiClient(configuration=api_config))
+        return countries_api.CountriesApi(get_api_client(osis_reference_sdk, api_config))
+
+
+def list_countries(person=None, *args, **kwargs):
+    return CountriesAPIClient().countries_list(
+        active=True,
+        *args,
+        **kwargs,
+        **build_mandatory_auth_headers(person),
+    )
 
 
 class CountriesService(metaclass=ServiceMeta):
     api_exception_cls = ApiException
+    bulkhead = 'reference'
 
     @classmethod
+    @request_cached
     def get_countries(cls, person=None, *args, **kwargs):
-        return (
-            CountriesAPIClient()
-            .countries_list(
-                active=True,
-                *args,
-                **kwargs,
-                **build_mandatory_auth_headers(person),
-            )
-            .results
-        )
+        return list_countries(person, *args, **kwargs).results
 
     @classmethod
-    @lru_cache()
+    @request_cached
+    def get_paginated_countries(cls, person=None, **kwargs):
+        """Return a page of the countries with their total count."""
+        return list_countries(person, **kwargs)
+
+    @classmethod
+    @request_cached
     def get_country(cls, person=None, *args, **kwargs):
-        countries = (
-            CountriesAPIClient()
-            .countries_list(
-                active=True,
-                *args,
-                **kwargs,
-                **build_mandatory_auth_headers(person),
-                limit=1,
+        if not args and list(kwargs) == ['iso_code']:
+            country = countries_index.get(kwargs['iso_code'], person=person)
+            if country is not None:
+                return country
+
+        def load_country():
+            countries = (
+                CountriesAPIClient()
+                .countries_list(
+                    active=True,
+                    *args,
+                    **kwargs,
+                    **build_mandatory_auth_headers(person),
+                    limit=1,
+                )
+                .results
             )
-            .results
-        )
-        if not countries:
-            return None
-        return countries[0]
+            if not countries:
+                return None
+            return countries[0]
+
+        return reference_data_cache.get_or_load(make_reference_key('country', **kwargs), load_country)
 
 
 class AcademicYearAPIClient:
     def __new__(cls):
         api_config = reference_sdk.build_configuration()
-        return academic_years_api.AcademicYearsApi(ApiClient(configuration=api_config))
+        return academic_years_api.AcademicYearsApi(get_api_client(osis_reference_sdk, api_config))
 
 
 class AcademicYearService(metaclass=ServiceMeta):
     api_exception_cls = ApiException
+    bulkhead = 'reference'
 
     @classmethod
+    @request_cached
     def get_academic_years(cls, person) -> List[AcademicYear]:
         """Returns the academic years"""
         return (
@@ -109,61 +169,99 @@ class AcademicYearService(metaclass=ServiceMeta):
 class LanguagesAPIClient:
     def __new__(cls):
         api_config = reference_sdk.build_configuration()
-        return languages_api.LanguagesApi(ApiClient(configuration=api_config))
+        return languages_api.LanguagesApi(get_api_client(osis_reference_sdk, api_config))
+
+
+def list_languages(person, *args, **kwargs):
+    return LanguagesAPIClient().languages_list(
+        limit=kwargs.pop('limit', 100),
+        *args,
+        **kwargs,
+        **build_mandatory_auth_headers(person),
+    )
 
 
 class LanguageService(metaclass=ServiceMeta):
     api_exception_cls = ApiException
+    bulkhead = 'reference'
 
     @classmethod
+    @request_cached
     def get_languages(cls, person, *args, **kwargs):
-        return (
-            LanguagesAPIClient()
-            .languages_list(
-                limit=kwargs.pop('limit', 100),
-                *args,
-                **kwargs,
-                **build_mandatory_auth_headers(person),
-            )
-            .results
-        )
+        return list_languages(person, *args, **kwargs).results
+
+    @classmethod
+    @request_cached
+    def get_paginated_languages(cls, person, **kwargs):
+        """Return a page of the languages with their total count."""
+        return list_languages(person, **kwargs)
 
     @classmethod
+    @request_cached
     def get_language(cls, code, person=None):
-        languages = (
-            LanguagesAPIClient()
-            .languages_list(
-                limit=1,
-                code=code,
-                **build_mandatory_auth_headers(person),
+        language = languages_index.get(code, person=person)
+        if language is not None:
+            return language
+
+        def load_language():
+            languages = (
+                LanguagesAPIClient()
+                .languages_list(
+                    limit=1,
+                    code=code,
+                    **build_mandatory_auth_headers(person),
+                )
+                .results
             )
-            .results
-        )
-        return languages[0] if languages else None
+            return languages[0] if languages else None
+
+        return reference_data_cache.get_or_load(make_reference_key('language', code=code), load_language)
+
+
+countries_index = ReferenceIndex(
+    'countries',
+    'iso_code',
+    lambda person, **kwargs: CountriesService.get_paginated_countries(person=person, **kwargs),
+)
+
+languages_index = ReferenceIndex(
+    'languages',
+    'code',
+    lambda person, **kwargs: LanguageService.get_paginated_languages(person=person, **kwargs),
+)
 
 
 class SuperiorNonUniversityAPIClient:
     def __new__(cls):
         api_config = reference_sdk.build_configuration()
-        return superior_non_universities_api.SuperiorNonUniversitiesApi(ApiClient(configuration=api_config))
+        return superior_non_universities_api.SuperiorNonUniversitiesApi(get_api_client(osis_reference_sdk, api_config))
+
+
+def list_superior_non_universities(person, **kwargs):
+    return SuperiorNonUniversityAPIClient().superior_non_universities_list(
+        limit=kwargs.pop('limit', 100),
+        **kwargs,
+        **build_mandatory_auth_headers(person),
+    )
 
 
 class SuperiorNonUniversityService(metaclass=ServiceMeta):
     api_exception_cls = ApiException
+    bulkhead = 'institutes'
 
     @classmethod
+    @request_cached
     def get_superior_non_universities(cls, person, **kwargs):
-        return (
-            SuperiorNonUniversityAPIClient()
-            .superior_non_universities_list(
-                limit=kwargs.pop('limit', 100),
-                **kwargs,
-                **build_mandatory_auth_headers(person),
-            )
-            .results
-        )
+        return list_superior_non_universities(person, **kwargs).results
 
     @classmethod
+    @request_cached
+    def get_paginated_superior_non_universities(cls, person, **kwargs):
+        """Return a page of the superior non universities with their total count."""
+        return list_superior_non_universities(person, **kwargs)
+
+    @classmethod
+    @request_cached
     def get_superior_non_university(cls, person, uuid, **kwargs):
         return SuperiorNonUniversityAPIClient().superior_non_university_read(
             uuid=uuid,
@@ -175,13 +273,15 @@ class SuperiorNonUniversityService(metaclass=ServiceMeta):
 class UniversityAPIClient:
     def __new__(cls):
         api_config = reference_sdk.build_configuration()
-        return universities_api.UniversitiesApi(ApiClient(configuration=api_config))
+        return universities_api.UniversitiesApi(get_api_client(osis_reference_sdk, api_config))
 
 
 class UniversityService(metaclass=ServiceMeta):
     api_exception_cls = ApiException
+    bulkhead = 'institutes'
 
     @classmethod
+    @request_cached
     def get_universities(cls, person, **kwargs):
         return UniversityAPIClient().universities_list(
             limit=kwargs.pop('limit', 100),
@@ -190,6 +290,7 @@ class UniversityService(metaclass=ServiceMeta):
         )
 
     @classmethod
+    @request_cached
     def get_university(cls, person, uuid, **kwargs):
         return UniversityAPIClient().university_read(
             uuid=uuid,
@@ -199,8 +300,24 @@ class UniversityService(metaclass=ServiceMeta):
 
 
 class SuperiorInstituteService:
+    @classmethod
+    def remember_types(cls, institutes, study_type):
+        """Remember the type of the institutes so that they are then loaded from the right endpoint."""
+        institute_types_cache.set_many({str(institute.uuid): study_type for institute in institutes})
+
     @classmethod
     def get_superior_institute(cls, person, uuid, study_type=''):
+        return reference_data_cache.get_or_load(
+            make_reference_key('superior_institute', uuid=uuid),
+            lambda: cls._load_superior_institute(
+                person=person,
+                uuid=uuid,
+                study_type=study_type or institute_types_cache.get(str(uuid), ''),
+            ),
+        )
+
+    @classmethod
+    def _load_superior_institute(cls, person, uuid, study_type=''):
         if study_type == StudyType.UNIVERSITY.name:
             return UniversityService.get_university(person=person, uuid=uuid)
         elif study_type == StudyType.NON_UNIVERSITY.name:
@@ -208,6 +325,69 @@ class SuperiorInstituteService:
         else:
             # We don't know so we need to check the two services
             try:
-                return UniversityService.get_university(person=person, uuid=uuid)
+                institute = UniversityService.get_university(person=person, uuid=uuid)
+                study_type = StudyType.UNIVERSITY.name
             except Http404:
-                return SuperiorNonUniversityService.get_superior_non_university(person=person, uuid=uuid)
+                institute = SuperiorNonUniversityService.get_superior_non_university(person=person, uuid=uuid)
+                study_type = StudyType.NON_UNIVERSITY.name
+            institute_types_cache.set(str(uuid), study_type)
+            return institute
+
+
+def load_universities(person, **kwargs):
+    universities = UniversityService.get_universities(person=person, **kwargs)
+    SuperiorInstituteService.remember_types(universities.results, StudyType.UNIVERSITY.name)
+    return universities
+
+
+def load_superior_non_universities(person, **kwargs):
+    superior_non_universities = SuperiorNonUniversityService.get_paginated_superior_non_universities(
+        person=person,
+        **kwargs,
+    )
+    SuperiorInstituteService.remember_types(superior_non_universities.results, StudyType.NON_UNIVERSITY.name)
+    return superior_non_universities
+
+
+DEFAULT_MAX_SUPERIOR_INSTITUTES_INDEXES = 20
+
+# Least recently used indexes of the superior institutes, by country
+_superior_institutes_indexes = OrderedDict()
+_superior_institutes_indexes_lock = threading.Lock()
+
+
+def get_superior_institutes_index(country_iso_code, person=None) -> Optional[ReferenceIndex]:
+    """
+    Return the index of the active universities and superior non universities of a country, or None if no country or
+    an unknown one is specified (the institutes of all the countries are too many to be loaded at once). Only the
+    indexes of the last PARCOURS_DOCTORAL_SUPERIOR_INSTITUTES_INDEXES_MAX countries are kept.
+    """
+    if not country_iso_code or countries_index.get(country_iso_code, person=person) is None:
+        return None
+    with _superior_institutes_indexes_lock:
+        index = _superior_institutes_indexes.get(country_iso_code)
+        if index is not None:
+            _superior_institutes_indexes.move_to_end(country_iso_code)
+            return index
+
+    # The index is only loaded on its first search, but is created outside the lock which is shared by all countries
+    filters = {'active': True, 'country_iso_code': country_iso_code}
+    new_index = ReferenceIndex(
+        f'superior institutes {country_iso_code}',
+        'uuid',
+        partial(load_universities, **filters),
+        partial(load_superior_non_universities, **filters),
+        search_attributes=('name', 'city'),
+    )
+    max_indexes = getattr(
+        settings,
+        'PARCOURS_DOCTORAL_SUPERIOR_INSTITUTES_INDEXES_MAX',
+        DEFAULT_MAX_SUPERIOR_INSTITUTES_INDEXES,
+    )
+    with _superior_institutes_indexes_lock:
+        # Another thread may have created the index in the meantime
+        index = _superior_institutes_indexes.setdefault(country_iso_code, new_index)
+        _superior_institutes_indexes.move_to_end(country_iso_code)
+        while len(_superior_institutes_indexes) > max_indexes:
+            _superior_institutes_indexes.popitem(last=False)
+    return index
@@ -0,0 +1,179 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import logging
+import threading
+import time
+
+from django.conf import settings
+from django.utils.translation import get_language
+
+from parcours_doctoral.utils.concurrency import get_executor
+from parcours_doctoral.utils.search_index import SearchIndex, fold_text, get_words
+
+__all__ = [
+    "ReferenceIndex",
+]
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 6 * 60 * 60
+LOAD_PAGE_SIZE = 500
+RETRY_DELAY = 60
+
+
+class ReferenceIndex:
+    """
+    In-memory index of small and almost static reference tables (countries, languages, institutes...) loaded in bulk.
+
+    The whole tables are fetched page by page (each page loader returning a paginated response, with the results and
+    the total count) on the first access and then refreshed in background every
+    PARCOURS_DOCTORAL_REFERENCE_INDEX_TIMEOUT seconds (0 disables the index), while the previous version is still used.
+    The items are identified by their key attribute and searched by their french and english names.
+    """
+
+    def __init__(
+        self,
+        name,
+        key_attribute,
+        *page_loaders,
+        search_attributes=('name', 'name_en'),
+        default_timeout=DEFAULT_TIMEOUT,
+    ):
+        self.name = name
+        self.key_attribute = key_attribute
+        self.page_loaders = page_loaders
+        self.search_attributes = search_attributes
+        self.default_timeout = default_timeout
+        self._items = None
+        self._sorted_items = {}
+        self._search_index = SearchIndex()
+        self._loaded_at = None
+        self._failed_at = None
+        self._load_lock = threading.Lock()
+
+    @property
+    def timeout(self):
+        return getattr(settings, 'PARCOURS_DOCTORAL_REFERENCE_INDEX_TIMEOUT', self.default_timeout)
+
+    def clear(self):
+        self._items = None
+        self._sorted_items = {}
+        self._search_index.clear()
+        self._loaded_at = None
+        self._failed_at = None
+
+    def _load(self, person):
+        items = {}
+        for load_page in self.page_loaders:
+            offset = 0
+            while True:
+                page = load_page(person=person, limit=LOAD_PAGE_SIZE, offset=offset)
+                loaded_items_number = len(items)
+                items.update((getattr(item, self.key_attribute), item) for item in page.results)
+                # The backend may return less items than the requested limit
+                offset += len(page.results)
+                # Stop on the last page, or if the backend does not take the offset into account
+                if offset >= page.count or len(items) == loaded_items_number:
+                    break
+        return items
+
+    def _refresh(self, person):
+        try:
+            items = self._load(person)
+        except Exception:
+            logger.exception("Unable to load the %s index", self.name)
+            self._failed_at = time.monotonic()
+            return
+        # Only the changed items are indexed again
+        self._search_index.update(
+            {
+                key: [getattr(item, attribute, None) for attribute in self.search_attributes]
+                for key, item in items.items()
+            }
+        )
+        self._loaded_at = time.monotonic()
+        self._failed_at = None
+        self._items = items
+
+    def _refresh_in_background(self, person):
+        try:
+            self._refresh(person)
+        finally:
+            self._load_lock.release()
+
+    def _can_retry(self):
+        return self._failed_at is None or time.monotonic() - self._failed_at > RETRY_DELAY
+
+    def _get_items(self, person):
+        """Return the indexed items by key, or None if the index is not available."""
+        timeout = self.timeout
+        if not timeout:
+            return None
+
+        items = self._items
+        if items is None:
+            with self._load_lock:
+                if self._items is None and self._can_retry():
+                    self._refresh(person)
+            items = self._items
+        elif time.monotonic() - self._loaded_at > timeout and self._can_retry() and self._load_lock.acquire(False):
+            get_executor().submit(self._refresh_in_background, person)
+
+        return items
+
+    def get(self, key, person=None):
+        """Return the item identified by the key, or None if it is unknown or if the index is not available."""
+        items = self._get_items(person)
+        return items.get(key) if items is not None else None
+
+    def search(self, search='', limit=None, offset=0, person=None):
+        """
+        Return the items whose words start with the searched terms (or the closest ones if there is none), sorted by
+        relevance and by name in the current language, or None if the index is not available.
+        """
+        items = self._get_items(person)
+        if items is None:
+            return None
+
+        name_attribute = 'name' if get_language() == settings.LANGUAGE_CODE else 'name_en'
+
+        def get_sort_name(item):
+            return fold_text(getattr(item, name_attribute, None) or getattr(item, 'name', None))
+
+        if get_words(search):
+            scores = self._search_index.search(search)
+            results = sorted(
+                (items[key] for key in scores if key in items),
+                key=lambda item: (-scores[getattr(item, self.key_attribute)], get_sort_name(item)),
+            )
+        else:
+            # The items sorted by name are kept with the version of the index they come from
+            sorted_items = self._sorted_items.get(name_attribute)
+            if sorted_items is None or sorted_items[0] is not items:
+                sorted_items = self._sorted_items[name_attribute] = (items, sorted(items.values(), key=get_sort_name))
+            results = sorted_items[1]
+
+        return results[offset : offset + limit] if limit is not None else results[offset:]
@@ -0,0 +1,251 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import functools
+import logging
+import random
+import threading
+import time
+
+from django.conf import settings
+from urllib3.exceptions import HTTPError
+
+from parcours_doctoral.services.deadline import (
+    DeadlineExceeded,
+    ServiceUnavailable,
+    get_remaining_time,
+)
+from parcours_doctoral.services.metrics import (
+    CIRCUIT_BREAKER_STATE,
+    CIRCUIT_BREAKER_TRIPS,
+    SERVICE_CALL_RETRIES,
+)
+
+__all__ = [
+    "CircuitBreaker",
+    "CircuitBreakerOpen",
+    "get_circuit_breaker",
+    "is_transient_failure",
+    "reset_circuit_breakers",
+    "resilient",
+]
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_TIMEOUT = 30
+DEFAULT_RETRY_ATTEMPTS = 2
+DEFAULT_RETRY_BASE_DELAY = 0.1
+DEFAULT_RETRY_MAX_DELAY = 1
+
+# Statuses of the responses of a backend which is unavailable or overloaded
+TRANSIENT_STATUSES = {502, 503, 504}
+
+STATE_CLOSED = 'closed'
+STATE_HALF_OPEN = 'half_open'
+STATE_OPEN = 'open'
+
+# Values of the state of the circuit breakers in the metrics
+STATE_VALUES = {
+    STATE_CLOSED: 0,
+    STATE_HALF_OPEN: 1,
+    STATE_OPEN: 2,
+}
+
+
+class CircuitBreakerOpen(ServiceUnavailable):
+    """The backend has failed too many times recently, so it is not called until the reset timeout has elapsed."""
+
+    outcome = 'circuit_open'
+    status = 503
+
+    def __init__(self, backend, group):
+        self.backend = backend
+        self.group = group
+        super().__init__(f'The circuit breaker of {backend} ({group}) is open')
+
+
+def is_transient_failure(exception):
+    """Return if the exception means that the backend is unreachable, too slow or unavailable."""
+    if isinstance(exception, (HTTPError, ConnectionError, TimeoutError)):
+        return True
+    return getattr(exception, 'status', None) in TRANSIENT_STATUSES
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker of an endpoint group of a backend.
+
+    After PARCOURS_DOCTORAL_CIRCUIT_BREAKER_THRESHOLD consecutive transient failures (0 to disable the breakers), the
+    breaker is opened and the calls fail immediately with CircuitBreakerOpen. Once
+    PARCOURS_DOCTORAL_CIRCUIT_BREAKER_RESET_TIMEOUT seconds have elapsed, a single call is let through: the breaker is
+    closed if it succeeds and opened again otherwise.
+    """
+
+    def __init__(self, backend, group):
+        self.backend = backend
+        self.group = group
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self._lock = threading.Lock()
+
+    @property
+    def labels(self):
+        return self.backend, self.group
+
+    @property
+    def threshold(self):
+        return getattr(settings, 'PARCOURS_DOCTORAL_CIRCUIT_BREAKER_THRESHOLD', DEFAULT_FAILURE_THRESHOLD)
+
+    @property
+    def reset_timeout(self):
+        return getattr(settings, 'PARCOURS_DOCTORAL_CIRCUIT_BREAKER_RESET_TIMEOUT', DEFAULT_RESET_TIMEOUT)
+
+    def _set_state(self, state):
+        self.state = state
+        CIRCUIT_BREAKER_STATE.labels(*self.labels).set(STATE_VALUES[state])
+
+    def allow(self):
+        """Raise CircuitBreakerOpen if the backend must not be called now."""
+        if not self.threshold:
+            return
+        with self._lock:
+            if self.state == STATE_CLOSED:
+                return
+            if self.state == STATE_OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                # Let a single call check if the backend has recovered
+                self._set_state(STATE_HALF_OPEN)
+                return
+            raise CircuitBreakerOpen(self.backend, self.group)
+
+    def release_trial(self):
+        """Let another call check if the backend has recovered, the trial call having been interrupted."""
+        with self._lock:
+            if self.state == STATE_HALF_OPEN:
+                # The reset timeout has already elapsed since the breaker has been opened
+                self._set_state(STATE_OPEN)
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            if self.state != STATE_CLOSED:
+                logger.info('The circuit breaker of %s (%s) is closed', self.backend, self.group)
+                self._set_state(STATE_CLOSED)
+
+    def record_failure(self):
+        threshold = self.threshold
+        with self._lock:
+            self.failures += 1
+            if self.state == STATE_HALF_OPEN or (threshold and self.failures >= threshold):
+                if self.state != STATE_OPEN:
+                    logger.warning(
+                        'The circuit breaker of %s (%s) is open after %s failures',
+                        self.backend,
+                        self.group,
+                        self.failures,
+                    )
+                    CIRCUIT_BREAKER_TRIPS.labels(*self.labels).inc()
+                self.opened_at = time.monotonic()
+                self._set_state(STATE_OPEN)
+
+    def reset(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._set_state(STATE_CLOSED)
+
+
+_circuit_breakers = {}
+_circuit_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(backend, group) -> CircuitBreaker:
+    """Return the process-wide circuit breaker of the endpoint group of the backend."""
+    breaker = _circuit_breakers.get((backend, group))
+    if breaker is None:
+        with _circuit_breakers_lock:
+            breaker = _circuit_breakers.setdefault((backend, group), CircuitBreaker(backend, group))
+    return breaker
+
+
+def reset_circuit_breakers():
+    """Close all the circuit breakers of the process."""
+    with _circuit_breakers_lock:
+        breakers = list(_circuit_breakers.values())
+    for breaker in breakers:
+        breaker.reset()
+
+
+def get_retry_delay(attempt):
+    """Return the delay before a retry, exponential with full jitter so that the clients do not retry together."""
+    base_delay = getattr(settings, 'PARCOURS_DOCTORAL_RETRY_BASE_DELAY', DEFAULT_RETRY_BASE_DELAY)
+    max_delay = getattr(settings, 'PARCOURS_DOCTORAL_RETRY_MAX_DELAY', DEFAULT_RETRY_MAX_DELAY)
+    return random.uniform(0, min(max_delay, base_delay * 2**attempt))
+
+
+def resilient(func, backend, group, service_name, method_name, idempotent=False):
+    """
+    Protect the calls of the decorated service method with the circuit breaker of the endpoint group of the backend.
+
+    The idempotent methods are called again, up to PARCOURS_DOCTORAL_RETRY_ATTEMPTS times, after a transient failure,
+    if there is enough time left before the deadline of the request. The nested service calls which have not been made
+    (see ServiceUnavailable) are not failures of the backend.
+    """
+    breaker = get_circuit_breaker(backend, group)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        attempts = getattr(settings, 'PARCOURS_DOCTORAL_RETRY_ATTEMPTS', DEFAULT_RETRY_ATTEMPTS) if idempotent else 0
+        attempt = 0
+        while True:
+            breaker.allow()
+            try:
+                result = func(*args, **kwargs)
+            except ServiceUnavailable:
+                # The backend has not been given enough time to answer, or a nested call has not been made, so its
+                # availability is still unknown
+                breaker.release_trial()
+                raise
+            except Exception as exception:
+                if not is_transient_failure(exception):
+                    # The backend has answered, so it is available
+                    breaker.record_success()
+                    raise
+                breaker.record_failure()
+                if attempt >= attempts or breaker.state == STATE_OPEN:
+                    raise
+            else:
+                breaker.record_success()
+                return result
+            delay = get_retry_delay(attempt)
+            remaining_time = get_remaining_time()
+            if remaining_time is not None and remaining_time <= delay:
+                raise DeadlineExceeded
+            time.sleep(delay)
+            attempt += 1
+            SERVICE_CALL_RETRIES.labels(service_name, method_name).inc()
+
+    return wrapper
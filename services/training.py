@@ -36,7 +36,8 @@ from frontoffice.settings.osis_sdk.utils import (
     MultipleApiBusinessException,
     build_mandatory_auth_headers,
 )
-from parcours_doctoral.services.mixins import ServiceMeta
+from parcours_doctoral.services.clients import get_api_client
+from parcours_doctoral.services.mixins import ServiceMeta, request_cached
 from parcours_doctoral.utils.utils import to_snake_case
 
 OBJECT_TYPE_PAPER = 'Paper'
@@ -45,7 +46,7 @@ OBJECT_TYPE_PAPER = 'Paper'
 class APIClient:
     def __new__(cls):
         api_config = parcours_doctoral_sdk.build_configuration()
-        return doctorate_api.DoctorateApi(osis_parcours_doctoral_sdk.ApiClient(configuration=api_config))
+        return doctorate_api.DoctorateApi(get_api_client(osis_parcours_doctoral_sdk, api_config))
 
 
 class ActivityApiBusinessException(ApiBusinessException):
@@ -58,6 +59,7 @@ class DoctorateTrainingService(metaclass=ServiceMeta):
     api_exception_cls = osis_parcours_doctoral_sdk.ApiException
 
     @classmethod
+    @request_cached
     def get_config(cls, person, uuid):
         return APIClient().retrieve_doctoral_training_config(
             uuid=uuid,
@@ -65,6 +67,7 @@ class DoctorateTrainingService(metaclass=ServiceMeta):
         )
 
     @classmethod
+    @request_cached
     def list_doctoral_training(cls, person, uuid):
         return APIClient().list_doctoral_training(
             uuid=uuid,
@@ -72,6 +75,7 @@ class DoctorateTrainingService(metaclass=ServiceMeta):
         )
 
     @classmethod
+    @request_cached
     def list_complementary_training(cls, person, uuid):
         return APIClient().list_complementary_training(
             uuid=uuid,
@@ -79,6 +83,7 @@ class DoctorateTrainingService(metaclass=ServiceMeta):
         )
 
     @classmethod
+    @request_cached
     def list_course_enrollment(cls, person, uuid):
         return APIClient().list_course_enrollment(
             uuid=uuid,
@@ -86,6 +91,7 @@ class DoctorateTrainingService(metaclass=ServiceMeta):
         )
 
     @classmethod
+    @request_cached
     def list_assessment_enrollment(cls, person, uuid):
         return APIClient().list_inscription_evaluation_dtos(
             uuid=uuid,
@@ -93,6 +99,7 @@ class DoctorateTrainingService(metaclass=ServiceMeta):
         )
 
     @classmethod
+    @request_cached
     def retrieve_assessment_enrollment(cls, person, uuid, enrollment_uuid):
         return APIClient().retrieve_inscription_evaluation_dto(
             uuid=uuid,
@@ -101,6 +108,7 @@ class DoctorateTrainingService(metaclass=ServiceMeta):
         )
 
     @classmethod
+    @request_cached
     def retrieve_activity(cls, person, doctorate_uuid, activity_uuid):
         return APIClient().retrieve_training(
             uuid=doctorate_uuid,
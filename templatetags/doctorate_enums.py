@@ -25,32 +25,78 @@
 # ##############################################################################
 
 from django import template
+from django.utils.translation import get_language
 from django.utils.translation import gettext_lazy as _
 
 from base.models.utils.utils import ChoiceEnum
+import parcours_doctoral.contrib.enums  # noqa: F401 (defines all the needed enums)
 
 register = template.Library()
 
 
+class EnumRegistry:
+    """
+    Index of the choice enums by name, whose labels are rendered once by language, so that the enum filters find the
+    labels of the values with dictionary lookups.
+    """
+
+    def __init__(self):
+        self._enums = {}
+        self._subclasses_count = 0
+        self._labels = {}
+        self.index()
+
+    def index(self):
+        subclasses = ChoiceEnum.__subclasses__()
+        enums = {}
+        for enum in subclasses:
+            # As with a scan of the subclasses, the first enum of a name wins
+            enums.setdefault(enum.__name__, enum)
+        self._enums = enums
+        self._subclasses_count = len(subclasses)
+
+    def clear(self):
+        """Forget the indexed enums and their labels, which are indexed again on the next lookup."""
+        self._enums = {}
+        self._subclasses_count = 0
+        self._labels = {}
+
+    def get_enum(self, enum_name):
+        enum = self._enums.get(enum_name)
+        if enum is None and len(ChoiceEnum.__subclasses__()) != self._subclasses_count:
+            # Some enums have been defined since the last indexing
+            self.index()
+            enum = self._enums.get(enum_name)
+        return enum
+
+    def get_labels(self, enum):
+        """Return the labels of the values of the enum in the current language, by name."""
+        key = (enum, get_language())
+        labels = self._labels.get(key)
+        if labels is None:
+            labels = self._labels[key] = {member.name: str(member.value) for member in enum}
+        return labels
+
+
+enum_registry = EnumRegistry()
+
+
 @register.filter
 def enum_display(value, enum_name):
-    if hasattr(value, "__str__"):
-        # Import all needed enums
-        __import__('parcours_doctoral.contrib.enums')
-        for enum in ChoiceEnum.__subclasses__():
-            if enum.__name__ == enum_name:
-                return enum.get_value(str(value))
+    enum = enum_registry.get_enum(enum_name)
+    if enum is not None:
+        value = str(value)
+        return enum_registry.get_labels(enum).get(value, value)
     return value or ''
 
 
 @register.filter
 def multiple_enum_display(values, enum_name):
     if values:
-        # Import all needed enums
-        __import__('parcours_doctoral.contrib.enums')
-        for enum in ChoiceEnum.__subclasses__():
-            if enum.__name__ == enum_name:
-                return ", ".join([str(enum.get_value(value)) for value in values])
+        enum = enum_registry.get_enum(enum_name)
+        if enum is not None:
+            labels = enum_registry.get_labels(enum)
+            return ", ".join([str(labels.get(value, value)) for value in values])
     return ', '.join(values)
 
 
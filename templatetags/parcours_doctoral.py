@@ -30,10 +30,8 @@ from contextlib import suppress
 from dataclasses import dataclass
 from inspect import getfullargspec
 
-import waffle
 from django import template
 from django.conf import settings
-from django.core.exceptions import ImproperlyConfigured
 from django.core.validators import EMPTY_VALUES
 from django.template.defaultfilters import force_escape
 from django.utils.safestring import SafeString, mark_safe
@@ -57,12 +55,15 @@ from parcours_doctoral.contrib.enums.training import (
     StatutActivite,
 )
 from parcours_doctoral.contrib.forms.supervision import DoctorateMemberSupervisionForm
+from parcours_doctoral.services.deadline import optional_lookup
 from parcours_doctoral.services.reference import (
     CountriesService,
     LanguageService,
     SuperiorInstituteService,
 )
 from parcours_doctoral.utils import format_school_title, to_snake_case
+from parcours_doctoral.utils.permissions import get_doctorate_permissions
+from parcours_doctoral.utils.templates import get_inline_template
 
 register = template.Library()
 
@@ -158,37 +159,80 @@ TAB_TREE = {
 }
 
 
+class TabTreeIndex:
+    """
+    Indexes of a tab tree, compiled once, to find the parent and the tab of a tab name without scanning the tree.
+    The labels of the tabs are also rendered once by language.
+    """
+
+    def __init__(self, tab_tree):
+        self.tab_tree = tab_tree
+        self.children_by_parent = {parent: list(children) for parent, children in tab_tree.items()}
+        self.parent_by_tab_name = {}
+        self.tab_by_name = {}
+        for parent, children in tab_tree.items():
+            for child in children:
+                # As with a scan of the tree, the first tab of a name wins
+                self.parent_by_tab_name.setdefault(child.name, parent)
+                self.tab_by_name.setdefault(child.name, child)
+        # The tabs are identified by their memory addresses as a parent tab and its child can share the same name
+        self._tabs_by_id = {id(tab): tab for parent, children in tab_tree.items() for tab in [parent, *children]}
+        self._labels_by_language = {}
+
+    def get_parent(self, tab_name):
+        return self.parent_by_tab_name.get(tab_name)
+
+    def get_tab(self, tab_name):
+        return self.tab_by_name.get(tab_name)
+
+    def get_children(self, tab_name):
+        return self.children_by_parent.get(self.get_parent(tab_name), [])
+
+    def get_label(self, tab):
+        """Return the label of the tab in the current language."""
+        if self._tabs_by_id.get(id(tab)) is not tab:
+            return getattr(tab, 'label', '')
+        language = get_language()
+        labels = self._labels_by_language.get(language)
+        if labels is None:
+            labels = self._labels_by_language[language] = {
+                tab_id: str(tab.label) for tab_id, tab in self._tabs_by_id.items()
+            }
+        return labels[id(tab)]
+
+
+TAB_TREE_INDEX = TabTreeIndex(TAB_TREE)
+
+
 def _get_active_parent(tab_tree, tab_name):
+    if tab_tree is TAB_TREE:
+        return TAB_TREE_INDEX.get_parent(tab_name)
     return next(
         (parent for parent, children in tab_tree.items() if any(child.name == tab_name for child in children)),
         None,
     )
 
 
+@register.filter
+def tab_label(tab):
+    """Return the label of the tab, rendered once by language for the tabs of the tab tree."""
+    return TAB_TREE_INDEX.get_label(tab)
+
+
 @register.filter
 def can_make_action(doctorate, action_name):
     """Return true if the specified action can be applied for this doctorate, otherwise return False"""
     if not doctorate:
         return False
-    return 'url' in doctorate.links.get(action_name, {})
+    return get_doctorate_permissions(doctorate).can_make_action(action_name)
 
 
 def _can_access_tab(doctorate, tab_name, actions_by_tab):
     """Return true if the specified tab can be opened for this doctorate, otherwise return False"""
-    try:
-        actions = actions_by_tab[tab_name]
-        if isinstance(actions, str):
-            return can_make_action(doctorate, actions)
-        elif isinstance(actions, list):
-            return any(can_make_action(doctorate, action) for action in actions)
-        raise ImproperlyConfigured(f'{actions} should be a string or a list')
-    except AttributeError:
-        raise ImproperlyConfigured("The doctorate should contain the 'links' property to check tab access")
-    except KeyError:
-        raise ImproperlyConfigured(
-            "Please check that the '{}' property is well specified in the 'READ_ACTIONS_BY_TAB' and"
-            " 'UPDATE_ACTIONS_BY_TAB' constants".format(tab_name)
-        )
+    permissions = get_doctorate_permissions(doctorate)
+    if actions_by_tab is UPDATE_ACTIONS_BY_TAB:
+        return permissions.can_update_tab(tab_name)
+    return permissions.can_read_tab(tab_name)
 
 
 def get_valid_tab_tree(tab_tree, doctorate):
@@ -196,27 +240,7 @@ def get_valid_tab_tree(tab_tree, doctorate):
     Return a tab tree based on the specified one but whose tabs depending on the permissions links.
     """
     if doctorate:
-        valid_tab_tree = {}
-
-        # Some tabs are temporary hidden depending on a switch
-        doctorate_limited_tabs = waffle.switch_is_active('parcours_doctoral_limited_tabs')
-
-        # Loop over the tabs of the original tab tree
-        for parent_tab, sub_tabs in tab_tree.items():
-            if doctorate_limited_tabs and parent_tab.name not in {
-                'doctorate',
-                'training',
-                'course-enrollment',
-                'confirmation-paper',
-            }:
-                continue
-            # Get the accessible sub tabs depending on the user permissions
-            valid_sub_tabs = [tab for tab in sub_tabs if _can_access_tab(doctorate, tab.name, READ_ACTIONS_BY_TAB)]
-            # Only add the parent tab if at least one sub tab is allowed
-            if len(valid_sub_tabs) > 0:
-                valid_tab_tree[parent_tab] = valid_sub_tabs
-
-        return valid_tab_tree
+        return get_doctorate_permissions(doctorate).get_valid_tab_tree(tab_tree)
 
     return tab_tree
 
@@ -254,26 +278,17 @@ def doctorate_tabs(context, doctorate=None, with_submit=False):
 
 @register.simple_tag(takes_context=True)
 def current_subtabs(context):
-    current_tab_name = get_current_tab_name(context)
-    current_tab_tree = TAB_TREE
-    return current_tab_tree.get(_get_active_parent(current_tab_tree, current_tab_name), [])
+    return TAB_TREE_INDEX.get_children(get_current_tab_name(context))
 
 
 @register.simple_tag(takes_context=True)
 def get_current_parent_tab(context):
-    current_tab_name = get_current_tab_name(context)
-    current_tab_tree = TAB_TREE
-    return _get_active_parent(current_tab_tree, current_tab_name)
+    return TAB_TREE_INDEX.get_parent(get_current_tab_name(context))
 
 
 @register.simple_tag(takes_context=True)
 def get_current_tab(context):
-    current_tab_name = get_current_tab_name(context)
-    current_tab_tree = TAB_TREE
-    return next(
-        (tab for subtabs in current_tab_tree.values() for tab in subtabs if tab.name == current_tab_name),
-        None,
-    )
+    return TAB_TREE_INDEX.get_tab(get_current_tab_name(context))
 
 
 @register.inclusion_tag('parcours_doctoral/tags/doctorate_subtabs_bar.html', takes_context=True)
@@ -289,6 +304,12 @@ def doctorate_subtabs(context, doctorate=None, tabs=None):
     }
 
 
+DOCUMENT_VISUALIZER_TEMPLATE = (
+    "{% load osis_document_components %}"
+    "{% if files %}{% document_visualizer files wanted_post_process='ORIGINAL' %}{% endif %}"
+)
+
+
 @register.inclusion_tag('parcours_doctoral/tags/field_data.html')
 def field_data(
     name,
@@ -302,12 +323,7 @@ def field_data(
     tooltip=None,
 ):
     if isinstance(data, list):
-        template_string = (
-            "{% load osis_document_components %}"
-            "{% if files %}{% document_visualizer files wanted_post_process='ORIGINAL' %}{% endif %}"
-        )
-        template_context = {'files': data}
-        data = template.Template(template_string).render(template.Context(template_context))
+        data = get_inline_template(DOCUMENT_VISUALIZER_TEMPLATE).render(template.Context({'files': data}))
 
     elif isinstance(data, bool):
         data = _('Yes') if data else _('No')
@@ -348,10 +364,10 @@ def panel(context, title='', title_level=4, additional_class='', **kwargs):
 
 @register.simple_tag(takes_context=True)
 def get_dashboard_links(context):
-    from parcours_doctoral.services.doctorate import DoctorateService
+    from parcours_doctoral.services.dashboard import get_dashboard_links
 
     with suppress(UnauthorizedException, NotFoundException, ForbiddenException):
-        return DoctorateService.get_dashboard_links(context['request'].user.person)
+        return get_dashboard_links(context['request'].user.person)
     return {}
 
 
@@ -581,8 +597,9 @@ def snake_case(value):
 
 
 @register.simple_tag(takes_context=True)
+@optional_lookup(lambda context, iso_code: iso_code or '')
 def get_country_name(context, iso_code: str):
-    """Return the country name."""
+    """Return the country name, or its iso code if it cannot be loaded within the deadline of the request."""
     if not iso_code:
         return ''
     translated_field = 'name' if get_language() == settings.LANGUAGE_CODE else 'name_en'
@@ -640,8 +657,12 @@ def value_if_any(value, *conditions):
 
 
 @register.simple_tag(takes_context=True)
+@optional_lookup(lambda context, code: code or '')
 def get_language_name(context, code):
-    """Return the label of the language associated to the iso code."""
+    """
+    Return the label of the language associated to the iso code, or the code if the language cannot be loaded within
+    the deadline of the request.
+    """
     if not code:
         return ''
     language = LanguageService.get_language(code=code, person=context['request'].user.person)
@@ -651,8 +672,12 @@ def get_language_name(context, code):
 
 
 @register.simple_tag(takes_context=True)
+@optional_lookup(lambda context, organisation_uuid: organisation_uuid or '')
 def get_superior_institute_name(context, organisation_uuid):
-    """Return the label of the institute associated to the uuid."""
+    """
+    Return the label of the institute associated to the uuid, or the uuid if the institute cannot be loaded within the
+    deadline of the request.
+    """
     if not organisation_uuid:
         return ''
     institute = SuperiorInstituteService.get_superior_institute(
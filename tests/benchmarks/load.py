@@ -0,0 +1,209 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from django.db import connections
+from django.shortcuts import resolve_url
+from django.test import Client
+
+from parcours_doctoral.services.context import service_request_context
+from parcours_doctoral.tests.benchmarks.results import percentile
+
+__all__ = [
+    "Journey",
+    "JourneyStatistics",
+    "LoadDriver",
+    "Persona",
+    "Step",
+    "format_report",
+]
+
+
+@dataclass(frozen=True)
+class Step:
+    url_name: str
+    kwargs: Dict = field(default_factory=dict)
+    query: str = ''
+    method: str = 'get'
+    data: Optional[Dict] = None
+
+    def get_url(self):
+        url = resolve_url(self.url_name, **self.kwargs)
+        return f'{url}?{self.query}' if self.query else url
+
+
+@dataclass
+class Persona:
+    """A kind of user of the portal: a student, a promoter, or an external member using a token (no user)."""
+
+    name: str
+    user: Optional[object] = None
+
+    def get_client(self):
+        client = Client()
+        if self.user is not None:
+            client.force_login(self.user)
+        return client
+
+
+@dataclass
+class Journey:
+    """A sequence of pages visited by a persona, chosen among the other journeys depending on its weight."""
+
+    name: str
+    persona: Persona
+    steps: List[Step]
+    weight: int = 1
+
+
+@dataclass
+class JourneyStatistics:
+    name: str
+    runs: int = 0
+    requests: int = 0
+    errors: int = 0
+    backend_calls: int = 0
+    durations: List[float] = field(default_factory=list)
+    error_messages: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def error_rate(self):
+        return self.errors / self.requests if self.requests else 0
+
+    @property
+    def backend_calls_per_run(self):
+        return self.backend_calls / self.runs if self.runs else 0
+
+
+class LoadDriver:
+    """
+    Replay the journeys concurrently with the Django test client, each worker choosing the journeys randomly depending
+    on their weights, and collect the statistics of each journey: the duration of the runs, the errors (responses
+    whose status is at least 400 and exceptions) and the backend calls made by the service layer.
+
+    The users of the personas must be visible to the other threads, so a TransactionTestCase is needed.
+    """
+
+    def __init__(self, journeys, concurrency=10, runs_per_worker=10, duration=None, seed=None):
+        self.journeys = journeys
+        self.concurrency = concurrency
+        self.runs_per_worker = runs_per_worker
+        self.duration = duration
+        self.seed = seed
+        self.statistics = {journey.name: JourneyStatistics(journey.name) for journey in journeys}
+        self.lock = threading.Lock()
+        self.elapsed = 0
+
+    @property
+    def throughput(self):
+        """Return the number of requests processed by second."""
+        requests = sum(statistics.requests for statistics in self.statistics.values())
+        return requests / self.elapsed if self.elapsed else 0
+
+    def run_step(self, client, step):
+        """Return the error of the step if any, and the number of backend calls it has made."""
+        with service_request_context() as context:
+            try:
+                response = getattr(client, step.method)(step.get_url(), data=step.data)
+                error = f'{step.url_name}: HTTP {response.status_code}' if response.status_code >= 400 else None
+            except Exception as exception:
+                error = f'{step.url_name}: {type(exception).__name__}'
+        return error, sum(call.requests for call in context.calls)
+
+    def run_journey(self, clients, journey):
+        errors, backend_calls, error_messages = 0, 0, []
+        start = time.perf_counter()
+        for step in journey.steps:
+            error, step_backend_calls = self.run_step(clients[journey.persona.name], step)
+            backend_calls += step_backend_calls
+            if error:
+                errors += 1
+                error_messages.append(error)
+        duration = time.perf_counter() - start
+
+        with self.lock:
+            statistics = self.statistics[journey.name]
+            statistics.runs += 1
+            statistics.requests += len(journey.steps)
+            statistics.errors += errors
+            statistics.backend_calls += backend_calls
+            statistics.durations.append(duration)
+            for message in error_messages:
+                statistics.error_messages[message] = statistics.error_messages.get(message, 0) + 1
+
+    def run_worker(self, index, clients, deadline):
+        randomizer = random.Random(None if self.seed is None else self.seed + index)
+        weights = [journey.weight for journey in self.journeys]
+        try:
+            for _ in range(self.runs_per_worker):
+                if deadline is not None and time.perf_counter() >= deadline:
+                    break
+                self.run_journey(clients, randomizer.choices(self.journeys, weights)[0])
+        finally:
+            connections.close_all()
+
+    def run(self):
+        # The clients are logged in before the workers start, one by persona for each worker
+        personas = {journey.persona.name: journey.persona for journey in self.journeys}
+        workers_clients = [
+            {name: persona.get_client() for name, persona in personas.items()} for _ in range(self.concurrency)
+        ]
+
+        start = time.perf_counter()
+        deadline = start + self.duration if self.duration else None
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            futures = [
+                executor.submit(self.run_worker, index, clients, deadline)
+                for index, clients in enumerate(workers_clients)
+            ]
+            for future in futures:
+                future.result()
+        self.elapsed = time.perf_counter() - start
+        return self.statistics
+
+
+def format_report(driver):
+    """Return the statistics of the journeys as a text table."""
+    lines = [
+        f"{'journey':<30} {'runs':>6} {'requests':>9} {'errors':>7} {'error rate':>11} {'p50 (ms)':>10}"
+        f" {'p95 (ms)':>10} {'backend calls':>14}"
+    ]
+    for statistics in driver.statistics.values():
+        durations = statistics.durations or [0]
+        lines.append(
+            f'{statistics.name:<30} {statistics.runs:>6} {statistics.requests:>9} {statistics.errors:>7}'
+            f' {statistics.error_rate:>11.1%} {percentile(durations, 50) * 1000:>10.1f}'
+            f' {percentile(durations, 95) * 1000:>10.1f} {statistics.backend_calls_per_run:>14.1f}'
+        )
+        for message, count in sorted(statistics.error_messages.items()):
+            lines.append(f'    {count} x {message}')
+    lines.append(f'{driver.concurrency} workers, {driver.elapsed:.1f} s, {driver.throughput:.1f} requests/s')
+    return '\n'.join(lines)
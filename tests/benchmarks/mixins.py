@@ -0,0 +1,93 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from django.core.cache import cache
+from django.test import modify_settings, override_settings
+
+from parcours_doctoral.checks import MIDDLEWARE_PATH
+from parcours_doctoral.services import cache as data_cache
+from parcours_doctoral.services import reference_index, resilience
+from parcours_doctoral.services.clients import api_client_registry
+from parcours_doctoral.services.dashboard import DEFAULT_DASHBOARD_LINKS_TIMEOUT
+from parcours_doctoral.services.documents import DEFAULT_DOCUMENT_TOKEN_TIMEOUT
+from parcours_doctoral.services.doctorate import doctorate_cache
+from parcours_doctoral.services.pdf import pdf_delivery_cache
+from parcours_doctoral.services.reference import (
+    countries_index,
+    languages_index,
+    reference_data_cache,
+)
+from parcours_doctoral.tests.benchmarks.payloads import (
+    PARCOURS_DOCTORAL_PREFIX,
+    REFERENCE_PREFIX,
+    add_payloads,
+)
+from parcours_doctoral.tests.benchmarks.stub_backend import StubBackend
+
+
+def benchmark_settings(test_class):
+    """
+    Measure the decorated test class in the configuration of production, whatever the settings of the other tests:
+    the service context middleware is installed, and the caches, the reference indexes and the resilience of the
+    service calls are enabled with their default values.
+    """
+    test_class = override_settings(
+        CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'benchmarks'}},
+        PARCOURS_DOCTORAL_REFERENCE_CACHE_TIMEOUT=data_cache.DEFAULT_TIMEOUT,
+        PARCOURS_DOCTORAL_REFERENCE_INDEX_TIMEOUT=reference_index.DEFAULT_TIMEOUT,
+        PARCOURS_DOCTORAL_DOCTORATE_CACHE_TIMEOUT=data_cache.DEFAULT_DOCTORATE_TIMEOUT,
+        PARCOURS_DOCTORAL_DOCUMENT_TOKEN_CACHE_TIMEOUT=DEFAULT_DOCUMENT_TOKEN_TIMEOUT,
+        PARCOURS_DOCTORAL_DASHBOARD_LINKS_CACHE_TIMEOUT=DEFAULT_DASHBOARD_LINKS_TIMEOUT,
+        PARCOURS_DOCTORAL_CIRCUIT_BREAKER_THRESHOLD=resilience.DEFAULT_FAILURE_THRESHOLD,
+        PARCOURS_DOCTORAL_RETRY_ATTEMPTS=resilience.DEFAULT_RETRY_ATTEMPTS,
+    )(test_class)
+    return modify_settings(MIDDLEWARE={'append': MIDDLEWARE_PATH})(test_class)
+
+
+class StubBackendMixin:
+    def start_stub_backend(self, latency=0.0):
+        """Start a stub backend serving the payloads of the doctorate fixtures and point the SDK clients to it."""
+        # The data cached by the previous tests must not be measured
+        cache.clear()
+        reference_data_cache.clear_local()
+        doctorate_cache.clear()
+        pdf_delivery_cache.clear()
+        countries_index.clear()
+        languages_index.clear()
+
+        self.backend = StubBackend(latency=latency)
+        add_payloads(self.backend, self)
+        self.backend.start()
+        self.addCleanup(self.backend.stop)
+
+        settings_override = override_settings(
+            OSIS_PARCOURS_DOCTORAL_SDK_HOST=self.backend.url + PARCOURS_DOCTORAL_PREFIX,
+            OSIS_REFERENCE_SDK_HOST=self.backend.url + REFERENCE_PREFIX,
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        # The clients are kept by host, so the ones of this backend must not be reused after it has been stopped
+        self.addCleanup(api_client_registry.clear)
+        return self.backend
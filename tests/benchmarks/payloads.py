@@ -0,0 +1,310 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import datetime
+import uuid
+
+import osis_parcours_doctoral_sdk
+import osis_reference_sdk
+from osis_parcours_doctoral_sdk.api.doctorate_api import DoctorateApi
+from osis_parcours_doctoral_sdk.model.admissibility_dto import AdmissibilityDTO
+from osis_parcours_doctoral_sdk.model.authorization_distribution_dto import (
+    AuthorizationDistributionDTO,
+)
+from osis_parcours_doctoral_sdk.model.confirmation_paper_dto import (
+    ConfirmationPaperDTO,
+)
+from osis_parcours_doctoral_sdk.model.detail_signature_membre_cadto_nested import (
+    DetailSignatureMembreCADTONested,
+)
+from osis_parcours_doctoral_sdk.model.detail_signature_promoteur_dto_nested import (
+    DetailSignaturePromoteurDTONested,
+)
+from osis_parcours_doctoral_sdk.model.inscription_evaluation_dto import (
+    InscriptionEvaluationDTO,
+)
+from osis_parcours_doctoral_sdk.model.membre_cadto_nested import MembreCADTONested
+from osis_parcours_doctoral_sdk.model.private_defense_dto import PrivateDefenseDTO
+from osis_parcours_doctoral_sdk.model.promoteur_dto_nested import PromoteurDTONested
+from osis_parcours_doctoral_sdk.model.signataire_autorisation_diffusion_these_dto_nested import (
+    SignataireAutorisationDiffusionTheseDTONested,
+)
+from osis_parcours_doctoral_sdk.model.signature_autorisation_diffusion_these_dto_nested import (
+    SignatureAutorisationDiffusionTheseDTONested,
+)
+from osis_parcours_doctoral_sdk.model.supervision_dto import SupervisionDTO
+from osis_reference_sdk.api.academic_years_api import AcademicYearsApi
+from osis_reference_sdk.api.countries_api import CountriesApi
+from osis_reference_sdk.api.languages_api import LanguagesApi
+from osis_reference_sdk.api.scholarship_api import ScholarshipApi
+from osis_reference_sdk.api.superior_non_universities_api import (
+    SuperiorNonUniversitiesApi,
+)
+from osis_reference_sdk.api.universities_api import UniversitiesApi
+
+from parcours_doctoral.contrib.enums import (
+    CategorieActivite,
+    ChoixEtatSignature,
+    RoleActeur,
+    Session,
+    StatutInscriptionEvaluation,
+    TypeModalitesDiffusionThese,
+)
+
+__all__ = [
+    "PARCOURS_DOCTORAL_PREFIX",
+    "REFERENCE_PREFIX",
+    "add_payloads",
+]
+
+PARCOURS_DOCTORAL_PREFIX = '/parcours_doctoral'
+REFERENCE_PREFIX = '/reference'
+
+
+def paginated(results):
+    return {'count': len(results), 'next': None, 'previous': None, 'results': results}
+
+
+def get_supervision(test_case):
+    def get_promoter(index):
+        return DetailSignaturePromoteurDTONested._from_openapi_data(
+            promoteur=PromoteurDTONested._from_openapi_data(
+                uuid=f'uuid-promoter-{index}',
+                matricule=f'01234567{index:02}',
+                prenom='Marie-Odile',
+                nom=f'Troufignon {index}',
+                est_docteur=True,
+                email='',
+                institution='',
+                ville='',
+                code_pays='',
+                pays='',
+                est_externe=False,
+                langue='fr-be',
+            ),
+            pdf=[],
+            statut=ChoixEtatSignature.APPROVED.name,
+            commentaire_externe='A public comment to display',
+        )
+
+    return SupervisionDTO._from_openapi_data(
+        signatures_promoteurs=[get_promoter(index) for index in range(3)],
+        signatures_membres_ca=[
+            DetailSignatureMembreCADTONested._from_openapi_data(
+                membre_ca=MembreCADTONested._from_openapi_data(
+                    uuid=f'uuid-{test_case.person.global_id}',
+                    matricule=test_case.person.global_id,
+                    prenom='Jacques-Eudes',
+                    nom='Birlimpette',
+                    est_docteur=True,
+                    email='',
+                    institution='',
+                    ville='',
+                    code_pays='',
+                    pays='',
+                    est_externe=False,
+                    langue='fr-be',
+                ),
+                pdf=[],
+                statut=ChoixEtatSignature.INVITED.name,
+            ),
+        ],
+        promoteur_reference='uuid-promoter-0',
+    )
+
+
+def get_confirmation_paper(index):
+    return ConfirmationPaperDTO._from_openapi_data(
+        uuid=f'c{index}',
+        date_limite=datetime.date(2022, 6, 10 - index),
+        date=datetime.date(2022, 4, 3 - index),
+        rapport_recherche=[],
+        avis_renouvellement_mandat_recherche=[],
+        proces_verbal_ca=[],
+        attestation_reussite=[],
+        attestation_echec=[],
+        canevas_proces_verbal_ca=[],
+    )
+
+
+def get_authorization_distribution(test_case):
+    return AuthorizationDistributionDTO._from_openapi_data(
+        uuid=test_case.doctorate_uuid,
+        statut='DIFFUSION_NON_SOUMISE',
+        sources_financement='Sources',
+        resume_anglais='Summary in english',
+        resume_autre_langue='Summary in another language',
+        mots_cles=['word-1', 'word-2'],
+        type_modalites_diffusion=TypeModalitesDiffusionThese.ACCES_EMBARGO.name,
+        limitations_additionnelles_chapitres='Limitations',
+        signataires=[
+            SignataireAutorisationDiffusionTheseDTONested._from_openapi_data(
+                uuid=str(uuid.uuid4()),
+                matricule='0123456789',
+                prenom='John',
+                nom='Doe',
+                email='john.doe@uclouvain.be',
+                genre='H',
+                institution='UCLouvain',
+                role=RoleActeur.PROMOTEUR.name,
+                signature=SignatureAutorisationDiffusionTheseDTONested._from_openapi_data(
+                    etat=ChoixEtatSignature.INVITED.name,
+                    date_heure=datetime.datetime(2025, 1, 1, 11, 30),
+                    commentaire_externe='External comment',
+                    commentaire_interne='Internal comment',
+                    motif_refus='Refusal reason',
+                ),
+            )
+        ],
+        date_embargo=datetime.date(2025, 1, 1),
+        modalites_diffusion_acceptees_le=datetime.date(2024, 1, 1),
+    )
+
+
+def get_superior_institute(index):
+    return {
+        'uuid': str(uuid.uuid4()),
+        'name': f'Institute {index}',
+        'street': 'Place de l\'université',
+        'street_number': str(index),
+        'zipcode': '1348',
+        'city': 'Louvain-La-Neuve',
+    }
+
+
+def get_training_config():
+    categories = [name for name in CategorieActivite.get_names() if name != CategorieActivite.UCL_COURSE.name]
+    return {
+        'category_labels': {'fr-be': categories, 'en': categories},
+        'enabled_categories': categories,
+        'creatable_papers_types': [],
+    }
+
+
+def get_parcours_doctoral_payloads(test_case):
+    """Return the payloads of the operations of the parcours doctoral backend used by the tabs, by operation id."""
+    doctorate = test_case.get_doctorate_object()
+    supervision = get_supervision(test_case)
+    jury = test_case.get_jury_object()
+    return {
+        'list_doctorates': [doctorate],
+        'list_supervised_doctorates': [doctorate],
+        'doctorate_retrieve': doctorate,
+        'retrieve_supervision': supervision,
+        'retrieve_external_doctorate_supervision': {'parcours_doctoral': doctorate, 'supervision': supervision},
+        'get_external_jury': {'parcours_doctoral': doctorate, 'jury': jury},
+        'retrieve_jury_preparation': jury,
+        'list_jury_members': jury.membres,
+        'retrieve_confirmation_papers': [get_confirmation_paper(index) for index in range(3)],
+        'retrieve_last_confirmation_paper': get_confirmation_paper(0),
+        'retrieve_admissibilities': [
+            AdmissibilityDTO._from_openapi_data(
+                parcours_doctoral_uuid=test_case.doctorate_uuid,
+                uuid=f'a{index}',
+                est_active=index == 0,
+                proces_verbal=[],
+                canevas_proces_verbal=[],
+                avis_jury=[],
+                date_decision=datetime.date(2025 - index, 11, 1),
+                date_envoi_manuscrit=datetime.date(2025 - index, 11, 10),
+            )
+            for index in range(2)
+        ],
+        'retrieve_private_defenses': [
+            PrivateDefenseDTO._from_openapi_data(
+                parcours_doctoral_uuid=test_case.doctorate_uuid,
+                uuid=f'p{index}',
+                est_active=index == 0,
+                titre_these=f'Thesis title {index}',
+                lieu='Louvain-La-Neuve',
+                proces_verbal=[],
+                canevas_proces_verbal=[],
+            )
+            for index in range(2)
+        ],
+        'retrieve_authorization_distribution': get_authorization_distribution(test_case),
+        'retrieve_doctoral_training_config': get_training_config(),
+        'list_doctoral_training': [],
+        'list_complementary_training': [],
+        'list_course_enrollment': [],
+        'list_inscription_evaluation_dtos': [
+            InscriptionEvaluationDTO._from_openapi_data(
+                uuid=str(uuid.uuid4()),
+                session=session.name,
+                inscription_tardive=False,
+                desinscription_tardive=False,
+                uuid_activite=str(uuid.uuid4()),
+                statut=StatutInscriptionEvaluation.ACCEPTEE.name,
+                code_unite_enseignement=f'LABC{index}',
+                intitule_unite_enseignement=f'Learning unit {index}',
+                annee_unite_enseignement=2024,
+            )
+            for index, session in enumerate([Session.JANUARY, Session.JUNE, Session.SEPTEMBER])
+        ],
+    }
+
+
+def get_reference_payloads(test_case):
+    """Return the payloads of the operations of the reference backend used by the tabs, by api and operation id."""
+    return {
+        (CountriesApi, 'countries_list'): paginated(test_case.get_countries().results),
+        (LanguagesApi, 'languages_list'): paginated(
+            [
+                {'code': 'FR', 'name': 'Français', 'name_en': 'French'},
+                {'code': 'EN', 'name': 'Anglais', 'name_en': 'English'},
+            ]
+        ),
+        (UniversitiesApi, 'university_read'): get_superior_institute(0),
+        (UniversitiesApi, 'universities_list'): paginated([get_superior_institute(index) for index in range(20)]),
+        (SuperiorNonUniversitiesApi, 'superior_non_universities_list'): paginated(
+            [get_superior_institute(index) for index in range(20, 30)]
+        ),
+        (ScholarshipApi, 'retrieve_scholarship'): {
+            'uuid': test_case.scholarship_uuid,
+            'short_name': 'DS1',
+            'long_name': 'Doctorate Scholarship 1',
+            'type': 'BOURSE_INTERNATIONALE_DOCTORAT',
+        },
+        (AcademicYearsApi, 'get_academic_years'): paginated(
+            [
+                {'year': year, 'start_date': f'{year}-09-15', 'end_date': f'{year + 1}-09-30'}
+                for year in range(2018, 2026)
+            ]
+        ),
+    }
+
+
+def add_payloads(backend, test_case):
+    """Serve the payloads used by the doctorate tabs, built from the fixtures of the test case, on the stub backend."""
+    for operation_id, payload in get_parcours_doctoral_payloads(test_case).items():
+        backend.add_operation(
+            osis_parcours_doctoral_sdk,
+            DoctorateApi,
+            operation_id,
+            payload,
+            prefix=PARCOURS_DOCTORAL_PREFIX,
+        )
+    for (api_class, operation_id), payload in get_reference_payloads(test_case).items():
+        backend.add_operation(osis_reference_sdk, api_class, operation_id, payload, prefix=REFERENCE_PREFIX)
@@ -0,0 +1,198 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import datetime
+import json
+import math
+import os
+import subprocess
+from dataclasses import asdict, dataclass
+
+__all__ = [
+    "BenchmarkRegressionWarning",
+    "BenchmarkResult",
+    "find_regressions",
+    "format_results",
+    "get_benchmark_path",
+    "get_current_commit",
+    "get_previous_results",
+    "load_results",
+    "percentile",
+    "store_report",
+    "store_results",
+]
+
+DEFAULT_RESULTS_PATH = os.path.join('.benchmarks', 'tab_views.jsonl')
+
+# Relative increase above which a measure is considered as a regression
+DEFAULT_TOLERANCE = 0.2
+
+# Measures compared between commits, with the absolute increase ignored whatever the tolerance (noise)
+COMPARED_MEASURES = {
+    'p50': 0.002,
+    'p95': 0.005,
+    'backend_calls': 0,
+    'memory': 64 * 1024,
+}
+
+# Noise of the measures of the micro-benchmarks, whose durations are a few microseconds
+MICRO_COMPARED_MEASURES = {
+    'p50': 0.000001,
+    'p95': 0.000002,
+    'backend_calls': 0,
+    'memory': 1024,
+}
+
+# Factor and number of decimals of the durations in the reports, by unit
+DURATION_UNITS = {
+    'ms': (1000, 1),
+    'us': (1000000, 2),
+}
+
+
+class BenchmarkRegressionWarning(UserWarning):
+    """Warning about the measures which have increased since the previous commit, shown by the test runner."""
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    status: int
+    p50: float
+    p95: float
+    backend_calls: float
+    memory: int
+    commit: str = ''
+    date: str = ''
+
+
+def percentile(values, percent):
+    """Return the percentile of the values, using the nearest-rank method."""
+    values = sorted(values)
+    rank = max(math.ceil(percent / 100 * len(values)), 1)
+    return values[rank - 1]
+
+
+def get_current_commit():
+    """Return the hash of the current commit of the repository (suffixed if there are local changes), if any."""
+    directory = os.path.dirname(os.path.abspath(__file__))
+    try:
+        commit = subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=directory,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        ).strip()
+        changes = subprocess.check_output(
+            ['git', 'status', '--porcelain', '--untracked-files=no'],
+            cwd=directory,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ''
+    return f'{commit}-dirty' if changes else commit
+
+
+def get_results_path():
+    return os.environ.get('PARCOURS_DOCTORAL_BENCHMARK_RESULTS', DEFAULT_RESULTS_PATH)
+
+
+def get_benchmark_path(name):
+    """Return the path of the results of another benchmark than the tab views, stored next to theirs."""
+    return os.path.join(os.path.dirname(get_results_path()) or '.', f'{name}.jsonl')
+
+
+def load_results(path=None):
+    """Return the stored results, from the oldest to the most recent."""
+    path = path or get_results_path()
+    if not os.path.exists(path):
+        return []
+    with open(path) as results_file:
+        return [BenchmarkResult(**json.loads(line)) for line in results_file if line.strip()]
+
+
+def store_results(results, path=None):
+    """Append the results to the stored ones, marked with the current commit and date."""
+    path = path or get_results_path()
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    commit = get_current_commit()
+    date = datetime.datetime.now().isoformat(timespec='seconds')
+    with open(path, 'a') as results_file:
+        for result in results:
+            result.commit, result.date = commit, date
+            results_file.write(json.dumps(asdict(result)) + '\n')
+
+
+def store_report(name, report, path=None):
+    """Write the report of a benchmark next to the stored results, replacing the previous one, and return its path."""
+    directory = os.path.dirname(path or get_results_path()) or '.'
+    os.makedirs(directory, exist_ok=True)
+    report_path = os.path.join(directory, f'{name}.txt')
+    with open(report_path, 'w') as report_file:
+        report_file.write(report + '\n')
+    return report_path
+
+
+def get_previous_results(stored_results, commit):
+    """Return the most recent results of another commit than the specified one, by name."""
+    previous_commit = next((result.commit for result in reversed(stored_results) if result.commit != commit), None)
+    if previous_commit is None:
+        return {}
+    return {result.name: result for result in stored_results if result.commit == previous_commit}
+
+
+def find_regressions(results, previous_results, tolerance=DEFAULT_TOLERANCE, measures=None):
+    """Return the descriptions of the measures (with their noise) which have increased by more than the tolerance."""
+    regressions = []
+    for result in results:
+        previous = previous_results.get(result.name)
+        if previous is None:
+            continue
+        for measure, noise in (measures or COMPARED_MEASURES).items():
+            value, previous_value = getattr(result, measure), getattr(previous, measure)
+            if value - previous_value > max(previous_value * tolerance, noise):
+                regressions.append(
+                    f'{result.name}: {measure} {previous_value:g} -> {value:g} (commit {previous.commit})'
+                )
+    return regressions
+
+
+def format_results(results, previous_results=None, title='view', unit='ms'):
+    """Return the results as a text table, with the durations in the unit, compared to the previous ones if any."""
+    previous_results = previous_results or {}
+    factor, decimals = DURATION_UNITS[unit]
+    lines = [
+        f"{title:<30} {'status':>6} {f'p50 ({unit})':>10} {f'p95 ({unit})':>10} {'calls':>7} {'memory (KiB)':>13}"
+        f" {'previous p95':>13}"
+    ]
+    for result in results:
+        previous = previous_results.get(result.name)
+        lines.append(
+            f'{result.name:<30} {result.status:>6} {result.p50 * factor:>10.{decimals}f}'
+            f' {result.p95 * factor:>10.{decimals}f} {result.backend_calls:>7g} {result.memory / 1024:>13.1f}'
+            f" {f'{previous.p95 * factor:.{decimals}f}' if previous else '-':>13}"
+        )
+    return '\n'.join(lines)
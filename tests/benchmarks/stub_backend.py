@@ -0,0 +1,157 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import datetime
+import importlib
+import json
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+__all__ = [
+    "StubBackend",
+    "serialize",
+]
+
+
+def serialize(payload):
+    """Return the JSON representation of a payload, the SDK models being serialized as the backend would do."""
+    module_name = type(payload).__module__.partition('.')[0]
+    if module_name.startswith('osis_') and module_name.endswith('_sdk'):
+        payload = importlib.import_module(module_name).ApiClient.sanitize_for_serialization(payload)
+    elif isinstance(payload, (list, tuple)):
+        payload = [serialize(item) for item in payload]
+    elif isinstance(payload, dict):
+        payload = {key: serialize(value) for key, value in payload.items()}
+    elif isinstance(payload, (datetime.date, datetime.datetime)):
+        payload = payload.isoformat()
+    return payload
+
+
+class StubRoute:
+    def __init__(self, method, prefix, endpoint_path, payload, status=200):
+        self.method = method
+        self.name = f'{method} {prefix}{endpoint_path}'
+        # The path parameters, e.g. '{uuid}', match any path segment
+        pattern = re.sub(r'\\\{\w+\\\}', '[^/]+', re.escape(prefix + endpoint_path))
+        self.pattern = re.compile(f'^{pattern}/?$')
+        self.body = json.dumps(serialize(payload)).encode()
+        self.status = status
+
+
+class StubBackend:
+    """
+    Local HTTP server serving fixed JSON payloads in place of the OSIS backends, with a configurable latency.
+
+    The routes are registered from the operations of the generated SDK, so that the real SDK clients, with their HTTP
+    and deserialization costs, can be used against it:
+
+        backend = StubBackend(latency=0.02)
+        backend.add_operation(osis_parcours_doctoral_sdk, DoctorateApi, 'doctorate_retrieve', doctorate, prefix='/pd')
+        with backend:
+            with override_settings(OSIS_PARCOURS_DOCTORAL_SDK_HOST=backend.url + '/pd'):
+                ...
+    """
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.routes = []
+        self.requests = Counter()
+        self.lock = threading.Lock()
+        self.server = None
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    @property
+    def request_count(self):
+        with self.lock:
+            return sum(self.requests.values())
+
+    def add_route(self, method, prefix, endpoint_path, payload, status=200):
+        self.routes.append(StubRoute(method, prefix, endpoint_path, payload, status))
+
+    def add_operation(self, sdk, api_class, operation_id, payload, prefix='', status=200):
+        """Serve the payload for the specified operation of an api of the SDK."""
+        api = api_class(sdk.ApiClient(sdk.Configuration()))
+        endpoint_settings = getattr(api, f'{operation_id}_endpoint').settings
+        self.add_route(endpoint_settings['http_method'], prefix, endpoint_settings['endpoint_path'], payload, status)
+
+    def find_route(self, method, path):
+        return next((route for route in self.routes if route.method == method and route.pattern.match(path)), None)
+
+    def reset(self):
+        with self.lock:
+            self.requests.clear()
+
+    def start(self):
+        backend = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def handle_request(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                if length:
+                    self.rfile.read(length)
+                route = backend.find_route(self.command, urlsplit(self.path).path)
+                with backend.lock:
+                    backend.requests[route.name if route else f'{self.command} {self.path}'] += 1
+                if backend.latency:
+                    time.sleep(backend.latency)
+                status, body = (route.status, route.body) if route else (404, b'{"detail": "Not found."}')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = handle_request
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
@@ -0,0 +1,126 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import os
+import time
+import tracemalloc
+import warnings
+from unittest import skipUnless
+
+from django.test import SimpleTestCase, tag
+
+from base.models.utils.utils import ChoiceEnum
+from parcours_doctoral.templatetags.doctorate_enums import enum_display, multiple_enum_display
+from parcours_doctoral.tests.benchmarks.results import (
+    MICRO_COMPARED_MEASURES,
+    BenchmarkRegressionWarning,
+    BenchmarkResult,
+    find_regressions,
+    format_results,
+    get_benchmark_path,
+    get_current_commit,
+    get_previous_results,
+    load_results,
+    percentile,
+    store_report,
+    store_results,
+)
+
+
+def scan_enum_display(value, enum_name):
+    """Previous implementation of enum_display, looking for the enum among all the subclasses at each call."""
+    __import__('parcours_doctoral.contrib.enums')
+    for enum in ChoiceEnum.__subclasses__():
+        if enum.__name__ == enum_name:
+            return enum.get_value(str(value))
+    return value or ''
+
+
+@tag('benchmark')
+@skipUnless(os.environ.get('PARCOURS_DOCTORAL_BENCHMARK'), 'Set PARCOURS_DOCTORAL_BENCHMARK=1 to run the benchmarks')
+class EnumDisplayBenchmark(SimpleTestCase):
+    """
+    Measure the duration of the enum filters (p50 and p95 of batches of calls, in seconds by call), as the detail pages
+    call them dozens of times. The results are stored next to the ones of the tab views, in enum_display.jsonl, and
+    compared with a noise suited to durations of a few microseconds.
+    """
+
+    batch_size = 1000
+    batches = 50
+
+    def get_values(self):
+        # The last enum is the worst case of a scan of the subclasses
+        enum = ChoiceEnum.__subclasses__()[-1]
+        return enum.__name__, [member.name for member in enum]
+
+    def measure(self, name, function):
+        function()
+        durations = []
+        for _ in range(self.batches):
+            start = time.perf_counter()
+            for _ in range(self.batch_size):
+                function()
+            durations.append((time.perf_counter() - start) / self.batch_size)
+
+        tracemalloc.start()
+        try:
+            function()
+            memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        return BenchmarkResult(
+            name=name,
+            status=0,
+            p50=percentile(durations, 50),
+            p95=percentile(durations, 95),
+            backend_calls=0,
+            memory=memory,
+        )
+
+    def test_enum_filters(self):
+        enum_name, names = self.get_values()
+        results = [
+            self.measure('enum_display', lambda: enum_display(names[0], enum_name)),
+            self.measure('multiple_enum_display', lambda: multiple_enum_display(names, enum_name)),
+        ]
+        scan_result = self.measure('enum_display (scan)', lambda: scan_enum_display(names[0], enum_name))
+
+        path = get_benchmark_path('enum_display')
+        previous_results = get_previous_results(load_results(path), get_current_commit())
+        store_results(results, path)
+        report_path = store_report(
+            'enum_display',
+            format_results(results + [scan_result], previous_results, title='filter', unit='us'),
+            path,
+        )
+
+        self.assertLess(results[0].p50, scan_result.p50)
+
+        regressions = find_regressions(results, previous_results, measures=MICRO_COMPARED_MEASURES)
+        if os.environ.get('PARCOURS_DOCTORAL_BENCHMARK_STRICT'):
+            self.assertEqual(regressions, [], f'See {report_path}')
+        elif regressions:
+            warnings.warn('\n'.join(regressions), BenchmarkRegressionWarning)
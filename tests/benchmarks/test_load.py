@@ -0,0 +1,145 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import os
+from unittest import skipUnless
+from uuid import uuid4
+
+from django.test import TransactionTestCase, override_settings, tag
+
+from base.tests.factories.person import PersonFactory
+from parcours_doctoral.tests.benchmarks.load import (
+    Journey,
+    LoadDriver,
+    Persona,
+    Step,
+    format_report,
+)
+from parcours_doctoral.tests.benchmarks.mixins import (
+    StubBackendMixin,
+    benchmark_settings,
+)
+from parcours_doctoral.tests.benchmarks.results import store_report
+from parcours_doctoral.tests.mixins import DoctorateFixturesMixin
+
+
+@tag('benchmark')
+@skipUnless(os.environ.get('PARCOURS_DOCTORAL_LOAD_TEST'), 'Set PARCOURS_DOCTORAL_LOAD_TEST=1 to run the load test')
+@override_settings(
+    OSIS_DOCUMENT_BASE_URL='http://dummyurl.com/document/',
+    PARCOURS_DOCTORAL_TOKEN_EXTERNAL='api-token-external',
+)
+@benchmark_settings
+class DoctoralJourneysLoadTest(StubBackendMixin, DoctorateFixturesMixin, TransactionTestCase):
+    """
+    Replay the journeys of students, promoters and external jury members concurrently against the stub backend, as
+    during a confirmation paper deadline or a jury signature campaign, and report the throughput, the error rates and
+    the backend calls of each journey.
+
+    The load can be configured with the following environment variables: PARCOURS_DOCTORAL_LOAD_CONCURRENCY (number of
+    workers), PARCOURS_DOCTORAL_LOAD_RUNS (journeys by worker), PARCOURS_DOCTORAL_LOAD_DURATION (maximum duration in
+    seconds), PARCOURS_DOCTORAL_BENCHMARK_LATENCY (latency of the backend in milliseconds) and
+    PARCOURS_DOCTORAL_LOAD_MAX_ERROR_RATE (error rate above which the test fails, 0 by default). The report is written
+    next to the results of the benchmarks (load.txt) and attached to the failures.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.person = PersonFactory()
+        self.doctorate_uuid = str(uuid4())
+        self.scholarship_uuid = str(uuid4())
+        self._mock_document_api()
+        self.start_stub_backend(latency=float(os.environ.get('PARCOURS_DOCTORAL_BENCHMARK_LATENCY', 20)) / 1000)
+
+    def get_journeys(self):
+        student = Persona('student', self.person.user)
+        promoter = Persona('promoter', PersonFactory().user)
+        external_member = Persona('external member')
+        doctorate = {'pk': self.doctorate_uuid}
+        return [
+            Journey(
+                'student confirmation paper',
+                student,
+                [
+                    Step('parcours_doctoral:list'),
+                    Step('parcours_doctoral:project', doctorate),
+                    Step('parcours_doctoral:confirmation-paper', doctorate),
+                    Step('parcours_doctoral:doctoral-training', doctorate),
+                ],
+                weight=4,
+            ),
+            Journey(
+                'student funding update',
+                student,
+                [
+                    Step('parcours_doctoral:funding', doctorate),
+                    Step('parcours_doctoral:update:funding', doctorate),
+                    Step('parcours_doctoral:autocomplete:country', query='q=bel'),
+                    Step('parcours_doctoral:autocomplete:language', query='q=fr'),
+                    Step('parcours_doctoral:autocomplete:superior-institute', query='q=inst'),
+                ],
+                weight=2,
+            ),
+            Journey(
+                'promoter jury signature',
+                promoter,
+                [
+                    Step('parcours_doctoral:supervised-list'),
+                    Step('parcours_doctoral:project', doctorate),
+                    Step('parcours_doctoral:supervision', doctorate),
+                    Step('parcours_doctoral:jury', doctorate),
+                ],
+                weight=3,
+            ),
+            Journey(
+                'external jury approval',
+                external_member,
+                [Step('parcours_doctoral:jury-external-approval', {**doctorate, 'token': 'external-token'})],
+                weight=2,
+            ),
+            Journey(
+                'external supervision',
+                external_member,
+                [Step('parcours_doctoral:public:supervision', {**doctorate, 'token': 'external-token'})],
+            ),
+        ]
+
+    def test_journeys(self):
+        duration = os.environ.get('PARCOURS_DOCTORAL_LOAD_DURATION')
+        driver = LoadDriver(
+            self.get_journeys(),
+            concurrency=int(os.environ.get('PARCOURS_DOCTORAL_LOAD_CONCURRENCY', 10)),
+            runs_per_worker=int(os.environ.get('PARCOURS_DOCTORAL_LOAD_RUNS', 10)),
+            duration=float(duration) if duration else None,
+            seed=0,
+        )
+        statistics = driver.run()
+        report = format_report(driver)
+        report_path = store_report('load', report)
+
+        max_error_rate = float(os.environ.get('PARCOURS_DOCTORAL_LOAD_MAX_ERROR_RATE', 0))
+        for journey_statistics in statistics.values():
+            with self.subTest(journey=journey_statistics.name):
+                self.assertLessEqual(journey_statistics.error_rate, max_error_rate, f'{report_path}:\n{report}')
@@ -0,0 +1,119 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import os
+import tempfile
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from parcours_doctoral.tests.benchmarks.results import (
+    MICRO_COMPARED_MEASURES,
+    BenchmarkResult,
+    find_regressions,
+    get_benchmark_path,
+    get_previous_results,
+    load_results,
+    percentile,
+    store_report,
+    store_results,
+)
+
+
+class BenchmarkResultsTestCase(SimpleTestCase):
+    def make_result(self, name='project', commit='', **kwargs):
+        values = {'status': 200, 'p50': 0.01, 'p95': 0.02, 'backend_calls': 2, 'memory': 100000}
+        values.update(kwargs)
+        return BenchmarkResult(name=name, commit=commit, **values)
+
+    def test_percentile(self):
+        values = list(range(1, 21))
+        self.assertEqual(percentile(values, 50), 10)
+        self.assertEqual(percentile(values, 95), 19)
+        self.assertEqual(percentile([5], 95), 5)
+
+    def test_store_and_load_results(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'results', 'tab_views.jsonl')
+            store_results([self.make_result('project'), self.make_result('funding')], path)
+            store_results([self.make_result('project')], path)
+
+            results = load_results(path)
+
+        self.assertEqual([result.name for result in results], ['project', 'funding', 'project'])
+        self.assertTrue(all(result.date for result in results))
+
+    def test_store_report(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'results', 'tab_views.jsonl')
+            store_report('tab_views', 'first report', path)
+            report_path = store_report('tab_views', 'second report', path)
+
+            with open(report_path) as report_file:
+                report = report_file.read()
+
+        self.assertEqual(report_path, os.path.join(directory, 'results', 'tab_views.txt'))
+        self.assertEqual(report, 'second report\n')
+
+    def test_previous_results_are_the_most_recent_of_another_commit(self):
+        stored_results = [
+            self.make_result('project', commit='a', p95=0.01),
+            self.make_result('project', commit='b', p95=0.02),
+            self.make_result('funding', commit='b'),
+            self.make_result('project', commit='c', p95=0.03),
+        ]
+        previous_results = get_previous_results(stored_results, 'c')
+        self.assertEqual(set(previous_results), {'project', 'funding'})
+        self.assertEqual(previous_results['project'].p95, 0.02)
+
+        self.assertEqual(get_previous_results(stored_results[-1:], 'c'), {})
+
+    def test_find_regressions(self):
+        previous_results = {'project': self.make_result(commit='a')}
+
+        self.assertEqual(find_regressions([self.make_result(p95=0.021, memory=101000)], previous_results), [])
+        self.assertEqual(find_regressions([self.make_result('funding', p95=1)], previous_results), [])
+
+        regressions = find_regressions([self.make_result(p95=0.05, backend_calls=3)], previous_results)
+        self.assertEqual(
+            regressions,
+            ['project: p95 0.02 -> 0.05 (commit a)', 'project: backend_calls 2 -> 3 (commit a)'],
+        )
+
+    def test_find_regressions_of_micro_benchmarks(self):
+        previous_results = {'enum_display': self.make_result('enum_display', commit='a', p50=2e-7, p95=4e-7)}
+        results = [self.make_result('enum_display', p50=2e-7, p95=4e-6)]
+
+        # Below the noise of the tab views
+        self.assertEqual(find_regressions(results, previous_results), [])
+        self.assertEqual(
+            find_regressions(results, previous_results, measures=MICRO_COMPARED_MEASURES),
+            ['enum_display: p95 4e-07 -> 4e-06 (commit a)'],
+        )
+
+    def test_benchmark_path(self):
+        results_path = os.path.join('results', 'tab_views.jsonl')
+        with patch.dict(os.environ, {'PARCOURS_DOCTORAL_BENCHMARK_RESULTS': results_path}):
+            self.assertEqual(get_benchmark_path('enum_display'), os.path.join('results', 'enum_display.jsonl'))
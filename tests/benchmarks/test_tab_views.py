@@ -0,0 +1,126 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import os
+import time
+import tracemalloc
+import warnings
+from unittest import skipUnless
+
+from django.shortcuts import resolve_url
+from django.test import tag
+
+from parcours_doctoral.templatetags.parcours_doctoral import TAB_TREE
+from parcours_doctoral.tests.benchmarks.mixins import (
+    StubBackendMixin,
+    benchmark_settings,
+)
+from parcours_doctoral.tests.benchmarks.results import (
+    BenchmarkRegressionWarning,
+    BenchmarkResult,
+    find_regressions,
+    format_results,
+    get_current_commit,
+    get_previous_results,
+    load_results,
+    percentile,
+    store_report,
+    store_results,
+)
+from parcours_doctoral.tests.mixins import BaseDoctorateTestCase
+
+
+@tag('benchmark')
+@skipUnless(os.environ.get('PARCOURS_DOCTORAL_BENCHMARK'), 'Set PARCOURS_DOCTORAL_BENCHMARK=1 to run the benchmarks')
+@benchmark_settings
+class TabViewsBenchmark(StubBackendMixin, BaseDoctorateTestCase):
+    """
+    Measure the latency (p50 and p95), the number of backend calls and the memory allocated by a request to each tab,
+    the SDK being used against a local stub backend instead of being mocked.
+
+    The latency of the backend (in milliseconds) and the number of requests by tab can be set with the
+    PARCOURS_DOCTORAL_BENCHMARK_LATENCY and PARCOURS_DOCTORAL_BENCHMARK_ITERATIONS environment variables. The results
+    are appended to PARCOURS_DOCTORAL_BENCHMARK_RESULTS (.benchmarks/tab_views.jsonl by default) and compared to the
+    ones of the previous commit in a report written next to them (tab_views.txt). The regressions are reported as
+    warnings, or fail the test if PARCOURS_DOCTORAL_BENCHMARK_STRICT is set.
+    """
+
+    def setUp(self):
+        # The SDK are not mocked, the stub backend serves them (the documents are still mocked)
+        super(BaseDoctorateTestCase, self).setUp()
+        self._mock_document_api()
+
+        self.iterations = int(os.environ.get('PARCOURS_DOCTORAL_BENCHMARK_ITERATIONS', 20))
+        self.start_stub_backend(latency=float(os.environ.get('PARCOURS_DOCTORAL_BENCHMARK_LATENCY', 20)) / 1000)
+        self.client.force_login(self.person.user)
+
+    def get_tab_names(self):
+        return list(dict.fromkeys(tab.name for tabs in TAB_TREE.values() for tab in tabs))
+
+    def measure(self, name, url):
+        # Warm up the connections and the compiled templates
+        response = self.client.get(url)
+
+        self.backend.reset()
+        durations = []
+        for _ in range(self.iterations):
+            start = time.perf_counter()
+            self.client.get(url)
+            durations.append(time.perf_counter() - start)
+        backend_calls = self.backend.request_count / self.iterations
+
+        tracemalloc.start()
+        try:
+            self.client.get(url)
+            memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+        return BenchmarkResult(
+            name=name,
+            status=response.status_code,
+            p50=percentile(durations, 50),
+            p95=percentile(durations, 95),
+            backend_calls=backend_calls,
+            memory=memory,
+        )
+
+    def test_tab_views(self):
+        results = []
+        for name in self.get_tab_names():
+            with self.subTest(tab=name):
+                result = self.measure(name, resolve_url(f'parcours_doctoral:{name}', pk=self.doctorate_uuid))
+                results.append(result)
+                self.assertEqual(result.status, 200)
+
+        previous_results = get_previous_results(load_results(), get_current_commit())
+        store_results(results)
+        report_path = store_report('tab_views', format_results(results, previous_results))
+
+        regressions = find_regressions(results, previous_results)
+        if os.environ.get('PARCOURS_DOCTORAL_BENCHMARK_STRICT'):
+            self.assertEqual(regressions, [], f'See {report_path}')
+        elif regressions:
+            warnings.warn('\n'.join(regressions), BenchmarkRegressionWarning)
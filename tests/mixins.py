@@ -25,9 +25,11 @@
 # ##############################################################################
 import datetime
 import uuid
+from contextlib import contextmanager
 from unittest.mock import ANY, MagicMock, patch
 from uuid import uuid4
 
+from django.core.cache import cache
 from django.test import override_settings
 from osis_parcours_doctoral_sdk.model.action_link import ActionLink
 from osis_parcours_doctoral_sdk.model.cotutelle_dto_nested import CotutelleDTONested
@@ -66,13 +68,20 @@ from parcours_doctoral.contrib.enums.proximity_commission import (
     ChoixCommissionProximiteCDSS,
 )
 from parcours_doctoral.contrib.forms import PDF_MIME_TYPE
+from parcours_doctoral.services.context import service_request_context
+from parcours_doctoral.services.doctorate import doctorate_cache
+from parcours_doctoral.services.documents import document_tokens_cache
+from parcours_doctoral.services.pdf import pdf_delivery_cache
+from parcours_doctoral.services.reference import (
+    institute_types_cache,
+    reference_data_cache,
+)
+from parcours_doctoral.services.resilience import reset_circuit_breakers
 
 
-@override_settings(
-    OSIS_DOCUMENT_BASE_URL='http://dummyurl.com/document/',
-    PARCOURS_DOCTORAL_TOKEN_EXTERNAL='api-token-external',
-)
-class BaseDoctorateTestCase(OsisPortalTestCase):
+class DoctorateFixturesMixin:
+    """Fixtures of the doctorate tests, built from the `person`, `doctorate_uuid` and `scholarship_uuid` attributes."""
+
     mime_type = PDF_MIME_TYPE
 
     @classmethod
@@ -92,26 +101,8 @@ class BaseDoctorateTestCase(OsisPortalTestCase):
         countries = cls.get_countries(**kwargs)
         return countries.results[0] if countries.results else None
 
-    @classmethod
-    def setUpTestData(cls):
-        super().setUpTestData()
-        cls.person = PersonFactory()
-        cls.doctorate_uuid = str(uuid4())
-        cls.scholarship_uuid = str(uuid4())
-        cls.api_default_params = {
-            'accept_language': ANY,
-            'x_user_first_name': ANY,
-            'x_user_last_name': ANY,
-            'x_user_email': ANY,
-            'x_user_global_id': ANY,
-        }
-
-    def _mock_doctorate_api(self):
-        doctorate_api_patcher = patch('osis_parcours_doctoral_sdk.api.doctorate_api.DoctorateApi')
-        self.mock_doctorate_api = doctorate_api_patcher.start()
-        self.addCleanup(doctorate_api_patcher.stop)
-
-        self.mock_doctorate_object = ParcoursDoctoralDTO._from_openapi_data(
+    def get_doctorate_object(self):
+        return ParcoursDoctoralDTO._from_openapi_data(
             uuid=self.doctorate_uuid,
             statut=ChoixStatutDoctorat.ADMIS.name,
             date_changement_statut=datetime.datetime(2024, 1, 3),
@@ -290,8 +281,9 @@ class BaseDoctorateTestCase(OsisPortalTestCase):
             proces_verbal_soutenance_publique=['minutes-uuid'],
             date_retrait_diplome=datetime.date(2025, 2, 2),
         )
-        self.mock_doctorate_api.return_value.doctorate_retrieve.return_value = self.mock_doctorate_object
-        self.mock_doctorate_api.return_value.retrieve_jury_preparation.return_value = JuryDTO._from_openapi_data(
+
+    def get_jury_object(self):
+        return JuryDTO._from_openapi_data(
             uuid=self.doctorate_uuid,
             titre_propose='titre propose',
             has_change_roles_permission=True,
@@ -361,12 +353,64 @@ class BaseDoctorateTestCase(OsisPortalTestCase):
         document_api_patcher.start()
         self.addCleanup(document_api_patcher.stop)
 
+        document_api_patcher = patch(
+            'osis_document_components.services.get_remote_tokens',
+            side_effect=lambda uuids, **kwargs: {uuid: 'foobar' for uuid in uuids},
+        )
+        document_api_patcher.start()
+        self.addCleanup(document_api_patcher.stop)
+
         document_api_patcher = patch(
             'osis_document_components.services.get_remote_metadata',
             return_value={'name': 'myfile', 'mimetype': self.mime_type, 'size': 1},
         )
         document_api_patcher.start()
 
+
+@override_settings(
+    OSIS_DOCUMENT_BASE_URL='http://dummyurl.com/document/',
+    PARCOURS_DOCTORAL_TOKEN_EXTERNAL='api-token-external',
+    PARCOURS_DOCTORAL_REFERENCE_INDEX_TIMEOUT=0,
+)
+class BaseDoctorateTestCase(DoctorateFixturesMixin, OsisPortalTestCase):
+    @contextmanager
+    def assertServiceCalls(self, maximum=None, allow_repeated=False):
+        """Check that the block makes at most `maximum` service calls, without calling twice the same method with the
+        same arguments unless `allow_repeated` is set."""
+        with service_request_context() as context:
+            yield context
+        if maximum is not None:
+            self.assertLessEqual(
+                len(context.calls),
+                maximum,
+                msg=f'Too many service calls: {[call.name for call in context.calls]}',
+            )
+        if not allow_repeated:
+            self.assertEqual(context.get_repeated_calls(), {}, msg='Some service calls are repeated')
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.person = PersonFactory()
+        cls.doctorate_uuid = str(uuid4())
+        cls.scholarship_uuid = str(uuid4())
+        cls.api_default_params = {
+            'accept_language': ANY,
+            'x_user_first_name': ANY,
+            'x_user_last_name': ANY,
+            'x_user_email': ANY,
+            'x_user_global_id': ANY,
+        }
+
+    def _mock_doctorate_api(self):
+        doctorate_api_patcher = patch('osis_parcours_doctoral_sdk.api.doctorate_api.DoctorateApi')
+        self.mock_doctorate_api = doctorate_api_patcher.start()
+        self.addCleanup(doctorate_api_patcher.stop)
+
+        self.mock_doctorate_object = self.get_doctorate_object()
+        self.mock_doctorate_api.return_value.doctorate_retrieve.return_value = self.mock_doctorate_object
+        self.mock_doctorate_api.return_value.retrieve_jury_preparation.return_value = self.get_jury_object()
+
     def _mock_reference_api(self):
         language_patcher = patch('osis_reference_sdk.api.languages_api.LanguagesApi')
         self.mock_language_api = language_patcher.start()
@@ -419,9 +463,21 @@ class BaseDoctorateTestCase(OsisPortalTestCase):
         self.addCleanup(self.mock_country_method.stop)
         self.mock_country_method.side_effect = lambda **kwargs: self.get_country(**kwargs)
 
+    def _clear_caches(self):
+        # The data cached by the previous tests must not be used
+        cache.clear()
+        reference_data_cache.clear_local()
+        institute_types_cache.clear_local()
+        doctorate_cache.clear()
+        pdf_delivery_cache.clear()
+        document_tokens_cache.clear_local()
+
     def setUp(self):
         super().setUp()
 
+        self._clear_caches()
+        # The failures of the previous tests must not open the circuit breakers
+        reset_circuit_breakers()
         self._mock_doctorate_api()
         self._mock_document_api()
         self._mock_reference_api()
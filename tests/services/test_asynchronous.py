@@ -0,0 +1,67 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import asyncio
+import threading
+
+from django.test import SimpleTestCase
+from django.utils import translation
+
+from parcours_doctoral.services.asynchronous import AsyncService
+from parcours_doctoral.services.context import (
+    get_service_context,
+    service_request_context,
+)
+
+
+class DummyService:
+    barrier = None
+
+    @classmethod
+    def get_value(cls, value):
+        return value, translation.get_language(), get_service_context()
+
+    @classmethod
+    def wait(cls):
+        cls.barrier.wait(timeout=5)
+        return threading.get_ident()
+
+
+class AsyncServiceTestCase(SimpleTestCase):
+    def setUp(self):
+        self.service = AsyncService(DummyService)
+
+    async def test_class_methods_are_called_with_the_language_and_context_of_the_request(self):
+        with translation.override('en'), service_request_context() as context:
+            self.assertEqual(await self.service.get_value(value=1), (1, 'en', context))
+
+    async def test_class_methods_are_called_concurrently(self):
+        DummyService.barrier = threading.Barrier(2)
+        thread_ids = await asyncio.gather(self.service.wait(), self.service.wait())
+        self.assertNotEqual(thread_ids[0], thread_ids[1])
+
+    def test_other_attributes_are_returned_as_is(self):
+        DummyService.barrier = 'barrier'
+        self.assertEqual(self.service.barrier, 'barrier')
@@ -0,0 +1,113 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from parcours_doctoral.middleware import ServiceRequestContextMiddleware
+from parcours_doctoral.services.budget import (
+    ServiceCallBudgetExceeded,
+    ServiceCallWarning,
+    check_service_calls,
+    get_service_call_problems,
+)
+from parcours_doctoral.services.context import service_request_context
+from parcours_doctoral.services.mixins import ServiceMeta
+
+
+class DummyApiException(Exception):
+    pass
+
+
+class DummyService(metaclass=ServiceMeta):
+    api_exception_cls = DummyApiException
+
+    @classmethod
+    def get_member(cls, person, uuid):
+        return uuid
+
+
+@override_settings(PARCOURS_DOCTORAL_SERVICE_CALL_CHECKS=True, PARCOURS_DOCTORAL_SERVICE_CALL_REPEAT_LIMIT=3)
+class ServiceCallBudgetTestCase(SimpleTestCase):
+    def test_no_problem(self):
+        with service_request_context() as context:
+            DummyService.get_member(person=None, uuid='1')
+            DummyService.get_member(person=None, uuid='2')
+        self.assertEqual(get_service_call_problems(context, budget=2, repeat_limit=3), [])
+
+    def test_budget_exceeded(self):
+        with service_request_context() as context:
+            DummyService.get_member(person=None, uuid='1')
+            DummyService.get_member(person=None, uuid='2')
+        problems = get_service_call_problems(context, budget=1)
+        self.assertEqual(problems, ['2 service calls for a budget of 1'])
+
+    def test_repeated_calls(self):
+        with service_request_context() as context:
+            DummyService.get_member(person=None, uuid='1')
+            DummyService.get_member(None, '1')
+            DummyService.get_member(person=None, uuid='2')
+        problems = get_service_call_problems(context)
+        self.assertEqual(len(problems), 1)
+        self.assertIn('DummyService.get_member called 2 times with the same arguments', problems[0])
+        self.assertIn("'uuid', '1'", problems[0])
+
+    def test_frequent_calls(self):
+        with service_request_context() as context:
+            for uuid in range(4):
+                DummyService.get_member(person=None, uuid=uuid)
+        problems = get_service_call_problems(context, repeat_limit=3)
+        self.assertEqual(problems, ['DummyService.get_member called 4 times (N+1 pattern?)'])
+
+    def test_check_warns(self):
+        with service_request_context() as context:
+            DummyService.get_member(person=None, uuid='1')
+            DummyService.get_member(person=None, uuid='1')
+        with self.assertWarnsRegex(ServiceCallWarning, 'GET /doctorate/: DummyService.get_member called 2 times'):
+            check_service_calls(context, 'GET /doctorate/')
+
+    @override_settings(PARCOURS_DOCTORAL_SERVICE_CALL_CHECKS_STRICT=True, PARCOURS_DOCTORAL_SERVICE_CALL_BUDGET=1)
+    def test_check_raises_if_strict(self):
+        with service_request_context() as context:
+            DummyService.get_member(person=None, uuid='1')
+            DummyService.get_member(person=None, uuid='2')
+        with self.assertRaisesMessage(ServiceCallBudgetExceeded, '2 service calls for a budget of 1'):
+            check_service_calls(context, 'GET /doctorate/')
+
+    @override_settings(PARCOURS_DOCTORAL_SERVICE_CALL_CHECKS=False, PARCOURS_DOCTORAL_SERVICE_CALL_BUDGET=0)
+    def test_check_disabled(self):
+        with service_request_context() as context:
+            DummyService.get_member(person=None, uuid='1')
+        check_service_calls(context, 'GET /doctorate/')
+
+    @override_settings(PARCOURS_DOCTORAL_SERVICE_CALL_CHECKS_STRICT=True)
+    def test_middleware(self):
+        def get_response(request):
+            for _ in range(2):
+                DummyService.get_member(person=None, uuid='1')
+            return HttpResponse()
+
+        with self.assertRaisesMessage(ServiceCallBudgetExceeded, 'GET /doctorate/'):
+            ServiceRequestContextMiddleware(get_response)(RequestFactory().get('/doctorate/'))
@@ -0,0 +1,166 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import threading
+
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase, override_settings
+
+from parcours_doctoral.services.bulkheads import (
+    Bulkhead,
+    BulkheadFull,
+    bulkhead_registry,
+    get_bulkhead,
+)
+from parcours_doctoral.services.metrics import (
+    BULKHEAD_ACTIVE_CALLS,
+    BULKHEAD_REJECTIONS,
+    SERVICE_CALLS,
+)
+from parcours_doctoral.services.mixins import ServiceMeta, request_cached
+from parcours_doctoral.tests.utils import get_metric_value
+
+
+class DummyApiException(Exception):
+    pass
+
+
+class IsolatedService(metaclass=ServiceMeta):
+    api_exception_cls = DummyApiException
+    bulkhead = 'isolated'
+
+    @classmethod
+    @request_cached
+    def get_doctorate(cls, person, uuid):
+        return get_metric_value(BULKHEAD_ACTIVE_CALLS, ('isolated',))
+
+    @classmethod
+    @request_cached
+    def get_doctorates(cls, person):
+        # Nested call of the same dependency
+        return [cls.get_doctorate(person=person, uuid='uuid-1')]
+
+
+class BulkheadTestCase(SimpleTestCase):
+    def setUp(self):
+        bulkhead_registry.clear()
+        self.addCleanup(bulkhead_registry.clear)
+        for metric in [BULKHEAD_ACTIVE_CALLS, BULKHEAD_REJECTIONS, SERVICE_CALLS]:
+            metric.clear()
+
+    def test_calls_are_rejected_when_the_queue_is_full(self):
+        bulkhead = Bulkhead('test', max_concurrent=1, max_queue=0, queue_timeout=1)
+
+        with bulkhead.slot():
+            self.assertEqual(get_metric_value(BULKHEAD_ACTIVE_CALLS, ('test',)), 1)
+            with self.assertRaises(BulkheadFull):
+                bulkhead.acquire()
+
+        self.assertEqual(get_metric_value(BULKHEAD_ACTIVE_CALLS, ('test',)), 0)
+        self.assertEqual(get_metric_value(BULKHEAD_REJECTIONS, ('test',)), 1)
+        with bulkhead.slot():
+            pass
+
+    def test_calls_are_rejected_after_waiting_too_long(self):
+        bulkhead = Bulkhead('test', max_concurrent=1, max_queue=1, queue_timeout=0.01)
+
+        with bulkhead.slot():
+            with self.assertRaises(BulkheadFull):
+                bulkhead.acquire()
+
+        self.assertEqual(bulkhead.waiting, 0)
+        self.assertEqual(get_metric_value(BULKHEAD_REJECTIONS, ('test',)), 1)
+
+    def test_queued_calls_wait_for_a_free_slot(self):
+        bulkhead = Bulkhead('test', max_concurrent=1, max_queue=1, queue_timeout=5)
+        bulkhead.acquire()
+        acquired = threading.Event()
+
+        def call():
+            with bulkhead.slot():
+                acquired.set()
+
+        thread = threading.Thread(target=call)
+        thread.start()
+        self.assertFalse(acquired.wait(0.05))
+        bulkhead.release()
+        thread.join()
+
+        self.assertTrue(acquired.is_set())
+        self.assertEqual(get_metric_value(BULKHEAD_REJECTIONS, ('test',)), 0)
+
+    def test_limit_can_be_disabled(self):
+        bulkhead = Bulkhead('test', max_concurrent=0, max_queue=0, queue_timeout=0)
+
+        with bulkhead.slot(), bulkhead.slot():
+            pass
+
+    @override_settings(PARCOURS_DOCTORAL_BULKHEADS={'isolated': {'max_concurrent': 2}})
+    def test_limits_are_configurable(self):
+        bulkhead = get_bulkhead('isolated')
+
+        self.assertEqual(bulkhead.max_concurrent, 2)
+        self.assertEqual(bulkhead.max_queue, 20)
+        self.assertIs(get_bulkhead('isolated'), bulkhead)
+
+    @override_settings(
+        PARCOURS_DOCTORAL_BULKHEADS={
+            'default': {'max_queue': 5, 'rejection': 'bypass'},
+            'isolated': {'max_concurrent': 2, 'rejection': 'raise'},
+        }
+    )
+    def test_default_limits_are_configurable(self):
+        self.assertEqual(get_bulkhead('isolated').max_concurrent, 2)
+        self.assertEqual(get_bulkhead('isolated').max_queue, 5)
+        self.assertEqual(get_bulkhead('isolated').rejection, 'raise')
+        self.assertEqual(get_bulkhead('other').max_concurrent, 10)
+        self.assertEqual(get_bulkhead('other').rejection, 'bypass')
+
+    def test_calls_can_be_made_without_a_slot(self):
+        bulkhead = Bulkhead('test', max_concurrent=1, max_queue=0, queue_timeout=1, rejection='bypass')
+
+        with bulkhead.slot():
+            with bulkhead.slot():
+                self.assertEqual(get_metric_value(BULKHEAD_ACTIVE_CALLS, ('test',)), 1)
+
+        self.assertEqual(get_metric_value(BULKHEAD_ACTIVE_CALLS, ('test',)), 0)
+        self.assertEqual(get_metric_value(BULKHEAD_REJECTIONS, ('test',)), 0)
+        self.assertIs(bulkhead.acquire(), True)
+
+    def test_rejection_must_be_known(self):
+        with self.assertRaises(ImproperlyConfigured):
+            Bulkhead('test', max_concurrent=1, max_queue=0, queue_timeout=1, rejection='ignore')
+
+    @override_settings(PARCOURS_DOCTORAL_BULKHEADS={'isolated': {'max_concurrent': 1, 'max_queue': 0}})
+    def test_service_calls_are_isolated(self):
+        self.assertEqual(IsolatedService.get_doctorate(person=None, uuid='uuid-1'), 1)
+        # The nested call uses the slot of the calling method
+        self.assertEqual(IsolatedService.get_doctorates(person=None), [1])
+
+        with get_bulkhead('isolated').slot():
+            with self.assertRaises(BulkheadFull):
+                IsolatedService.get_doctorate(person=None, uuid='uuid-2')
+
+        self.assertEqual(get_metric_value(SERVICE_CALLS, ('IsolatedService', 'get_doctorate', 'rejected')), 1)
@@ -0,0 +1,164 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import threading
+from unittest.mock import MagicMock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from django.utils.translation import override
+
+from parcours_doctoral.services.cache import DoctorateDataCache, ReferenceDataCache
+
+
+@override_settings(
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'reference-tests'}},
+    PARCOURS_DOCTORAL_REFERENCE_CACHE_TIMEOUT=60,
+)
+class ReferenceDataCacheTestCase(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.reference_cache = ReferenceDataCache('test')
+        self.loader = MagicMock(return_value='value')
+
+    def test_loaded_value_is_cached(self):
+        self.assertEqual(self.reference_cache.get_or_load('key', self.loader), 'value')
+        self.assertEqual(self.reference_cache.get_or_load('key', self.loader), 'value')
+        self.loader.assert_called_once()
+
+    def test_missing_value_is_cached(self):
+        self.loader.return_value = None
+        self.assertIsNone(self.reference_cache.get_or_load('key', self.loader))
+        self.assertIsNone(self.reference_cache.get_or_load('key', self.loader))
+        self.loader.assert_called_once()
+
+    def test_cached_value_is_shared_between_processes(self):
+        self.reference_cache.get_or_load('key', self.loader)
+        self.assertEqual(ReferenceDataCache('test').get_or_load('key', self.loader), 'value')
+        self.loader.assert_called_once()
+
+    def test_dumped_values_are_shared_between_processes(self):
+        reference_cache = ReferenceDataCache('test', dump=str.upper, load=str.lower)
+        reference_cache.get_or_load('key', self.loader)
+        self.assertEqual(reference_cache.get_or_load('key', self.loader), 'value')
+        self.assertEqual(cache.get(reference_cache.make_key('key')), 'VALUE')
+        self.assertEqual(ReferenceDataCache('test', load=str.lower).get_or_load('key', self.loader), 'value')
+        self.loader.assert_called_once()
+
+    def test_values_which_cannot_be_loaded_are_loaded_again(self):
+        cache.set(self.reference_cache.make_key('key'), 1)
+        reference_cache = ReferenceDataCache('test', load=str.lower)
+        with self.assertLogs('parcours_doctoral.services.cache', level='ERROR'):
+            self.assertEqual(reference_cache.get_or_load('key', self.loader), 'value')
+        self.loader.assert_called_once()
+
+    def test_entries_depend_on_the_language(self):
+        with override('fr-be'):
+            self.reference_cache.get_or_load('key', self.loader)
+        with override('en'):
+            self.reference_cache.get_or_load('key', self.loader)
+        self.assertEqual(self.loader.call_count, 2)
+
+    @override_settings(PARCOURS_DOCTORAL_REFERENCE_CACHE_TIMEOUT=0)
+    def test_cache_can_be_disabled(self):
+        self.reference_cache.get_or_load('key', self.loader)
+        self.reference_cache.get_or_load('key', self.loader)
+        self.assertEqual(self.loader.call_count, 2)
+
+    @override_settings(PARCOURS_DOCTORAL_REFERENCE_CACHE_MAX_ENTRIES=2)
+    def test_local_entries_are_bounded(self):
+        for key in ['first', 'second', 'third']:
+            self.reference_cache.get_or_load(key, self.loader)
+        self.assertEqual(len(self.reference_cache._local_entries), 2)
+        self.assertNotIn(self.reference_cache.make_key('first'), self.reference_cache._local_entries)
+
+    def test_concurrent_loads_reach_the_backend_once(self):
+        loading = threading.Event()
+
+        def slow_loader():
+            loading.set()
+            threading.Event().wait(0.1)
+            return self.loader()
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(self.reference_cache.get_or_load('key', slow_loader)))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, ['value'] * 5)
+        self.loader.assert_called_once()
+
+
+@override_settings(
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'doctorate-tests'}},
+    PARCOURS_DOCTORAL_DOCTORATE_CACHE_TIMEOUT=30,
+)
+class DoctorateDataCacheTestCase(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.doctorate_cache = DoctorateDataCache('test')
+        self.loader = MagicMock(return_value='doctorate')
+
+    def get_doctorate(self, person_id=1):
+        return self.doctorate_cache.get_or_load((person_id, 'uuid-1'), 'uuid-1', self.loader)
+
+    def test_value_is_cached_per_user(self):
+        self.assertEqual(self.get_doctorate(), 'doctorate')
+        self.assertEqual(self.get_doctorate(), 'doctorate')
+        self.assertEqual(self.loader.call_count, 1)
+
+        self.get_doctorate(person_id=2)
+        self.assertEqual(self.loader.call_count, 2)
+
+    def test_value_is_loaded_again_when_the_doctorate_changes(self):
+        self.get_doctorate()
+        DoctorateDataCache.invalidate('uuid-1')
+        self.get_doctorate()
+        self.assertEqual(self.loader.call_count, 2)
+
+    def test_value_is_loaded_again_when_the_version_is_forgotten(self):
+        self.get_doctorate()
+        cache.delete(DoctorateDataCache.make_version_key('uuid-1'))
+        self.get_doctorate()
+        self.assertEqual(self.loader.call_count, 2)
+
+    def test_value_expires(self):
+        self.get_doctorate()
+        with override_settings(PARCOURS_DOCTORAL_DOCTORATE_CACHE_TIMEOUT=-1):
+            self.doctorate_cache.clear()
+            self.get_doctorate()
+            self.get_doctorate()
+        self.assertEqual(self.loader.call_count, 3)
+
+    @override_settings(PARCOURS_DOCTORAL_DOCTORATE_CACHE_TIMEOUT=0)
+    def test_cache_can_be_disabled(self):
+        self.get_doctorate()
+        self.get_doctorate()
+        self.assertEqual(self.loader.call_count, 2)
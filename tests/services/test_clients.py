@@ -0,0 +1,124 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import osis_parcours_doctoral_sdk
+import osis_reference_sdk
+from django.test import SimpleTestCase, override_settings
+
+from parcours_doctoral.services.clients import ApiClientRegistry
+
+
+class DummyRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Length', '2')
+        self.end_headers()
+        self.wfile.write(b'{}')
+
+    def log_message(self, *args):
+        pass
+
+
+class ApiClientRegistryTestCase(SimpleTestCase):
+    def setUp(self):
+        self.registry = ApiClientRegistry()
+        self.addCleanup(self.registry.clear)
+
+    @staticmethod
+    def build_configuration(sdk, token='token'):
+        return sdk.Configuration(
+            host='http://dummyurl.com/api',
+            api_key_prefix={'Token': 'Token'},
+            api_key={'Token': token},
+        )
+
+    def test_same_configuration_shares_the_client(self):
+        first_client = self.registry.get_client(
+            osis_parcours_doctoral_sdk,
+            self.build_configuration(osis_parcours_doctoral_sdk),
+        )
+        second_client = self.registry.get_client(
+            osis_parcours_doctoral_sdk,
+            self.build_configuration(osis_parcours_doctoral_sdk),
+        )
+        self.assertIs(first_client, second_client)
+
+    def test_different_configurations_or_sdks_do_not_share_the_client(self):
+        client = self.registry.get_client(
+            osis_parcours_doctoral_sdk,
+            self.build_configuration(osis_parcours_doctoral_sdk),
+        )
+        external_client = self.registry.get_client(
+            osis_parcours_doctoral_sdk,
+            self.build_configuration(osis_parcours_doctoral_sdk, token='external-token'),
+        )
+        reference_client = self.registry.get_client(
+            osis_reference_sdk,
+            self.build_configuration(osis_reference_sdk),
+        )
+        self.assertIsNot(client, external_client)
+        self.assertIsNot(client, reference_client)
+        self.assertIsInstance(reference_client, osis_reference_sdk.ApiClient)
+
+    @override_settings(PARCOURS_DOCTORAL_SDK_POOL_MAXSIZE=3)
+    def test_pool_size_is_configurable(self):
+        client = self.registry.get_client(
+            osis_parcours_doctoral_sdk,
+            self.build_configuration(osis_parcours_doctoral_sdk),
+        )
+        self.assertEqual(client.configuration.connection_pool_maxsize, 3)
+
+    def test_statistics(self):
+        self.registry.get_client(osis_parcours_doctoral_sdk, self.build_configuration(osis_parcours_doctoral_sdk))
+        statistics = self.registry.get_statistics()
+        self.assertEqual(len(statistics), 1)
+        self.assertEqual(statistics[0]['sdk'], 'osis_parcours_doctoral_sdk')
+        self.assertEqual(statistics[0]['host'], 'http://dummyurl.com/api')
+        self.assertEqual(statistics[0]['pools'], [])
+
+    @override_settings(PARCOURS_DOCTORAL_SDK_POOL_MAXSIZE=3)
+    def test_statistics_after_a_request(self):
+        server = HTTPServer(('127.0.0.1', 0), DummyRequestHandler)
+        self.addCleanup(server.server_close)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.shutdown)
+        configuration = self.build_configuration(osis_parcours_doctoral_sdk)
+        configuration.host = f'http://127.0.0.1:{server.server_port}/api'
+        client = self.registry.get_client(osis_parcours_doctoral_sdk, configuration)
+
+        client.rest_client.pool_manager.request('GET', f'{configuration.host}/doctorates')
+
+        pools = self.registry.get_statistics()[0]['pools']
+        self.assertEqual(len(pools), 1)
+        self.assertEqual(pools[0]['maxsize'], 3)
+        # The connection is kept alive in the pool once the response has been read
+        self.assertEqual(pools[0]['idle_connections'], 1)
+        self.assertEqual(pools[0]['opened_connections'], 1)
+        self.assertEqual(pools[0]['requests'], 1)
@@ -0,0 +1,111 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.contrib.auth.signals import user_logged_out
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from parcours_doctoral.services.dashboard import (
+    dashboard_links_cache,
+    get_dashboard_links,
+    get_dashboard_links_version,
+    load_dashboard_links,
+)
+
+
+@override_settings(
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'dashboard-tests'}},
+    PARCOURS_DOCTORAL_DASHBOARD_LINKS_CACHE_TIMEOUT=60 * 60,
+    PARCOURS_DOCTORAL_DASHBOARD_LINKS_REFRESH_DELAY=60,
+)
+class DashboardLinksTestCase(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.person = SimpleNamespace(pk=1, user_id=2)
+
+        patcher = patch(
+            'parcours_doctoral.services.doctorate.DoctorateService.get_dashboard_links',
+            return_value={'list_doctorates': {'url': 'http://dummyurl/doctorates'}},
+        )
+        self.get_dashboard_links = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = patch('parcours_doctoral.services.dashboard.enqueue')
+        self.enqueue = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        patcher = patch('parcours_doctoral.services.dashboard.time.time', return_value=1000)
+        self.time = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_links_are_cached(self):
+        links = get_dashboard_links(self.person)
+
+        self.assertEqual(get_dashboard_links(self.person), links)
+        self.assertEqual(links, {'list_doctorates': {'url': 'http://dummyurl/doctorates'}})
+        self.get_dashboard_links.assert_called_once_with(self.person)
+        self.enqueue.assert_not_called()
+
+    def test_stale_links_are_returned_and_refreshed_in_background(self):
+        links = get_dashboard_links(self.person)
+        self.time.return_value = 1060
+
+        self.assertEqual(get_dashboard_links(self.person), links)
+        self.get_dashboard_links.assert_called_once()
+        self.enqueue.assert_called_once_with(
+            'parcours_doctoral.services.dashboard.refresh_dashboard_links',
+            person_id=1,
+            version='',
+        )
+
+    def test_links_are_forgotten_on_logout(self):
+        get_dashboard_links(self.person)
+
+        user_logged_out.send(sender=None, request=None, user=SimpleNamespace(pk=2))
+        get_dashboard_links(self.person)
+
+        self.assertEqual(self.get_dashboard_links.call_count, 2)
+
+    def test_links_loaded_before_logout_are_not_cached(self):
+        version = get_dashboard_links_version(self.person.user_id)
+
+        user_logged_out.send(sender=None, request=None, user=SimpleNamespace(pk=2))
+        links = load_dashboard_links(self.person, version=version)
+
+        self.assertEqual(links, {'list_doctorates': {'url': 'http://dummyurl/doctorates'}})
+        self.assertIsNone(dashboard_links_cache.get(self.person.user_id))
+
+        load_dashboard_links(self.person, version=get_dashboard_links_version(self.person.user_id))
+        self.assertIsNotNone(dashboard_links_cache.get(self.person.user_id))
+
+    @override_settings(PARCOURS_DOCTORAL_DASHBOARD_LINKS_CACHE_TIMEOUT=0)
+    def test_cache_can_be_disabled(self):
+        get_dashboard_links(self.person)
+        get_dashboard_links(self.person)
+
+        self.assertEqual(self.get_dashboard_links.call_count, 2)
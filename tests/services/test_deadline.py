@@ -0,0 +1,148 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from parcours_doctoral.contrib.forms import get_country_initial_choices
+from parcours_doctoral.services.context import service_request_context
+from parcours_doctoral.services.deadline import (
+    DeadlineExceeded,
+    check_deadline,
+    get_remaining_time,
+    get_request_timeout,
+    optional_lookup,
+)
+from parcours_doctoral.services.metrics import SERVICE_CALL_RETRIES, SERVICE_CALLS
+from parcours_doctoral.services.mixins import ServiceMeta, request_cached
+from parcours_doctoral.templatetags.parcours_doctoral import get_superior_institute_name
+from parcours_doctoral.tests.utils import get_metric_value
+
+
+class DummyApiException(Exception):
+    pass
+
+
+class DeadlineService(metaclass=ServiceMeta):
+    api_exception_cls = DummyApiException
+
+    calls = 0
+
+    @classmethod
+    @request_cached
+    def get_doctorate(cls, person, uuid):
+        cls.calls += 1
+        return uuid
+
+    @classmethod
+    @request_cached
+    def get_unavailable_doctorate(cls, person, uuid):
+        cls.calls += 1
+        raise TimeoutError
+
+
+@optional_lookup(lambda code: f'[{code}]')
+def get_name(code):
+    return DeadlineService.get_doctorate(person=None, uuid=code)
+
+
+@override_settings(PARCOURS_DOCTORAL_CIRCUIT_BREAKER_THRESHOLD=0)
+class DeadlineTestCase(SimpleTestCase):
+    def setUp(self):
+        DeadlineService.calls = 0
+        SERVICE_CALLS.clear()
+        SERVICE_CALL_RETRIES.clear()
+
+    def test_no_deadline_outside_a_request(self):
+        self.assertIsNone(get_remaining_time())
+        self.assertEqual(get_request_timeout(5), 5)
+        check_deadline()
+
+    def test_no_deadline_without_timeout(self):
+        with service_request_context():
+            self.assertIsNone(get_remaining_time())
+            self.assertIsNone(get_request_timeout())
+
+    def test_request_timeout_is_bounded_by_the_deadline(self):
+        with service_request_context(timeout=2):
+            self.assertLessEqual(get_request_timeout(), 2)
+            self.assertEqual(get_request_timeout(1), 1)
+            connect_timeout, read_timeout = get_request_timeout((1, 10))
+            self.assertEqual(connect_timeout, 1)
+            self.assertLessEqual(read_timeout, 2)
+
+    def test_enclosing_deadline_is_kept(self):
+        with service_request_context(timeout=2) as context, service_request_context(timeout=60) as nested_context:
+            self.assertIs(nested_context, context)
+            self.assertLessEqual(get_remaining_time(), 2)
+
+    def test_service_calls_fail_fast_once_the_deadline_has_passed(self):
+        with service_request_context(timeout=2) as context:
+            self.assertEqual(DeadlineService.get_doctorate(person=None, uuid='uuid-1'), 'uuid-1')
+
+            context.deadline -= 2
+            with self.assertRaises(DeadlineExceeded):
+                check_deadline()
+            with self.assertRaises(DeadlineExceeded):
+                get_request_timeout()
+            with self.assertRaises(DeadlineExceeded):
+                DeadlineService.get_doctorate(person=None, uuid='uuid-2')
+            # The memoized results are still available
+            self.assertEqual(DeadlineService.get_doctorate(person=None, uuid='uuid-1'), 'uuid-1')
+
+        self.assertEqual(DeadlineService.calls, 1)
+        self.assertEqual(get_metric_value(SERVICE_CALLS, ('DeadlineService', 'get_doctorate', 'deadline_exceeded')), 1)
+
+    @override_settings(PARCOURS_DOCTORAL_RETRY_ATTEMPTS=2, PARCOURS_DOCTORAL_RETRY_BASE_DELAY=10)
+    def test_calls_are_not_retried_after_the_deadline(self):
+        with mock.patch('parcours_doctoral.services.resilience.random.uniform', return_value=5):
+            with service_request_context(timeout=2):
+                with self.assertRaises(DeadlineExceeded):
+                    DeadlineService.get_unavailable_doctorate(person=None, uuid='uuid-1')
+
+        self.assertEqual(DeadlineService.calls, 1)
+        self.assertEqual(get_metric_value(SERVICE_CALL_RETRIES, ('DeadlineService', 'get_unavailable_doctorate')), 0)
+
+    def test_optional_lookups_fall_back_once_the_deadline_has_passed(self):
+        with service_request_context(timeout=2) as context:
+            self.assertEqual(get_name('uuid-1'), 'uuid-1')
+            context.deadline -= 2
+            self.assertEqual(get_name('uuid-2'), '[uuid-2]')
+
+    @mock.patch(
+        'parcours_doctoral.templatetags.parcours_doctoral.SuperiorInstituteService.get_superior_institute',
+        side_effect=DeadlineExceeded,
+    )
+    def test_institute_names_fall_back_to_the_uuid(self, _):
+        context = {'request': mock.Mock()}
+        self.assertEqual(get_superior_institute_name(context, 'institute-uuid'), 'institute-uuid')
+        self.assertEqual(get_superior_institute_name(context, None), '')
+
+    def test_initial_choices_fall_back_to_the_value(self):
+        with service_request_context(timeout=2) as context:
+            context.deadline -= 2
+            self.assertEqual(get_country_initial_choices('BE', person=None), (('', ' - '), ('BE', 'BE')))
+            self.assertEqual(get_country_initial_choices(person=None), (('', ' - '),))
@@ -0,0 +1,94 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from parcours_doctoral.services.bulkheads import BulkheadFull
+from parcours_doctoral.services.documents import DocumentTokenService, document_tokens_cache
+
+
+@override_settings(
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'document-tests'}},
+    PARCOURS_DOCTORAL_DOCUMENT_TOKEN_CACHE_TIMEOUT=60,
+)
+class DocumentTokenServiceTestCase(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        document_tokens_cache.clear_local()
+        self.addCleanup(document_tokens_cache.clear_local)
+
+        patcher = patch(
+            'osis_document_components.services.get_remote_tokens',
+            side_effect=lambda uuids, **kwargs: {uuid: f'token-{uuid}' for uuid in uuids if uuid != 'unknown'},
+        )
+        self.get_remote_tokens = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_tokens_are_requested_at_once(self):
+        tokens = DocumentTokenService.get_tokens(['first', 'second', 'first', None, 'unknown'])
+
+        self.assertEqual(tokens, {'first': 'token-first', 'second': 'token-second'})
+        self.get_remote_tokens.assert_called_once_with(['first', 'second', 'unknown'], wanted_post_process='ORIGINAL')
+
+    def test_only_missing_tokens_are_requested(self):
+        DocumentTokenService.get_tokens(['first'])
+
+        self.assertEqual(DocumentTokenService.get_token('first'), 'token-first')
+        self.assertEqual(DocumentTokenService.get_tokens(['first', 'second'])['second'], 'token-second')
+
+        self.assertEqual(self.get_remote_tokens.call_count, 2)
+        self.get_remote_tokens.assert_called_with(['second'], wanted_post_process='ORIGINAL')
+
+    def test_tokens_depend_on_the_post_process(self):
+        DocumentTokenService.get_token('first')
+        DocumentTokenService.get_token('first', wanted_post_process='CONVERT')
+
+        self.assertEqual(self.get_remote_tokens.call_count, 2)
+
+    def test_unknown_document(self):
+        self.assertIsNone(DocumentTokenService.get_token('unknown'))
+        self.assertIsNone(DocumentTokenService.get_token('unknown'))
+
+        self.assertEqual(self.get_remote_tokens.call_count, 2)
+
+    @override_settings(PARCOURS_DOCTORAL_DOCUMENT_TOKEN_CACHE_TIMEOUT=0)
+    def test_cache_can_be_disabled(self):
+        DocumentTokenService.get_token('first')
+        DocumentTokenService.get_token('first')
+
+        self.assertEqual(self.get_remote_tokens.call_count, 2)
+
+    def test_cached_tokens_are_returned_when_osis_document_is_saturated(self):
+        DocumentTokenService.get_token('first')
+
+        with patch('parcours_doctoral.services.documents.get_bulkhead') as get_bulkhead:
+            get_bulkhead.return_value.slot.side_effect = BulkheadFull('documents')
+            tokens = DocumentTokenService.get_tokens(['first', 'second'])
+
+        self.assertEqual(tokens, {'first': 'token-first'})
+        get_bulkhead.assert_called_once_with('documents')
@@ -0,0 +1,142 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import threading
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import translation
+from osis_parcours_doctoral_sdk.model.supervision_canvas import SupervisionCanvas
+
+from base.tests.factories.person import PersonFactory
+from parcours_doctoral.services.cache import DoctorateDataCache
+from parcours_doctoral.services.jobs import Job, LocalJobQueueBackend, enqueue
+from parcours_doctoral.services.pdf import (
+    PdfDeliveryCache,
+    enqueue_training_recaps,
+    make_document_key,
+    pdf_delivery_cache,
+)
+
+calls = []
+
+
+def record_call(**kwargs):
+    calls.append((translation.get_language(), kwargs))
+
+
+def wait_for_event(started, event):
+    started.set()
+    event.wait(timeout=5)
+
+
+def failing_job():
+    raise ValueError
+
+
+class JobQueueTestCase(SimpleTestCase):
+    def setUp(self):
+        calls.clear()
+
+    @override_settings(PARCOURS_DOCTORAL_JOB_QUEUE_BACKEND='parcours_doctoral.services.jobs.ImmediateJobQueueBackend')
+    def test_job_is_run_in_the_current_language(self):
+        with translation.override('fr-be'):
+            enqueue(f'{__name__}.record_call', value=1)
+
+        self.assertEqual(calls, [('fr-be', {'value': 1})])
+
+    @override_settings(PARCOURS_DOCTORAL_JOB_QUEUE_WORKERS=1)
+    @patch('parcours_doctoral.services.jobs.connections')
+    def test_local_backend(self, mock_connections):
+        backend = LocalJobQueueBackend()
+        self.addCleanup(backend._executor.shutdown)
+        started = threading.Event()
+        event = threading.Event()
+
+        # The worker is busy, the same job is then only queued once
+        backend.enqueue(Job(f'{__name__}.wait_for_event', {'started': started, 'event': event}))
+        started.wait(timeout=5)
+        backend.enqueue(Job(f'{__name__}.record_call', {'value': 1}, 'en'))
+        backend.enqueue(Job(f'{__name__}.record_call', {'value': 1}, 'en'))
+        backend.enqueue(Job(f'{__name__}.record_call', {'value': 2}, 'en'))
+        event.set()
+        backend._executor.shutdown(wait=True)
+
+        self.assertCountEqual(calls, [('en', {'value': 1}), ('en', {'value': 2})])
+        self.assertEqual(mock_connections.close_all.call_count, 3)
+
+    @patch('parcours_doctoral.services.jobs.connections')
+    def test_local_backend_logs_the_failures(self, mock_connections):
+        backend = LocalJobQueueBackend()
+
+        with self.assertLogs('parcours_doctoral.services.jobs', level='ERROR'):
+            backend.enqueue(Job(f'{__name__}.failing_job'))
+            backend._executor.shutdown(wait=True)
+
+
+@override_settings(
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'jobs-tests'}},
+    PARCOURS_DOCTORAL_DOCTORATE_CACHE_TIMEOUT=60,
+    PARCOURS_DOCTORAL_PDF_CACHE_TIMEOUT=60,
+    PARCOURS_DOCTORAL_JOB_QUEUE_BACKEND='parcours_doctoral.services.jobs.ImmediateJobQueueBackend',
+)
+class TrainingRecapsGenerationTestCase(TestCase):
+    @patch('parcours_doctoral.services.pdf.DoctorateService.get_training_recap_pdf')
+    def test_training_recaps_are_generated_and_cached(self, mock_get_training_recap_pdf):
+        cache.clear()
+        person = PersonFactory()
+        mock_get_training_recap_pdf.side_effect = lambda status, **kwargs: SupervisionCanvas._from_openapi_data(
+            url=f'http://dummyurl/{status}',
+        )
+
+        enqueue_training_recaps(person, 'doctorate-uuid')
+        enqueue_training_recaps(person, 'doctorate-uuid')
+
+        self.assertEqual(mock_get_training_recap_pdf.call_count, 2)
+        self.assertEqual(
+            pdf_delivery_cache.get_or_load(
+                key=make_document_key('training_recap', person.pk, pk='doctorate-uuid', status='ACCEPTEE'),
+                doctorate_uuid='doctorate-uuid',
+                loader=lambda: None,
+            ),
+            'http://dummyurl/ACCEPTEE',
+        )
+
+        # The recaps are also delivered by the other processes
+        self.assertEqual(
+            PdfDeliveryCache('pdf').get_or_load(
+                key=make_document_key('training_recap', person.pk, pk='doctorate-uuid', status='SOUMISE'),
+                doctorate_uuid='doctorate-uuid',
+                loader=lambda: None,
+            ),
+            'http://dummyurl/SOUMISE',
+        )
+
+        # The recaps are generated again once the doctorate has changed
+        DoctorateDataCache.invalidate('doctorate-uuid')
+        enqueue_training_recaps(person, 'doctorate-uuid')
+
+        self.assertEqual(mock_get_training_recap_pdf.call_count, 4)
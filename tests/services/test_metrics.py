@@ -0,0 +1,161 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from django.http import Http404, HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+from prometheus_client import REGISTRY
+
+from parcours_doctoral.middleware import ServiceRequestContextMiddleware
+from parcours_doctoral.services.context import service_request_context
+from parcours_doctoral.services.metrics import (
+    SERVICE_CALL_DURATION,
+    SERVICE_CALLS,
+    SERVICE_RESPONSE_SIZE,
+    record_response,
+)
+from parcours_doctoral.services.mixins import ServiceMeta, request_cached
+from parcours_doctoral.services.resilience import CircuitBreakerOpen
+from parcours_doctoral.tests.utils import get_metric_value
+
+
+class DummyApiException(Exception):
+    pass
+
+
+class DummyService(metaclass=ServiceMeta):
+    api_exception_cls = DummyApiException
+
+    @classmethod
+    @request_cached
+    def get_doctorate(cls, person, uuid):
+        record_response(200, 1500)
+        return uuid
+
+    @classmethod
+    @request_cached
+    def get_doctorates(cls, person):
+        return [cls.get_doctorate(person=person, uuid='uuid-1'), cls.get_doctorate(person=person, uuid='uuid-2')]
+
+    @classmethod
+    def build_config(cls):
+        return 'config'
+
+    @classmethod
+    def get_missing_doctorate(cls, person, uuid):
+        raise Http404
+
+    @classmethod
+    def get_failing_doctorate(cls, person, uuid):
+        raise ValueError
+
+
+class ServiceMetricsTestCase(SimpleTestCase):
+    def setUp(self):
+        for metric in [SERVICE_CALLS, SERVICE_CALL_DURATION, SERVICE_RESPONSE_SIZE]:
+            metric.clear()
+
+    def test_calls_are_counted_by_outcome(self):
+        DummyService.get_doctorate(person=None, uuid='uuid-1')
+        with self.assertRaises(Http404):
+            DummyService.get_missing_doctorate(person=None, uuid='uuid-1')
+        with self.assertRaises(ValueError):
+            DummyService.get_failing_doctorate(person=None, uuid='uuid-1')
+
+        self.assertEqual(get_metric_value(SERVICE_CALLS, ('DummyService', 'get_doctorate', 'success')), 1)
+        self.assertEqual(get_metric_value(SERVICE_CALLS, ('DummyService', 'get_missing_doctorate', '4xx')), 1)
+        self.assertEqual(get_metric_value(SERVICE_CALLS, ('DummyService', 'get_failing_doctorate', 'error')), 1)
+        self.assertEqual(
+            get_metric_value(SERVICE_CALL_DURATION, ('DummyService', 'get_doctorate', 'success'), suffix='_count'),
+            1,
+        )
+        self.assertEqual(
+            get_metric_value(SERVICE_RESPONSE_SIZE, ('DummyService', 'get_doctorate'), suffix='_sum'),
+            1500,
+        )
+
+    def test_memoized_calls_are_not_measured(self):
+        with service_request_context() as context:
+            DummyService.get_doctorate(person=None, uuid='uuid-1')
+            DummyService.get_doctorate(person=None, uuid='uuid-1')
+
+        self.assertEqual(get_metric_value(SERVICE_CALLS, ('DummyService', 'get_doctorate', 'success')), 1)
+        self.assertEqual(len(context.calls), 1)
+        self.assertEqual(context.calls[0].status, 200)
+        self.assertEqual(context.calls[0].requests, 1)
+        self.assertEqual(context.get_summary()['DummyService.get_doctorate']['count'], 1)
+
+    def test_nested_calls_are_measured_with_the_calling_one(self):
+        with service_request_context() as context:
+            DummyService.get_doctorates(person=None)
+
+        self.assertEqual(get_metric_value(SERVICE_CALLS, ('DummyService', 'get_doctorates', 'success')), 1)
+        self.assertEqual(get_metric_value(SERVICE_CALLS, ('DummyService', 'get_doctorate', 'success')), 0)
+        self.assertEqual([call.name for call in context.calls], ['DummyService.get_doctorates'])
+        self.assertEqual(context.calls[0].requests, 2)
+        self.assertEqual(context.calls[0].response_size, 3000)
+
+    def test_helpers_are_not_measured(self):
+        with service_request_context() as context:
+            self.assertEqual(DummyService.build_config(), 'config')
+
+        self.assertEqual(get_metric_value(SERVICE_CALLS, ('DummyService', 'build_config', 'success')), 0)
+        self.assertEqual(context.calls, [])
+
+    def test_metrics_are_registered_in_the_prometheus_client(self):
+        DummyService.get_doctorate(person=None, uuid='uuid-1')
+
+        self.assertEqual(
+            REGISTRY.get_sample_value(
+                'parcours_doctoral_service_calls_total',
+                {'service': 'DummyService', 'method': 'get_doctorate', 'outcome': 'success'},
+            ),
+            1,
+        )
+
+
+class ServiceRequestContextMiddlewareTestCase(SimpleTestCase):
+    def get_response(self, request):
+        DummyService.get_doctorate(person=None, uuid='uuid-1')
+        DummyService.get_doctorate(person=None, uuid='uuid-2')
+        return HttpResponse()
+
+    @override_settings(PARCOURS_DOCTORAL_SERVER_TIMING=True)
+    def test_summary_is_added_to_the_response(self):
+        response = ServiceRequestContextMiddleware(self.get_response)(RequestFactory().get('/'))
+        self.assertRegex(response['Server-Timing'], r'^DummyService\.get_doctorate;dur=[0-9.]+;desc="2 calls"$')
+
+    @override_settings(PARCOURS_DOCTORAL_SERVER_TIMING=False)
+    def test_summary_is_not_added_by_default(self):
+        response = ServiceRequestContextMiddleware(self.get_response)(RequestFactory().get('/'))
+        self.assertNotIn('Server-Timing', response)
+
+    def test_unavailable_services_are_answered_with_a_503_response(self):
+        middleware = ServiceRequestContextMiddleware(self.get_response)
+        request = RequestFactory().get('/')
+
+        response = middleware.process_exception(request, CircuitBreakerOpen('osis_reference_sdk', 'CountriesService'))
+        self.assertEqual(response.status_code, 503)
+
+        self.assertIsNone(middleware.process_exception(request, ValueError()))
@@ -0,0 +1,101 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from unittest.mock import MagicMock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from parcours_doctoral.services.cache import DoctorateDataCache
+from parcours_doctoral.services.context import service_request_context
+from parcours_doctoral.services.mixins import ServiceMeta, request_cached
+
+
+class DummyApiException(Exception):
+    pass
+
+
+class RequestCacheTestCase(SimpleTestCase):
+    def setUp(self):
+        self.api = api = MagicMock()
+
+        class DummyService(metaclass=ServiceMeta):
+            api_exception_cls = DummyApiException
+
+            @classmethod
+            @request_cached
+            def get_doctorate(cls, person, uuid):
+                return api.retrieve(uuid=uuid)
+
+            @classmethod
+            def update_doctorate(cls, person, uuid_doctorate, data):
+                return api.update(uuid=uuid_doctorate, data=data)
+
+        self.service = DummyService
+        self.person = MagicMock(pk=1)
+
+    def test_no_memoization_outside_a_request(self):
+        self.service.get_doctorate(person=self.person, uuid='uuid-1')
+        self.service.get_doctorate(person=self.person, uuid='uuid-1')
+        self.assertEqual(self.api.retrieve.call_count, 2)
+
+    def test_identical_calls_are_memoized_during_a_request(self):
+        with service_request_context():
+            first_result = self.service.get_doctorate(person=self.person, uuid='uuid-1')
+            second_result = self.service.get_doctorate(self.person, 'uuid-1')
+            self.service.get_doctorate(person=self.person, uuid='uuid-2')
+            self.service.get_doctorate(person=MagicMock(pk=2), uuid='uuid-1')
+
+        self.assertIs(first_result, second_result)
+        self.assertEqual(self.api.retrieve.call_count, 3)
+
+    def test_write_method_clears_the_results_of_the_same_doctorate(self):
+        with service_request_context():
+            self.service.get_doctorate(person=self.person, uuid='uuid-1')
+            self.service.get_doctorate(person=self.person, uuid='uuid-2')
+            self.service.update_doctorate(person=self.person, uuid_doctorate='uuid-1', data={})
+            self.service.get_doctorate(person=self.person, uuid='uuid-1')
+            self.service.get_doctorate(person=self.person, uuid='uuid-2')
+
+        self.assertEqual(self.api.retrieve.call_count, 3)
+
+    def test_nested_contexts_share_the_results(self):
+        with service_request_context() as outer_context:
+            with service_request_context() as inner_context:
+                self.service.get_doctorate(person=self.person, uuid='uuid-1')
+            self.service.get_doctorate(person=self.person, uuid='uuid-1')
+
+        self.assertIs(outer_context, inner_context)
+        self.assertEqual(self.api.retrieve.call_count, 1)
+
+    @override_settings(
+        CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'mixins-tests'}},
+        PARCOURS_DOCTORAL_DOCTORATE_CACHE_TIMEOUT=30,
+    )
+    def test_write_method_changes_the_version_of_the_doctorate(self):
+        cache.clear()
+        version = DoctorateDataCache.get_version('uuid-1')
+        self.service.update_doctorate(person=self.person, uuid_doctorate='uuid-1', data={})
+        self.assertNotEqual(DoctorateDataCache.get_version('uuid-1'), version)
@@ -0,0 +1,60 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, override_settings
+
+from parcours_doctoral.services.context import service_request_context
+from parcours_doctoral.services.deadline import DeadlineExceeded
+from parcours_doctoral.services.pdf import open_remote_file
+
+
+@override_settings(PARCOURS_DOCTORAL_STREAMING_TIMEOUT=(5, 30))
+class OpenRemoteFileTestCase(SimpleTestCase):
+    def setUp(self):
+        patcher = patch('parcours_doctoral.services.pdf.get_pool_manager')
+        self.request = patcher.start().return_value.request
+        self.addCleanup(patcher.stop)
+
+    def test_timeouts_are_set(self):
+        open_remote_file('http://dummyurl/file.pdf', range_header='bytes=0-3')
+
+        timeout = self.request.call_args.kwargs['timeout']
+        self.assertEqual(timeout.connect_timeout, 5)
+        self.assertEqual(timeout.read_timeout, 30)
+        self.assertEqual(self.request.call_args.kwargs['headers'], {'Range': 'bytes=0-3'})
+
+    def test_timeouts_are_bounded_by_the_deadline(self):
+        with service_request_context(timeout=2) as context:
+            open_remote_file('http://dummyurl/file.pdf')
+
+            timeout = self.request.call_args.kwargs['timeout']
+            self.assertLessEqual(timeout.connect_timeout, 2)
+            self.assertLessEqual(timeout.read_timeout, 2)
+
+            context.deadline -= 2
+            with self.assertRaises(DeadlineExceeded):
+                open_remote_file('http://dummyurl/file.pdf')
@@ -0,0 +1,191 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from collections import namedtuple
+from unittest.mock import Mock, patch
+
+from django.core.cache import cache
+from django.http import Http404
+from django.test import SimpleTestCase, override_settings
+from django.utils.translation import override
+from osis_reference_sdk.models.language import Language
+
+from parcours_doctoral.services import reference
+from parcours_doctoral.services.reference import (
+    SuperiorInstituteService,
+    SuperiorNonUniversityService,
+    UniversityService,
+    get_superior_institutes_index,
+    reference_data_cache,
+)
+
+MockInstitute = namedtuple('MockInstitute', ['uuid', 'name', 'city'])
+
+
+@override_settings(PARCOURS_DOCTORAL_REFERENCE_INDEX_TIMEOUT=3600)
+class SuperiorInstitutesIndexTestCase(SimpleTestCase):
+    def setUp(self):
+        self.addCleanup(reference._superior_institutes_indexes.clear)
+
+        countries_patcher = patch.object(reference.countries_index, 'get')
+        self.get_country = countries_patcher.start()
+        self.addCleanup(countries_patcher.stop)
+        known_countries = {'BE', 'FR', 'NL'}
+        self.get_country.side_effect = lambda iso_code, person=None: iso_code if iso_code in known_countries else None
+
+        universities_api_patcher = patch('osis_reference_sdk.api.universities_api.UniversitiesApi')
+        self.universities_api = universities_api_patcher.start().return_value
+        self.addCleanup(universities_api_patcher.stop)
+        self.universities_api.universities_list.return_value = Mock(
+            results=[
+                MockInstitute(uuid='u1', name='Université de Liège', city='Liège'),
+                MockInstitute(uuid='u2', name='Université catholique de Louvain', city='Louvain-la-Neuve'),
+            ],
+            count=2,
+        )
+
+        non_universities_api_patcher = patch(
+            'osis_reference_sdk.api.superior_non_universities_api.SuperiorNonUniversitiesApi'
+        )
+        self.non_universities_api = non_universities_api_patcher.start().return_value
+        self.addCleanup(non_universities_api_patcher.stop)
+        self.non_universities_api.superior_non_universities_list.return_value = Mock(
+            results=[MockInstitute(uuid='n1', name='Haute école de Namur', city='Namur')],
+            count=1,
+        )
+
+    def test_universities_and_non_universities_are_merged_and_sorted_by_name(self):
+        index = get_superior_institutes_index('BE')
+
+        self.assertEqual([institute.uuid for institute in index.search('')], ['n1', 'u2', 'u1'])
+        self.assertEqual([institute.uuid for institute in index.search('', limit=1, offset=1)], ['u2'])
+        self.assertEqual([institute.uuid for institute in index.search('louvain')], ['u2'])
+        self.assertEqual([institute.uuid for institute in index.search('namur')], ['n1'])
+
+        # The upstream lists are only loaded once for all the pages
+        self.universities_api.universities_list.assert_called_once()
+        self.non_universities_api.superior_non_universities_list.assert_called_once()
+        self.assertEqual(self.universities_api.universities_list.call_args[1]['country_iso_code'], 'BE')
+        self.assertIs(self.universities_api.universities_list.call_args[1]['active'], True)
+
+    def test_institutes_are_indexed_per_country(self):
+        self.assertIs(get_superior_institutes_index('BE'), get_superior_institutes_index('BE'))
+        self.assertIsNot(get_superior_institutes_index('BE'), get_superior_institutes_index('FR'))
+
+    def test_no_index_of_the_institutes_of_all_the_countries(self):
+        self.assertIsNone(get_superior_institutes_index(''))
+        self.assertEqual(reference._superior_institutes_indexes, {})
+        self.universities_api.universities_list.assert_not_called()
+
+    def test_no_index_for_an_unknown_country(self):
+        self.assertIsNone(get_superior_institutes_index('XX'))
+        self.assertNotIn('XX', reference._superior_institutes_indexes)
+
+    @override_settings(PARCOURS_DOCTORAL_SUPERIOR_INSTITUTES_INDEXES_MAX=2)
+    def test_only_the_last_used_indexes_are_kept(self):
+        belgian_index = get_superior_institutes_index('BE')
+        get_superior_institutes_index('FR')
+        self.assertIs(get_superior_institutes_index('BE'), belgian_index)
+        get_superior_institutes_index('NL')
+
+        self.assertEqual(list(reference._superior_institutes_indexes), ['BE', 'NL'])
+
+
+@override_settings(
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'institutes-tests'}},
+    PARCOURS_DOCTORAL_REFERENCE_CACHE_TIMEOUT=60,
+    PARCOURS_DOCTORAL_REFERENCE_INDEX_TIMEOUT=3600,
+)
+class SuperiorInstituteServiceTestCase(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        for reference_cache in [reference.reference_data_cache, reference.institute_types_cache]:
+            reference_cache.clear_local()
+        self.addCleanup(reference._superior_institutes_indexes.clear)
+
+        self.university = MockInstitute(uuid='u1', name='Université de Liège', city='Liège')
+        self.non_university = MockInstitute(uuid='n1', name='Haute école de Namur', city='Namur')
+
+        get_university_patcher = patch.object(UniversityService, 'get_university')
+        self.get_university = get_university_patcher.start()
+        self.addCleanup(get_university_patcher.stop)
+        self.get_university.side_effect = lambda person, uuid: self._get_institute(self.university, uuid)
+
+        get_non_university_patcher = patch.object(SuperiorNonUniversityService, 'get_superior_non_university')
+        self.get_non_university = get_non_university_patcher.start()
+        self.addCleanup(get_non_university_patcher.stop)
+        self.get_non_university.side_effect = lambda person, uuid: self._get_institute(self.non_university, uuid)
+
+    def _get_institute(self, institute, uuid):
+        if institute.uuid != uuid:
+            raise Http404
+        return institute
+
+    def test_type_of_an_institute_is_remembered_after_a_lookup(self):
+        self.assertEqual(SuperiorInstituteService.get_superior_institute(person=None, uuid='n1'), self.non_university)
+        self.assertEqual(self.get_university.call_count, 1)
+
+        # The institute is loaded again in another language, directly from the right endpoint
+        with override('en'):
+            SuperiorInstituteService.get_superior_institute(person=None, uuid='n1')
+        self.assertEqual(self.get_university.call_count, 1)
+        self.assertEqual(self.get_non_university.call_count, 2)
+
+    @patch.object(UniversityService, 'get_universities')
+    @patch.object(SuperiorNonUniversityService, 'get_paginated_superior_non_universities')
+    @patch.object(reference.countries_index, 'get', return_value='BE')
+    def test_type_of_an_institute_is_remembered_from_the_listings(self, _, get_non_universities, get_universities):
+        get_universities.return_value = Mock(results=[self.university], count=1)
+        get_non_universities.return_value = Mock(results=[self.non_university], count=1)
+        get_superior_institutes_index('BE').search('')
+
+        SuperiorInstituteService.get_superior_institute(person=None, uuid='n1')
+        self.get_university.assert_not_called()
+        self.get_non_university.assert_called_once()
+
+
+@override_settings(
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'reference-tests'}},
+    PARCOURS_DOCTORAL_REFERENCE_CACHE_TIMEOUT=60,
+)
+class ReferenceDataCacheTestCase(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        reference_data_cache.clear_local()
+
+    def test_models_are_shared_as_plain_data(self):
+        language = Language._from_openapi_data(code='FR', name='Français', name_en='French')
+        reference_data_cache.set('language', language)
+
+        self.assertEqual(
+            cache.get(reference_data_cache.make_key('language')),
+            {'model': 'Language', 'data': {'code': 'FR', 'name': 'Français', 'name_en': 'French'}},
+        )
+
+        # Loaded by another process
+        reference_data_cache.clear_local()
+        loaded_language = reference_data_cache.get('language')
+        self.assertIsInstance(loaded_language, Language)
+        self.assertEqual(loaded_language.to_dict(), language.to_dict())
@@ -0,0 +1,122 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from unittest.mock import MagicMock, Mock, patch
+
+from django.test import SimpleTestCase, override_settings
+from django.utils.translation import override
+
+from parcours_doctoral.services import reference_index
+from parcours_doctoral.services.reference_index import ReferenceIndex
+from parcours_doctoral.tests.utils import MockCountry
+
+
+@override_settings(PARCOURS_DOCTORAL_REFERENCE_INDEX_TIMEOUT=3600)
+class ReferenceIndexTestCase(SimpleTestCase):
+    def setUp(self):
+        self.countries = [
+            MockCountry(iso_code='BE', name='Belgique', name_en='Belgium', european_union=True),
+            MockCountry(iso_code='EG', name='Égypte', name_en='Egypt', european_union=False),
+            MockCountry(iso_code='DE', name='Allemagne', name_en='Germany', european_union=True),
+        ]
+        self.load_page = MagicMock(side_effect=self.load_countries_page)
+        self.index = ReferenceIndex('countries', 'iso_code', self.load_page)
+
+    def load_countries_page(self, person, limit, offset):
+        return Mock(results=self.countries[offset : offset + limit], count=len(self.countries))
+
+    def test_table_is_loaded_in_pages(self):
+        with patch.object(reference_index, 'LOAD_PAGE_SIZE', 2):
+            self.assertEqual(self.index.get('DE'), self.countries[2])
+        self.assertEqual(self.load_page.call_count, 2)
+
+        self.index.get('BE')
+        self.assertIsNone(self.index.get('XX'))
+        self.assertEqual(self.load_page.call_count, 2)
+
+    def test_table_is_fully_loaded_if_the_backend_returns_smaller_pages(self):
+        self.load_page.side_effect = lambda person, limit, offset: self.load_countries_page(person, 1, offset)
+        self.assertEqual(self.index.get('DE'), self.countries[2])
+        self.assertEqual(self.load_page.call_count, 3)
+        self.assertEqual([call[1]['offset'] for call in self.load_page.call_args_list], [0, 1, 2])
+
+    def test_search_ignores_accents_and_case(self):
+        self.assertEqual(self.index.search('EGY'), [self.countries[1]])
+        self.assertEqual(self.index.search('germ'), [self.countries[2]])
+
+    def test_search_returns_the_closest_items_if_no_name_matches(self):
+        self.assertEqual(self.index.search('belgiqe'), [self.countries[0]])
+
+    def test_items_of_several_tables_are_indexed(self):
+        other_load_page = MagicMock(
+            return_value=Mock(
+                results=[MockCountry(iso_code='FR', name='France', name_en='France', european_union=True)],
+                count=1,
+            )
+        )
+        index = ReferenceIndex('countries', 'iso_code', self.load_page, other_load_page)
+        self.assertEqual(index.search('fr'), other_load_page.return_value.results)
+        self.assertEqual(index.get('BE'), self.countries[0])
+
+    def test_search_index_is_updated_on_refresh(self):
+        self.index.get('BE')
+        self.countries[0] = MockCountry(iso_code='BE', name='Belgïe', name_en='Belgium', european_union=True)
+        del self.countries[1]
+        self.index._refresh(person=None)
+
+        self.assertEqual(self.index.search('belgie'), [self.countries[0]])
+        self.assertEqual(self.index.search('egypt'), [])
+
+    def test_search_is_sorted_and_paginated(self):
+        with override('en'):
+            self.assertEqual(self.index.search(''), [self.countries[0], self.countries[1], self.countries[2]])
+            self.assertEqual(self.index.search('', limit=1, offset=1), [self.countries[1]])
+        with override('fr-be'):
+            self.assertEqual(self.index.search(''), [self.countries[2], self.countries[0], self.countries[1]])
+
+    @override_settings(PARCOURS_DOCTORAL_REFERENCE_INDEX_TIMEOUT=0)
+    def test_index_can_be_disabled(self):
+        self.assertIsNone(self.index.get('BE'))
+        self.assertIsNone(self.index.search('Bel'))
+        self.load_page.assert_not_called()
+
+    def test_load_failure_is_not_retried_immediately(self):
+        self.load_page.side_effect = Exception('Unavailable')
+        self.assertIsNone(self.index.get('BE'))
+        self.assertIsNone(self.index.search('Bel'))
+        self.load_page.assert_called_once()
+
+    def test_expired_index_is_refreshed_in_background(self):
+        self.index.get('BE')
+        self.index._loaded_at -= 3601
+        self.countries.append(MockCountry(iso_code='FR', name='France', name_en='France', european_union=True))
+
+        with patch.object(reference_index, 'get_executor') as get_executor:
+            get_executor.return_value.submit.side_effect = lambda function, *args: function(*args)
+            # The refresh happens after the current version is read
+            self.assertIsNone(self.index.get('FR'))
+
+        self.assertEqual(self.index.get('FR'), self.countries[3])
+        self.assertEqual(self.load_page.call_count, 2)
@@ -0,0 +1,260 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from unittest import mock
+
+from django.http import Http404
+from django.test import SimpleTestCase, override_settings
+
+from parcours_doctoral.services.context import service_request_context
+from parcours_doctoral.services.deadline import DeadlineExceeded
+from parcours_doctoral.services.metrics import (
+    CIRCUIT_BREAKER_STATE,
+    CIRCUIT_BREAKER_TRIPS,
+    SERVICE_CALL_RETRIES,
+    SERVICE_CALLS,
+)
+from parcours_doctoral.services.mixins import ServiceMeta, not_retried, request_cached
+from parcours_doctoral.services.resilience import (
+    CircuitBreakerOpen,
+    get_circuit_breaker,
+    is_transient_failure,
+    reset_circuit_breakers,
+)
+from parcours_doctoral.tests.utils import get_metric_value
+
+
+class DummyApiException(Exception):
+    def __init__(self, status):
+        self.status = status
+
+
+class Backend:
+    calls = []
+    failures = 0
+
+    @classmethod
+    def call(cls, method):
+        cls.calls.append(method)
+        if cls.failures:
+            cls.failures -= 1
+            raise TimeoutError
+        return method
+
+
+class ResilientService(metaclass=ServiceMeta):
+    api_exception_cls = DummyApiException
+
+    @classmethod
+    @request_cached
+    def get_doctorate(cls, person, uuid):
+        return Backend.call('get_doctorate')
+
+    @classmethod
+    def update_doctorate(cls, person, uuid):
+        return Backend.call('update_doctorate')
+
+    @classmethod
+    @request_cached
+    @not_retried
+    def get_doctorate_pdf(cls, person, uuid):
+        return Backend.call('get_doctorate_pdf')
+
+    @classmethod
+    @request_cached
+    def get_doctorate_with_pdf(cls, person, uuid):
+        return Backend.call('get_doctorate'), OtherResilientService.get_pdf(person=person, uuid=uuid)
+
+    @classmethod
+    @request_cached
+    def get_missing_doctorate(cls, person, uuid):
+        Backend.calls.append('get_missing_doctorate')
+        raise Http404
+
+
+class OtherResilientService(metaclass=ServiceMeta):
+    api_exception_cls = DummyApiException
+
+    @classmethod
+    @request_cached
+    def get_pdf(cls, person, uuid):
+        return Backend.call('get_pdf')
+
+
+@override_settings(
+    PARCOURS_DOCTORAL_CIRCUIT_BREAKER_THRESHOLD=3,
+    PARCOURS_DOCTORAL_CIRCUIT_BREAKER_RESET_TIMEOUT=30,
+    PARCOURS_DOCTORAL_RETRY_ATTEMPTS=2,
+    PARCOURS_DOCTORAL_RETRY_BASE_DELAY=0,
+    PARCOURS_DOCTORAL_RETRY_MAX_DELAY=0,
+)
+class ResilienceTestCase(SimpleTestCase):
+    def setUp(self):
+        self.breaker = get_circuit_breaker('parcours_doctoral', 'ResilientService')
+        self.breaker.reset()
+        get_circuit_breaker('parcours_doctoral', 'OtherResilientService').reset()
+        Backend.calls = []
+        Backend.failures = 0
+        for metric in [CIRCUIT_BREAKER_STATE, CIRCUIT_BREAKER_TRIPS, SERVICE_CALL_RETRIES, SERVICE_CALLS]:
+            metric.clear()
+
+    def test_transient_failures(self):
+        self.assertTrue(is_transient_failure(DummyApiException(status=503)))
+        self.assertFalse(is_transient_failure(DummyApiException(status=400)))
+        self.assertTrue(is_transient_failure(TimeoutError()))
+        self.assertFalse(is_transient_failure(Http404()))
+        self.assertFalse(is_transient_failure(ValueError()))
+
+    def test_idempotent_calls_are_retried(self):
+        Backend.failures = 2
+
+        self.assertEqual(ResilientService.get_doctorate(person=None, uuid='uuid-1'), 'get_doctorate')
+
+        self.assertEqual(len(Backend.calls), 3)
+        self.assertEqual(get_metric_value(SERVICE_CALL_RETRIES, ('ResilientService', 'get_doctorate')), 2)
+        self.assertEqual(get_metric_value(SERVICE_CALLS, ('ResilientService', 'get_doctorate', 'success')), 1)
+        self.assertEqual(self.breaker.failures, 0)
+
+    def test_other_calls_are_not_retried(self):
+        Backend.failures = 1
+
+        with self.assertRaises(TimeoutError):
+            ResilientService.update_doctorate(person=None, uuid='uuid-1')
+
+        self.assertEqual(len(Backend.calls), 1)
+        self.assertEqual(get_metric_value(SERVICE_CALL_RETRIES, ('ResilientService', 'update_doctorate')), 0)
+
+    def test_generations_are_not_retried(self):
+        Backend.failures = 1
+
+        with self.assertRaises(TimeoutError):
+            ResilientService.get_doctorate_pdf(person=None, uuid='uuid-1')
+
+        self.assertEqual(len(Backend.calls), 1)
+        self.assertEqual(get_metric_value(SERVICE_CALL_RETRIES, ('ResilientService', 'get_doctorate_pdf')), 0)
+
+    def test_nested_calls_which_are_not_made_are_not_failures(self):
+        other_breaker = get_circuit_breaker('parcours_doctoral', 'OtherResilientService')
+        for _ in range(3):
+            other_breaker.record_failure()
+
+        for _ in range(3):
+            with self.assertRaises(CircuitBreakerOpen):
+                ResilientService.get_doctorate_with_pdf(person=None, uuid='uuid-1')
+
+        # The calls are not retried and the breaker of the calling service is kept closed
+        self.assertEqual(Backend.calls, ['get_doctorate'] * 3)
+        self.assertEqual(self.breaker.failures, 0)
+        self.assertEqual(self.breaker.state, 'closed')
+
+    def test_business_errors_are_not_retried_and_do_not_trip_the_breaker(self):
+        for _ in range(5):
+            with self.assertRaises(Http404):
+                ResilientService.get_missing_doctorate(person=None, uuid='uuid-1')
+
+        self.assertEqual(len(Backend.calls), 5)
+        self.assertEqual(get_metric_value(CIRCUIT_BREAKER_TRIPS, ('parcours_doctoral', 'ResilientService')), 0)
+
+    def test_breaker_opens_and_fails_fast(self):
+        Backend.failures = 10
+
+        with self.assertRaises(TimeoutError):
+            ResilientService.get_doctorate(person=None, uuid='uuid-1')
+
+        # The retries stop as soon as the breaker is open
+        self.assertEqual(len(Backend.calls), 3)
+        self.assertEqual(get_metric_value(CIRCUIT_BREAKER_TRIPS, ('parcours_doctoral', 'ResilientService')), 1)
+        self.assertEqual(get_metric_value(CIRCUIT_BREAKER_STATE, ('parcours_doctoral', 'ResilientService')), 2)
+
+        with self.assertRaises(CircuitBreakerOpen):
+            ResilientService.update_doctorate(person=None, uuid='uuid-1')
+
+        self.assertEqual(len(Backend.calls), 3)
+        self.assertEqual(get_metric_value(SERVICE_CALLS, ('ResilientService', 'update_doctorate', 'circuit_open')), 1)
+
+    def test_breaker_closes_after_a_successful_trial_call(self):
+        Backend.failures = 3
+        with mock.patch('parcours_doctoral.services.resilience.time.monotonic', return_value=1000):
+            with self.assertRaises(TimeoutError):
+                ResilientService.get_doctorate(person=None, uuid='uuid-1')
+
+        with mock.patch('parcours_doctoral.services.resilience.time.monotonic', return_value=1030):
+            self.assertEqual(ResilientService.update_doctorate(person=None, uuid='uuid-1'), 'update_doctorate')
+
+        self.assertEqual(get_metric_value(CIRCUIT_BREAKER_STATE, ('parcours_doctoral', 'ResilientService')), 0)
+
+    def test_breaker_opens_again_after_a_failed_trial_call(self):
+        Backend.failures = 4
+        with mock.patch('parcours_doctoral.services.resilience.time.monotonic', return_value=1000):
+            with self.assertRaises(TimeoutError):
+                ResilientService.get_doctorate(person=None, uuid='uuid-1')
+
+        with mock.patch('parcours_doctoral.services.resilience.time.monotonic', return_value=1030):
+            with self.assertRaises(TimeoutError):
+                ResilientService.get_doctorate(person=None, uuid='uuid-1')
+            with self.assertRaises(CircuitBreakerOpen):
+                ResilientService.get_doctorate(person=None, uuid='uuid-1')
+
+        self.assertEqual(len(Backend.calls), 4)
+        self.assertEqual(get_metric_value(CIRCUIT_BREAKER_TRIPS, ('parcours_doctoral', 'ResilientService')), 2)
+
+    def test_breaker_lets_another_trial_call_after_a_deadline(self):
+        Backend.failures = 3
+        with mock.patch('parcours_doctoral.services.resilience.time.monotonic', return_value=1000):
+            with self.assertRaises(TimeoutError):
+                ResilientService.get_doctorate(person=None, uuid='uuid-1')
+
+        with mock.patch('parcours_doctoral.services.resilience.time.monotonic', return_value=1030):
+            with service_request_context(timeout=60):
+                with mock.patch.object(Backend, 'call', side_effect=DeadlineExceeded):
+                    with self.assertRaises(DeadlineExceeded):
+                        ResilientService.update_doctorate(person=None, uuid='uuid-1')
+
+                self.assertEqual(get_metric_value(CIRCUIT_BREAKER_STATE, ('parcours_doctoral', 'ResilientService')), 2)
+                self.assertEqual(ResilientService.update_doctorate(person=None, uuid='uuid-1'), 'update_doctorate')
+
+        self.assertEqual(get_metric_value(CIRCUIT_BREAKER_STATE, ('parcours_doctoral', 'ResilientService')), 0)
+        self.assertEqual(get_metric_value(CIRCUIT_BREAKER_TRIPS, ('parcours_doctoral', 'ResilientService')), 1)
+
+    def test_breakers_are_reset(self):
+        Backend.failures = 3
+        with self.assertRaises(TimeoutError):
+            ResilientService.get_doctorate(person=None, uuid='uuid-1')
+
+        reset_circuit_breakers()
+
+        self.assertEqual(ResilientService.update_doctorate(person=None, uuid='uuid-1'), 'update_doctorate')
+        self.assertEqual(get_metric_value(CIRCUIT_BREAKER_STATE, ('parcours_doctoral', 'ResilientService')), 0)
+
+    @override_settings(PARCOURS_DOCTORAL_CIRCUIT_BREAKER_THRESHOLD=0)
+    def test_breaker_can_be_disabled(self):
+        Backend.failures = 10
+
+        for _ in range(3):
+            with self.assertRaises(TimeoutError):
+                ResilientService.update_doctorate(person=None, uuid='uuid-1')
+
+        self.assertEqual(len(Backend.calls), 3)
+        self.assertEqual(get_metric_value(CIRCUIT_BREAKER_TRIPS, ('parcours_doctoral', 'ResilientService')), 0)
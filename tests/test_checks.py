@@ -0,0 +1,39 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from django.test import SimpleTestCase, override_settings
+
+from parcours_doctoral.checks import MIDDLEWARE_PATH, check_service_request_context_middleware
+
+
+class ServiceRequestContextMiddlewareCheckTestCase(SimpleTestCase):
+    @override_settings(MIDDLEWARE=['django.middleware.common.CommonMiddleware', MIDDLEWARE_PATH])
+    def test_installed_middleware(self):
+        self.assertEqual(check_service_request_context_middleware(None), [])
+
+    @override_settings(MIDDLEWARE=['django.middleware.common.CommonMiddleware'])
+    def test_missing_middleware(self):
+        warnings = check_service_request_context_middleware(None)
+        self.assertEqual([warning.id for warning in warnings], ['parcours_doctoral.W001'])
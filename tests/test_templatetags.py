@@ -24,13 +24,15 @@
 #
 # ##############################################################################
 
+import gc
 from unittest.mock import Mock, patch
 
 from django import forms
 from django.core.exceptions import ImproperlyConfigured
 from django.template import Context, Template
-from django.test import RequestFactory, TestCase
+from django.test import RequestFactory, TestCase, override_settings
 from django.urls import resolve
+from django.utils import translation
 from django.utils.translation import gettext_lazy as _
 from django.utils.translation import pgettext
 from django.views.generic import FormView
@@ -42,9 +44,12 @@ from osis_parcours_doctoral_sdk.model.parcours_doctoral_dto_links import (
 
 from base.models.utils.utils import ChoiceEnum
 from base.tests.factories.person import PersonFactory
+from parcours_doctoral.contrib.enums.training import StatutActivite
 from parcours_doctoral.contrib.forms import PDF_MIME_TYPE, DoctorateFileUploadField
+from parcours_doctoral.templatetags.doctorate_enums import enum_registry
 from parcours_doctoral.templatetags.parcours_doctoral import (
     TAB_TREE,
+    TAB_TREE_INDEX,
     Tab,
     can_make_action,
     can_read_tab,
@@ -263,6 +268,30 @@ class TemplateTagsTestCase(TestCase):
         # Check children tabs
         self.assertIn('funding', valid_tab_tree[parent_tabs[0]])
 
+    def test_tab_tree_index(self):
+        parent_tab = next(parent for parent in TAB_TREE if parent.name == 'confirmation-paper')
+
+        self.assertIs(TAB_TREE_INDEX.get_parent('extension-request'), parent_tab)
+        self.assertIs(TAB_TREE_INDEX.get_tab('extension-request'), TAB_TREE[parent_tab][1])
+        self.assertEqual(TAB_TREE_INDEX.get_children('extension-request'), TAB_TREE[parent_tab])
+        self.assertIsNone(TAB_TREE_INDEX.get_parent('unknown-tab'))
+        self.assertIsNone(TAB_TREE_INDEX.get_tab('unknown-tab'))
+        self.assertEqual(TAB_TREE_INDEX.get_children('unknown-tab'), [])
+
+    def test_tab_label(self):
+        parent_tab = next(parent for parent in TAB_TREE if parent.name == 'confirmation-paper')
+        child_tab = TAB_TREE[parent_tab][0]
+
+        for language in ['en', 'fr-be']:
+            with translation.override(language):
+                # The parent tab and its child have the same name but not the same label
+                self.assertEqual(TAB_TREE_INDEX.get_label(parent_tab), str(parent_tab.label))
+                self.assertEqual(TAB_TREE_INDEX.get_label(child_tab), str(child_tab.label))
+
+        # Tabs which are not in the tab tree
+        self.assertEqual(TAB_TREE_INDEX.get_label(Tab('custom', 'Custom label')), 'Custom label')
+        self.assertEqual(TAB_TREE_INDEX.get_label(None), '')
+
     def test_can_make_action_valid_existing_action(self):
         # The tab action is specified in the doctorate as allowed -> return True
         doctorate = self.Doctorate()
@@ -311,6 +340,7 @@ class TemplateTagsTestCase(TestCase):
         doctorate = self.Doctorate()
         self.assertTrue(can_update_tab(doctorate, Tab('funding', '')))
 
+    @override_settings(PARCOURS_DOCTORAL_DASHBOARD_LINKS_CACHE_TIMEOUT=0)
     def test_get_dashboard_links_tag(self):
         template = Template(
             """{% load parcours_doctoral %}{% get_dashboard_links %}
@@ -449,3 +479,44 @@ class DisplayTagTestCase(TestCase):
         self.assertTrue(
             form_fields_are_empty(form, 'boolean_field', 'char_field', 'integer_field', 'float_field', 'file_field'),
         )
+
+
+class DoctorateEnumsTestCase(TestCase):
+    def test_enum_display(self):
+        template = Template("{% load doctorate_enums %}{{ value|enum_display:'StatutActivite' }}")
+
+        with translation.override('en'):
+            self.assertEqual(template.render(Context({'value': 'SOUMISE'})), str(StatutActivite.SOUMISE.value))
+        self.assertEqual(template.render(Context({'value': 'UNKNOWN'})), 'UNKNOWN')
+
+        template = Template("{% load doctorate_enums %}{{ value|enum_display:'InexistantEnum' }}")
+        self.assertEqual(template.render(Context({'value': 'TEST'})), 'TEST')
+        self.assertEqual(template.render(Context({'value': None})), '')
+
+    def test_enum_display_with_an_enum_defined_later(self):
+        self.addCleanup(self.forget_test_enums)
+
+        class LaterDefinedTestEnum(ChoiceEnum):
+            FOO = "Bar"
+
+        template = Template("{% load doctorate_enums %}{{ value|enum_display:'LaterDefinedTestEnum' }}")
+        self.assertEqual(template.render(Context({'value': 'FOO'})), 'Bar')
+
+    def forget_test_enums(self):
+        # Remove the enums defined in the tests from the subclasses of ChoiceEnum and from the index
+        enum_registry.clear()
+        gc.collect()
+        self.assertIsNone(enum_registry.get_enum('LaterDefinedTestEnum'))
+
+    def test_multiple_enum_display(self):
+        template = Template("{% load doctorate_enums %}{{ values|multiple_enum_display:'StatutActivite' }}")
+
+        with translation.override('en'):
+            self.assertEqual(
+                template.render(Context({'values': ['SOUMISE', 'UNKNOWN']})),
+                f'{StatutActivite.SOUMISE.value}, UNKNOWN',
+            )
+        self.assertEqual(template.render(Context({'values': []})), '')
+
+        template = Template("{% load doctorate_enums %}{{ values|multiple_enum_display:'InexistantEnum' }}")
+        self.assertEqual(template.render(Context({'values': ['A', 'B']})), 'A, B')
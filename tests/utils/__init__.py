@@ -25,8 +25,21 @@
 # ##############################################################################
 from collections import namedtuple
 
+# Suffix of the samples holding the values of the Prometheus metrics, by type
+METRIC_SAMPLE_SUFFIXES = {'counter': '_total'}
+
 # Can't use Mock because 'name' property is reserved
 MockCountry = namedtuple('MockCountry', ['iso_code', 'name', 'name_en', 'european_union'])
 MockCity = namedtuple('MockCity', ['name'])
 MockLanguage = namedtuple('MockLanguage', ['code', 'name', 'name_en'])
 MockHighSchool = namedtuple('MockHighSchool', ['name', 'city', 'uuid'])
+
+
+def get_metric_value(metric, labels, suffix=None):
+    """Return the value of a sample of the Prometheus metric for the label values, or 0 if there is none yet."""
+    for family in metric.collect():
+        name = family.name + (METRIC_SAMPLE_SUFFIXES.get(family.type, '') if suffix is None else suffix)
+        for sample in family.samples:
+            if sample.name == name and tuple(sample.labels.values()) == tuple(labels):
+                return sample.value
+    return 0
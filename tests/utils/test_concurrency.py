@@ -0,0 +1,56 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import threading
+
+from django.test import SimpleTestCase
+from django.utils import translation
+
+from parcours_doctoral.utils.concurrency import run_concurrently
+
+
+class RunConcurrentlyTestCase(SimpleTestCase):
+    def test_results_are_returned_in_order(self):
+        self.assertEqual(run_concurrently(lambda: 1, lambda: 2, lambda: 3), [1, 2, 3])
+
+    def test_exceptions_are_returned_instead_of_results(self):
+        exception = ValueError('error')
+
+        def failing_function():
+            raise exception
+
+        self.assertEqual(run_concurrently(lambda: 1, failing_function), [1, exception])
+
+    def test_functions_are_run_concurrently_with_the_current_language(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        def wait_for_others():
+            barrier.wait()
+            return translation.get_language()
+
+        with translation.override('en'):
+            results = run_concurrently(wait_for_others, wait_for_others, wait_for_others)
+
+        self.assertEqual(results, ['en', 'en', 'en'])
@@ -0,0 +1,112 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from unittest.mock import patch
+
+from django.core.exceptions import ImproperlyConfigured
+from django.test import SimpleTestCase
+
+from parcours_doctoral.services.context import service_request_context
+from parcours_doctoral.templatetags.parcours_doctoral import TAB_TREE
+from parcours_doctoral.utils.permissions import (
+    DoctoratePermissions,
+    get_doctorate_permissions,
+)
+
+
+class Doctorate:
+    def __init__(self, uuid='uuid', links=None):
+        self.uuid = uuid
+        self.links = links or {
+            'retrieve_funding': {'url': 'my_url', 'method': 'GET'},
+            'update_funding': {'url': 'my_url', 'method': 'POST'},
+            'retrieve_project': {'error': 'Method not allowed', 'method': 'GET'},
+        }
+
+
+class DoctoratePermissionsTestCase(SimpleTestCase):
+    def test_snapshot(self):
+        permissions = DoctoratePermissions.from_doctorate(Doctorate())
+
+        self.assertEqual(permissions.actions, {'retrieve_funding', 'update_funding'})
+        self.assertTrue(permissions.can_make_action('retrieve_funding'))
+        self.assertFalse(permissions.can_make_action('retrieve_project'))
+        self.assertTrue(permissions.can_read_tab('funding'))
+        self.assertFalse(permissions.can_read_tab('project'))
+        self.assertTrue(permissions.can_update_tab('funding'))
+        self.assertFalse(permissions.can_update_tab('project'))
+
+    def test_unknown_tab(self):
+        permissions = DoctoratePermissions.from_doctorate(Doctorate())
+
+        with self.assertRaises(ImproperlyConfigured):
+            permissions.can_read_tab('unknown-tab')
+
+        with self.assertRaises(ImproperlyConfigured):
+            permissions.can_update_tab('unknown-tab')
+
+    def test_doctorate_without_links(self):
+        with self.assertRaises(ImproperlyConfigured):
+            DoctoratePermissions.from_doctorate(object())
+
+    @patch('parcours_doctoral.utils.permissions.waffle.switch_is_active', return_value=False)
+    def test_valid_tab_tree_is_computed_once(self, switch_is_active):
+        permissions = DoctoratePermissions.from_doctorate(Doctorate())
+
+        valid_tab_tree = permissions.get_valid_tab_tree(TAB_TREE)
+
+        self.assertEqual([tab.name for tabs in valid_tab_tree.values() for tab in tabs], ['funding'])
+        self.assertIs(permissions.get_valid_tab_tree(TAB_TREE), valid_tab_tree)
+        switch_is_active.assert_called_once()
+
+    def test_snapshot_is_kept_on_the_doctorate(self):
+        doctorate = Doctorate()
+
+        permissions = get_doctorate_permissions(doctorate)
+        self.assertIs(get_doctorate_permissions(doctorate), permissions)
+        self.assertIsNot(get_doctorate_permissions(Doctorate()), permissions)
+
+        # The snapshot is computed again once the links of the doctorate are modified
+        doctorate.links['retrieve_project'] = {'url': 'my_url', 'method': 'GET'}
+        self.assertTrue(get_doctorate_permissions(doctorate).can_read_tab('project'))
+
+    def test_snapshot_is_shared_during_the_request(self):
+        doctorate = Doctorate()
+
+        with service_request_context() as context:
+            permissions = get_doctorate_permissions(doctorate)
+
+            with patch('parcours_doctoral.utils.permissions._get_allowed_actions') as get_allowed_actions:
+                self.assertIs(get_doctorate_permissions(doctorate), permissions)
+                # Another instance of the same doctorate
+                self.assertIs(get_doctorate_permissions(Doctorate()), permissions)
+                get_allowed_actions.assert_not_called()
+
+            self.assertIsNot(get_doctorate_permissions(Doctorate(uuid='other-uuid')), permissions)
+
+            # The snapshot is computed again once the doctorate is modified
+            context.invalidate(doctorate.uuid)
+            doctorate.links['retrieve_project'] = {'url': 'my_url', 'method': 'GET'}
+            self.assertIsNot(get_doctorate_permissions(doctorate), permissions)
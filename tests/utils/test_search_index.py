@@ -0,0 +1,74 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from django.test import SimpleTestCase
+
+from parcours_doctoral.utils.search_index import SearchIndex, fold_text
+
+
+class SearchIndexTestCase(SimpleTestCase):
+    def setUp(self):
+        self.index = SearchIndex()
+        self.index.add('BE', 'Belgique', 'Belgium')
+        self.index.add('NL', 'Pays-Bas', 'Netherlands')
+        self.index.add('EG', 'Égypte', 'Egypt')
+
+    def test_fold_text(self):
+        self.assertEqual(fold_text('Égypte'), 'egypte')
+        self.assertEqual(fold_text(None), '')
+
+    def test_search_without_terms_returns_all_keys(self):
+        self.assertEqual(self.index.search(''), {'BE': 1, 'NL': 1, 'EG': 1})
+
+    def test_search_by_prefixes_of_the_words(self):
+        self.assertEqual(self.index.search('bel'), {'BE': 1})
+        self.assertEqual(self.index.search('EGY'), {'EG': 1})
+        self.assertEqual(self.index.search('pays b'), {'NL': 1})
+        self.assertEqual(self.index.search('bas pa'), {'NL': 1})
+        self.assertEqual(self.index.search('pays x'), {})
+
+    def test_search_misspelled_terms(self):
+        scores = self.index.search('netherlnds')
+        self.assertEqual(list(scores), ['NL'])
+        self.assertLess(scores['NL'], 1)
+
+    def test_add_replaces_the_texts_of_a_key(self):
+        self.index.add('BE', 'Belgïe')
+        self.assertEqual(self.index.search('belgie'), {'BE': 1})
+        self.assertEqual(self.index.search('belgium'), {})
+
+    def test_remove(self):
+        self.index.remove('BE')
+        self.index.remove('unknown')
+        self.assertNotIn('BE', self.index)
+        self.assertEqual(self.index.search('bel'), {})
+        # The branch of 'belgique' is pruned but the one of 'bas' is kept
+        self.assertEqual(list(self.index._root.children['b'].children), ['a'])
+
+    def test_update_only_indexes_the_changed_keys(self):
+        self.index.update({'BE': ['Belgique', 'Belgium'], 'FR': ['France', 'France']})
+        self.assertEqual(len(self.index), 2)
+        self.assertEqual(self.index.search('f'), {'FR': 1})
+        self.assertEqual(self.index.search('pays'), {})
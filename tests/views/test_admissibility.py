@@ -90,7 +90,8 @@ class AdmissibilityDetailViewTestCase(BaseDoctorateTestCase):
 
     def test_get_admissibility(self):
         self.client.force_login(self.person.user)
-        response = self.client.get(self.url)
+        with self.assertServiceCalls(maximum=3):
+            response = self.client.get(self.url)
 
         # Load the doctorate information
         self.mock_doctorate_api.return_value.doctorate_retrieve.assert_called()
@@ -94,7 +94,8 @@ class AssessmentEnrollmentListViewTestCase(BaseDoctorateTestCase):
     def test_get_assessment_enrollments(self):
         self.client.force_login(self.person.user)
 
-        response = self.client.get(self.url)
+        with self.assertServiceCalls(maximum=2):
+            response = self.client.get(self.url)
 
         # Load the doctorate information
         self.mock_doctorate_api.return_value.doctorate_retrieve.assert_called()
@@ -158,7 +159,8 @@ class AssessmentEnrollmentDetailsViewTestCase(BaseDoctorateTestCase):
     def test_get_assessment_enrollment(self):
         self.client.force_login(self.person.user)
 
-        response = self.client.get(self.url)
+        with self.assertServiceCalls(maximum=2):
+            response = self.client.get(self.url)
 
         # Load the doctorate information
         self.mock_doctorate_api.return_value.doctorate_retrieve.assert_called()
@@ -89,7 +89,8 @@ class AuthorizationDistributionDetailViewTestCase(BaseDoctorateTestCase):
 
     def test_get_authorization_distribution(self):
         self.client.force_login(self.person.user)
-        response = self.client.get(self.url)
+        with self.assertServiceCalls(maximum=2):
+            response = self.client.get(self.url)
 
         # Load the doctorate information
         self.mock_doctorate_api.return_value.doctorate_retrieve.assert_called()
@@ -28,6 +28,7 @@ import json
 import uuid
 from unittest.mock import ANY, Mock, patch
 
+from django.test import override_settings
 from django.urls import reverse
 from osis_organisation_sdk.models.entite import Entite
 from osis_organisation_sdk.models.paginated_entites import PaginatedEntites
@@ -37,6 +38,7 @@ from osis_reference_sdk.models.scholarship import Scholarship
 from base.tests.factories.person import PersonFactory
 from base.tests.test_case import OsisPortalTestCase
 from parcours_doctoral.contrib.enums.scholarship import TypeBourse
+from parcours_doctoral.services.reference import countries_index, languages_index
 from parcours_doctoral.tests.utils import MockCountry, MockLanguage
 
 DEFAULT_API_PARAMS = {
@@ -48,6 +50,7 @@ DEFAULT_API_PARAMS = {
 }
 
 
+@override_settings(PARCOURS_DOCTORAL_REFERENCE_INDEX_TIMEOUT=0)
 class AutocompleteTestCase(OsisPortalTestCase):
 
     def setUp(self):
@@ -293,3 +296,103 @@ class AutocompleteTestCase(OsisPortalTestCase):
             {'id': second_scholarship_uuid, 'text': "EM-2"},
         ]
         self.assertDictEqual(response.json(), {'pagination': {'more': False}, 'results': expected})
+
+
+@override_settings(PARCOURS_DOCTORAL_REFERENCE_INDEX_TIMEOUT=3600)
+class ReferenceIndexAutocompleteTestCase(OsisPortalTestCase):
+    def setUp(self):
+        self.client.force_login(PersonFactory().user)
+        countries_index.clear()
+        languages_index.clear()
+        self.addCleanup(countries_index.clear)
+        self.addCleanup(languages_index.clear)
+
+    @patch('osis_reference_sdk.api.countries_api.CountriesApi')
+    def test_autocomplete_country_from_index(self, api):
+        api.return_value.countries_list.return_value = Mock(
+            results=[
+                MockCountry(iso_code='FR', name='France', name_en='France', european_union=True),
+                MockCountry(iso_code='BE', name='Belgique', name_en='Belgium', european_union=True),
+                MockCountry(iso_code='EG', name='Égypte', name_en='Egypt', european_union=False),
+            ],
+            count=3,
+        )
+        url = reverse('parcours_doctoral:autocomplete:country')
+
+        response = self.client.get(url, {'q': 'eg'})
+        expected = [
+            {
+                'id': 'EG',
+                'text': 'Égypte',
+                'european_union': False,
+            },
+        ]
+        self.assertDictEqual(response.json(), {'results': expected, 'pagination': {'more': False}})
+
+        response = self.client.get(url, {'q': 'b'})
+        self.assertEqual([result['id'] for result in response.json()['results']], ['BE'])
+
+        # The whole table is loaded once
+        api.return_value.countries_list.assert_called_once()
+        self.assertNotIn('search', api.return_value.countries_list.call_args[1])
+
+    @patch('osis_reference_sdk.api.languages_api.LanguagesApi')
+    def test_autocomplete_languages_from_index(self, api):
+        api.return_value.languages_list.return_value = Mock(
+            results=[
+                MockLanguage(code='FR', name='Français', name_en='French'),
+                MockLanguage(code='EN', name='Anglais', name_en='English'),
+            ],
+            count=2,
+        )
+        url = reverse('parcours_doctoral:autocomplete:language')
+
+        response = self.client.get(url, {'q': 'fran'})
+        self.assertDictEqual(
+            response.json(),
+            {'pagination': {'more': False}, 'results': [{'id': 'FR', 'text': 'Français'}]},
+        )
+
+        response = self.client.get(url, {'q': ''})
+        self.assertEqual([result['id'] for result in response.json()['results']], ['EN', 'FR'])
+
+        api.return_value.languages_list.assert_called_once()
+
+    @patch('osis_reference_sdk.api.countries_api.CountriesApi')
+    def test_autocomplete_country_pagination_from_index(self, api):
+        api.return_value.countries_list.return_value = Mock(
+            results=[
+                MockCountry(iso_code=f'C{index:02}', name=f'Country {index:02}', name_en='', european_union=False)
+                for index in range(21)
+            ],
+            count=21,
+        )
+        url = reverse('parcours_doctoral:autocomplete:country')
+
+        response = self.client.get(url, {'q': 'country', 'page': 1}).json()
+        self.assertEqual(len(response['results']), 20)
+        self.assertIs(response['pagination']['more'], True)
+
+        response = self.client.get(url, {'q': 'country', 'page': 2}).json()
+        self.assertEqual([result['id'] for result in response['results']], ['C20'])
+        self.assertIs(response['pagination']['more'], False)
+
+        # A full last page has no next page
+        api.return_value.countries_list.return_value.results.pop()
+        api.return_value.countries_list.return_value.count = 20
+        countries_index.clear()
+        response = self.client.get(url, {'q': 'country', 'page': 1}).json()
+        self.assertEqual(len(response['results']), 20)
+        self.assertIs(response['pagination']['more'], False)
+
+    @patch('osis_reference_sdk.api.countries_api.CountriesApi')
+    def test_autocomplete_country_falls_back_to_the_api(self, api):
+        api.return_value.countries_list.side_effect = [
+            Exception('Unavailable'),
+            Mock(results=[MockCountry(iso_code='FR', name='France', name_en='France', european_union=True)]),
+        ]
+        url = reverse('parcours_doctoral:autocomplete:country')
+
+        response = self.client.get(url, {'q': 'F'})
+        self.assertEqual([result['id'] for result in response.json()['results']], ['FR'])
+        self.assertEqual(api.return_value.countries_list.call_args[1]['search'], 'F')
@@ -76,7 +76,8 @@ class ConfirmationPaperDetailViewTestCase(BaseDoctorateTestCase):
     def test_get_several_confirmation_papers(self):
         self.client.force_login(self.person.user)
 
-        response = self.client.get(self.url)
+        with self.assertServiceCalls(maximum=2):
+            response = self.client.get(self.url)
 
         # Load the doctorate information
         self.mock_doctorate_api.return_value.doctorate_retrieve.assert_called()
@@ -67,7 +67,8 @@ class CotutelleDetailViewTestCase(BaseCotutelleTestCase):
 
     def test_cotutelle_get(self):
         self.client.force_login(self.person.user)
-        response = self.client.get(self.url)
+        with self.assertServiceCalls(maximum=2):
+            response = self.client.get(self.url)
         self.assertContains(response, 'osis-document.umd.min.js')
         self.assertContains(response, 'Cotutelle reason')
 
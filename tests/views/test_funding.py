@@ -58,7 +58,8 @@ class FundingDetailViewTestCase(BaseDoctorateTestCase):
 
     def test_detail(self):
         self.client.force_login(self.person.user)
-        response = self.client.get(self.url)
+        with self.assertServiceCalls(maximum=1):
+            response = self.client.get(self.url)
 
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, 'osis-document.umd.min.js')
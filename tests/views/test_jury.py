@@ -81,7 +81,8 @@ class JuryPreparationTestCase(BaseDoctorateTestCase):
         self.assertEqual(response.status_code, 403)
 
     def test_jury_get(self):
-        response = self.client.get(self.detail_url)
+        with self.assertServiceCalls(maximum=3):
+            response = self.client.get(self.detail_url)
         self.assertContains(response, "Foobar")
 
     def test_jury_get_form(self):
@@ -124,7 +125,8 @@ class JuryTestCase(BaseDoctorateTestCase):
         self.assertEqual(response.status_code, 403)
 
     def test_jury_get(self):
-        response = self.client.get(self.detail_url)
+        with self.assertServiceCalls(maximum=2):
+            response = self.client.get(self.detail_url)
         self.assertContains(response, "Troufignon")
 
     def test_jury_create_no_permission(self):
@@ -117,7 +117,8 @@ class ManuscriptValidationViewTestCase(BaseDoctorateTestCase):
 
         self.mock_doctorate_object.links['validate_manuscript'] = ActionLink._from_openapi_data(error='access error')
 
-        response = self.client.get(self.url)
+        with self.assertServiceCalls(maximum=2):
+            response = self.client.get(self.url)
 
         # Load the doctorate information
         self.mock_doctorate_api.return_value.doctorate_retrieve.assert_called()
@@ -25,8 +25,11 @@
 # ##############################################################################
 import datetime
 import uuid
+from unittest.mock import Mock, patch
 
+from django.core.cache import cache
 from django.shortcuts import resolve_url
+from django.test import override_settings
 from osis_parcours_doctoral_sdk.model.action_link import ActionLink
 from osis_parcours_doctoral_sdk.model.private_defense_dto import PrivateDefenseDTO
 from osis_parcours_doctoral_sdk.model.private_defense_minutes_canvas import (
@@ -44,6 +47,7 @@ from parcours_doctoral.contrib.forms.private_defense import (
     PrivateDefenseForm,
     PromoterPrivateDefenseForm,
 )
+from parcours_doctoral.services.cache import DoctorateDataCache
 from parcours_doctoral.tests.mixins import BaseDoctorateTestCase
 
 
@@ -87,9 +91,14 @@ class PrivateDefenseDetailViewTestCase(BaseDoctorateTestCase):
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, 403)
 
+        # Nothing else than the doctorate is loaded
+        self.mock_doctorate_api.return_value.retrieve_private_defenses.assert_not_called()
+        self.mock_doctorate_api.return_value.retrieve_jury_preparation.assert_not_called()
+
     def test_get_private_defense(self):
         self.client.force_login(self.person.user)
-        response = self.client.get(self.url)
+        with self.assertServiceCalls(maximum=3):
+            response = self.client.get(self.url)
 
         # Load the doctorate information
         self.mock_doctorate_api.return_value.doctorate_retrieve.assert_called()
@@ -465,6 +474,84 @@ class PrivateDefenseMinutesCanvasViewTestCase(BaseDoctorateTestCase):
 
         self.assertRedirects(response=response, expected_url=self.project_url, fetch_redirect_response=False)
 
+    @override_settings(
+        CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'pdf-tests'}},
+        PARCOURS_DOCTORAL_DOCTORATE_CACHE_TIMEOUT=60,
+        PARCOURS_DOCTORAL_PDF_CACHE_TIMEOUT=60,
+    )
+    def test_generated_document_is_cached_while_the_doctorate_is_unchanged(self):
+        cache.clear()
+        self.client.force_login(self.person.user)
+        mock_retrieve = self.mock_doctorate_api.return_value.retrieve_private_defense_minutes_canvas
+
+        self.client.get(self.url)
+        response = self.client.get(self.url)
+
+        self.assertRedirects(response=response, expected_url=self.project_url, fetch_redirect_response=False)
+        mock_retrieve.assert_called_once()
+
+        DoctorateDataCache.invalidate(self.doctorate_uuid)
+        self.client.get(self.url)
+
+        self.assertEqual(mock_retrieve.call_count, 2)
+
+    @override_settings(
+        CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'pdf-tests'}},
+        PARCOURS_DOCTORAL_DOCTORATE_CACHE_TIMEOUT=60,
+        PARCOURS_DOCTORAL_PDF_CACHE_TIMEOUT=60,
+    )
+    def test_generated_document_is_not_shared_between_users(self):
+        cache.clear()
+        mock_retrieve = self.mock_doctorate_api.return_value.retrieve_private_defense_minutes_canvas
+        other_url = resolve_url('parcours_doctoral:funding', pk=self.doctorate_uuid)
+
+        self.client.force_login(self.person.user)
+        self.client.get(self.url)
+
+        mock_retrieve.return_value = PrivateDefenseMinutesCanvas._from_openapi_data(url=other_url)
+        self.client.force_login(PersonFactory().user)
+        response = self.client.get(self.url)
+
+        # The document is generated again for the other user, with its own signed url
+        self.assertRedirects(response=response, expected_url=other_url, fetch_redirect_response=False)
+        self.assertEqual(mock_retrieve.call_count, 2)
+
+    @override_settings(PARCOURS_DOCTORAL_PDF_STREAMING=True)
+    @patch('parcours_doctoral.contrib.views.mixins.open_remote_file')
+    def test_stream_the_generated_document(self, mock_open_remote_file):
+        self.client.force_login(self.person.user)
+        remote_file = mock_open_remote_file.return_value = Mock(
+            status=206,
+            headers={
+                'Content-Type': 'application/pdf',
+                'Content-Range': 'bytes 0-3/10',
+                'Content-Length': '4',
+                'Server': 'document-server',
+            },
+        )
+        remote_file.stream.return_value = iter([b'%P', b'DF'])
+
+        response = self.client.get(self.url, HTTP_RANGE='bytes=0-3')
+
+        mock_open_remote_file.assert_called_once_with(self.project_url, range_header='bytes=0-3')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(b''.join(response.streaming_content), b'%PDF')
+        self.assertEqual(response['Content-Type'], 'application/pdf')
+        self.assertEqual(response['Content-Range'], 'bytes 0-3/10')
+        self.assertFalse(response.has_header('Server'))
+        remote_file.release_conn.assert_called_once()
+
+    @override_settings(PARCOURS_DOCTORAL_PDF_STREAMING=True)
+    @patch('parcours_doctoral.contrib.views.mixins.open_remote_file')
+    def test_redirect_to_the_generated_document_if_it_cannot_be_streamed(self, mock_open_remote_file):
+        self.client.force_login(self.person.user)
+        remote_file = mock_open_remote_file.return_value = Mock(status=404, headers={})
+
+        response = self.client.get(self.url)
+
+        self.assertRedirects(response=response, expected_url=self.project_url, fetch_redirect_response=False)
+        remote_file.release_conn.assert_called_once()
+
 
 class PrivateDefenseMinutesViewTestCase(BaseDoctorateTestCase):
     @classmethod
@@ -523,6 +610,8 @@ class PrivateDefenseMinutesViewTestCase(BaseDoctorateTestCase):
             expected_url='http://dummyurl.com/document/file/foobar',
             fetch_redirect_response=False,
         )
+        # The jury is not needed to redirect to the minutes
+        self.mock_doctorate_api.return_value.retrieve_jury_preparation.assert_not_called()
 
     def test_redirect_to_the_private_defenses_url_if_no_minutes_to_redirect(self):
         self.client.force_login(self.person.user)
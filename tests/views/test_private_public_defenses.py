@@ -89,7 +89,8 @@ class PrivatePublicDefensesDetailViewTestCase(BaseDoctorateTestCase):
 
     def test_get_private_public_defenses(self):
         self.client.force_login(self.person.user)
-        response = self.client.get(self.url)
+        with self.assertServiceCalls(maximum=3):
+            response = self.client.get(self.url)
 
         # Load the doctorate information
         self.mock_doctorate_api.return_value.doctorate_retrieve.assert_called()
@@ -24,10 +24,13 @@
 #
 # ##############################################################################
 
+from unittest.mock import patch
+
 from django.shortcuts import resolve_url
 from django.utils.translation import gettext_lazy as _
 from osis_parcours_doctoral_sdk.model.action_link import ActionLink
 
+from parcours_doctoral.contrib.views.mixins import AsyncLoadViewMixin, LoadViewMixin
 from parcours_doctoral.tests.mixins import BaseDoctorateTestCase
 
 
@@ -41,12 +44,23 @@ class ProjectDetailViewTestCase(BaseDoctorateTestCase):
     def test_detail_no_permission(self):
         self.client.force_login(self.person.user)
         self.mock_doctorate_object.links['retrieve_project'] = ActionLink._from_openapi_data(error='access error')
-        response = self.client.get(self.url)
+        with patch.object(AsyncLoadViewMixin, 'aprefetch') as aprefetch:
+            response = self.client.get(self.url)
         self.assertEqual(response.status_code, 403)
+        aprefetch.assert_not_called()
 
     def test_detail(self):
         self.client.force_login(self.person.user)
-        response = self.client.get(self.url)
+        with self.assertServiceCalls(maximum=1):
+            response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, 'osis-document.umd.min.js')
         self.assertContains(response, _('Proximity commission for experimental and clinical research (ECLI)'))
+
+    def test_detail_is_prefetched_once(self):
+        self.client.force_login(self.person.user)
+        with patch.object(LoadViewMixin, 'prefetch') as prefetch:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        prefetch.assert_not_called()
+        self.mock_doctorate_api.return_value.doctorate_retrieve.assert_called_once()
@@ -27,6 +27,7 @@ import datetime
 import uuid
 
 from django.shortcuts import resolve_url
+from django.test import override_settings
 from osis_parcours_doctoral_sdk.model.action_link import ActionLink
 from osis_parcours_doctoral_sdk.model.public_defense_minutes_canvas import (
     PublicDefenseMinutesCanvas,
@@ -44,6 +45,7 @@ from parcours_doctoral.contrib.forms.public_defense import (
     PromoterPublicDefenseForm,
     PublicDefenseForm,
 )
+from parcours_doctoral.services.bulkheads import bulkhead_registry, get_bulkhead
 from parcours_doctoral.tests.mixins import BaseDoctorateTestCase
 
 
@@ -68,7 +70,8 @@ class PublicDefenseDetailViewTestCase(BaseDoctorateTestCase):
 
     def test_get_public_defense(self):
         self.client.force_login(self.person.user)
-        response = self.client.get(self.url)
+        with self.assertServiceCalls(maximum=1):
+            response = self.client.get(self.url)
 
         # Load the doctorate information
         self.mock_doctorate_api.return_value.doctorate_retrieve.assert_called()
@@ -113,6 +116,24 @@ class PublicDefenseFormViewTestCase(BaseDoctorateTestCase):
         self.assertEqual(form['resume_annonce'].value(), 'Announcement summary')
         self.assertEqual(form['photo_annonce'].value(), [])
 
+    @override_settings(PARCOURS_DOCTORAL_BULKHEADS={'reference': {'max_concurrent': 1, 'max_queue': 0}})
+    def test_get_public_defense_with_a_saturated_reference_bulkhead(self):
+        self.client.force_login(self.person.user)
+        bulkhead_registry.clear()
+        self.addCleanup(bulkhead_registry.clear)
+        # The only slot of the reference data is used by another call
+        get_bulkhead('reference').acquire()
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.mock_language_api.return_value.languages_list.assert_not_called()
+        # The language cannot be loaded, so its code is displayed
+        self.assertEqual(
+            list(response.context['form'].fields['langue_soutenance_publique'].choices),
+            [('', ' - '), ('FR', 'FR')],
+        )
+
     def test_post_a_public_defense_with_complete_data(self):
         self.client.force_login(self.person.user)
 
@@ -142,7 +142,8 @@ class SupervisionTestCase(BaseDoctorateTestCase):
     def test_should_detail_supervision_member(self):
         self.client.force_login(self.person.user)
 
-        response = self.client.get(self.detail_url)
+        with self.assertServiceCalls(maximum=3):
+            response = self.client.get(self.detail_url)
 
         # Display the signatures
         self.assertContains(response, "Troufignon")
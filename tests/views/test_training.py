@@ -164,19 +164,22 @@ class TrainingTestCase(BaseDoctorateTestCase):
                 ects=8,
             ),
         ]
-        response = self.client.get(self.url)
+        with self.assertServiceCalls(maximum=3):
+            response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "osis-document.umd.min.js")
         self.assertContains(response, "45")
 
     def test_complementary_training_list(self):
         url = resolve_url("parcours_doctoral:complementary-training", pk=self.doctorate_uuid)
-        response = self.client.get(url)
+        with self.assertServiceCalls(maximum=3):
+            response = self.client.get(url)
         self.assertEqual(response.status_code, 200)
 
     def test_course_enrollment_list(self):
         url = resolve_url("parcours_doctoral:course-enrollment", pk=self.doctorate_uuid)
-        response = self.client.get(url)
+        with self.assertServiceCalls(maximum=3):
+            response = self.client.get(url)
         self.assertEqual(response.status_code, 200)
 
     def test_create_wrong_category(self):
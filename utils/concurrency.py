@@ -0,0 +1,83 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.utils import translation
+
+__all__ = [
+    "run_concurrently",
+]
+
+DEFAULT_MAX_WORKERS = 8
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Return the bounded thread pool shared by the whole process."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=getattr(settings, 'PARCOURS_DOCTORAL_CONCURRENCY_MAX_WORKERS', DEFAULT_MAX_WORKERS),
+                    thread_name_prefix='parcours_doctoral',
+                )
+    return _executor
+
+
+def run_concurrently(*functions):
+    """
+    Call the functions concurrently and return their results, in the same order. If a function raises an exception,
+    the exception is returned instead of its result.
+
+    The first function is called in the current thread and the other ones on the shared thread pool, with the current
+    language and context variables. These functions must not access the database.
+    """
+    language = translation.get_language()
+
+    def call(function):
+        with translation.override(language):
+            return function()
+
+    futures = [get_executor().submit(contextvars.copy_context().run, call, function) for function in functions[1:]]
+
+    results = []
+    for function in functions[:1]:
+        try:
+            results.append(function())
+        except Exception as exception:
+            results.append(exception)
+    for future in futures:
+        try:
+            results.append(future.result())
+        except Exception as exception:
+            results.append(exception)
+    return results
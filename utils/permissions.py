@@ -0,0 +1,158 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet
+
+import waffle
+from django.core.exceptions import ImproperlyConfigured
+
+from parcours_doctoral.constants import READ_ACTIONS_BY_TAB, UPDATE_ACTIONS_BY_TAB
+from parcours_doctoral.services.context import get_service_context
+
+__all__ = [
+    "DoctoratePermissions",
+    "get_doctorate_permissions",
+]
+
+# Parent tabs which are still displayed when the 'parcours_doctoral_limited_tabs' switch is active
+LIMITED_PARENT_TABS = {
+    'doctorate',
+    'training',
+    'course-enrollment',
+    'confirmation-paper',
+}
+
+# Attribute of the doctorates holding their permissions snapshot
+_PERMISSIONS_ATTRIBUTE = '_parcours_doctoral_permissions'
+
+
+def _get_allowed_actions(doctorate) -> FrozenSet[str]:
+    try:
+        links = doctorate.links
+    except AttributeError:
+        raise ImproperlyConfigured("The doctorate should contain the 'links' property to check tab access")
+    items = links.items() if isinstance(links, dict) else links.to_dict().items()
+    return frozenset(action_name for action_name, link in items if link and 'url' in link)
+
+
+def _get_allowed_tabs(actions_by_tab, allowed_actions) -> FrozenSet[str]:
+    allowed_tabs = set()
+    for tab_name, actions in actions_by_tab.items():
+        if isinstance(actions, str):
+            actions = [actions]
+        elif not isinstance(actions, list):
+            raise ImproperlyConfigured(f'{actions} should be a string or a list')
+        if any(action in allowed_actions for action in actions):
+            allowed_tabs.add(tab_name)
+    return frozenset(allowed_tabs)
+
+
+@dataclass(frozen=True)
+class DoctoratePermissions:
+    """Snapshot of the actions allowed on a doctorate and of the tabs which can be read or updated, from its links."""
+
+    actions: FrozenSet[str]
+    readable_tabs: FrozenSet[str]
+    updatable_tabs: FrozenSet[str]
+    _valid_tab_trees: Dict = field(default_factory=dict, compare=False, repr=False)
+
+    @classmethod
+    def from_doctorate(cls, doctorate):
+        return cls.from_actions(_get_allowed_actions(doctorate))
+
+    @classmethod
+    def from_actions(cls, actions):
+        return cls(
+            actions=actions,
+            readable_tabs=_get_allowed_tabs(READ_ACTIONS_BY_TAB, actions),
+            updatable_tabs=_get_allowed_tabs(UPDATE_ACTIONS_BY_TAB, actions),
+        )
+
+    def can_make_action(self, action_name):
+        return action_name in self.actions
+
+    @staticmethod
+    def _check_tab(tab_name, actions_by_tab):
+        if tab_name not in actions_by_tab:
+            raise ImproperlyConfigured(
+                "Please check that the '{}' property is well specified in the 'READ_ACTIONS_BY_TAB' and"
+                " 'UPDATE_ACTIONS_BY_TAB' constants".format(tab_name)
+            )
+
+    def can_read_tab(self, tab_name):
+        if tab_name in self.readable_tabs:
+            return True
+        self._check_tab(tab_name, READ_ACTIONS_BY_TAB)
+        return False
+
+    def can_update_tab(self, tab_name):
+        if tab_name in self.updatable_tabs:
+            return True
+        self._check_tab(tab_name, UPDATE_ACTIONS_BY_TAB)
+        return False
+
+    def get_valid_tab_tree(self, tab_tree):
+        """Return the tabs of the tab tree which can be read, the parent tabs without any readable sub tab excluded."""
+        valid_tab_tree = self._valid_tab_trees.get(id(tab_tree))
+        if valid_tab_tree is None:
+            # Some tabs are temporary hidden depending on a switch
+            limited_tabs = waffle.switch_is_active('parcours_doctoral_limited_tabs')
+            valid_tab_tree = {}
+            for parent_tab, sub_tabs in tab_tree.items():
+                if limited_tabs and parent_tab.name not in LIMITED_PARENT_TABS:
+                    continue
+                valid_sub_tabs = [tab for tab in sub_tabs if self.can_read_tab(tab.name)]
+                if valid_sub_tabs:
+                    valid_tab_tree[parent_tab] = valid_sub_tabs
+            self._valid_tab_trees[id(tab_tree)] = valid_tab_tree
+        return valid_tab_tree
+
+
+def get_doctorate_permissions(doctorate) -> DoctoratePermissions:
+    """
+    Return the permissions snapshot of the doctorate. It is computed once by request, being shared by the view and the
+    template tags through the service context of the request, if any, and kept on the doctorate, which reuses it while
+    its links are unchanged.
+    """
+    context = get_service_context()
+    doctorate_uuid = getattr(doctorate, 'uuid', None)
+    key = ('doctorate_permissions', str(doctorate_uuid))
+    if context is not None and doctorate_uuid:
+        found, permissions = context.get_result(key)
+        if found:
+            return permissions
+
+    actions = _get_allowed_actions(doctorate)
+    attributes = getattr(doctorate, '__dict__', {})
+    permissions = attributes.get(_PERMISSIONS_ATTRIBUTE)
+    if permissions is None or permissions.actions != actions:
+        permissions = DoctoratePermissions.from_actions(actions)
+        # Set directly as the SDK models refuse the unknown attributes
+        attributes[_PERMISSIONS_ATTRIBUTE] = permissions
+
+    if context is not None and doctorate_uuid:
+        context.store_result(key, permissions, doctorate_uuid=doctorate_uuid)
+    return permissions
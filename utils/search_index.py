@@ -0,0 +1,198 @@
+# ##############################################################################
+#
+#  OSIS stands for Open Student Information System. It's an application
+#  designed to manage the core business of higher education institutions,
+#  such as universities, faculties, institutes and professional schools.
+#  The core business involves the administration of students, teachers,
+#  courses, programs and so on.
+#
+#  Copyright (C) 2015-2026 Université catholique de Louvain (http://www.uclouvain.be)
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  A copy of this license - GNU General Public License - is available
+#  at the root of the source code of this program.  If not,
+#  see http://www.gnu.org/licenses/.
+#
+# ##############################################################################
+import re
+import threading
+import unicodedata
+from collections import Counter
+
+__all__ = [
+    "SearchIndex",
+    "fold_text",
+    "get_words",
+]
+
+WORD_RE = re.compile(r'\w+')
+DEFAULT_MIN_SIMILARITY = 0.3
+
+
+def fold_text(text):
+    """Return the text without accents and in lower case, to compare it with the searched terms."""
+    return ''.join(
+        character for character in unicodedata.normalize('NFKD', text or '') if not unicodedata.combining(character)
+    ).casefold()
+
+
+def get_words(text):
+    """Return the folded words of the text."""
+    return WORD_RE.findall(fold_text(text))
+
+
+def get_trigrams(word):
+    padded_word = f'  {word} '
+    return {padded_word[index : index + 3] for index in range(len(padded_word) - 2)}
+
+
+class TrieNode:
+    __slots__ = ['children', 'keys']
+
+    def __init__(self):
+        self.children = {}
+        self.keys = set()
+
+
+class SearchIndex:
+    """
+    In-memory index of short texts (names of countries, languages, institutes...) identified by a key.
+
+    The texts are folded (without accents and in lower case) and split into words. The words are stored in a prefix
+    trie, so that the keys whose words start with all the searched terms are found in a time depending only on the
+    length of the terms, and their trigrams are indexed to find the closest keys when no word starts with the searched
+    terms.
+    The index is updated key by key so that a change of the indexed data does not require to rebuild it.
+    """
+
+    def __init__(self, min_similarity=DEFAULT_MIN_SIMILARITY):
+        self.min_similarity = min_similarity
+        self._texts = {}
+        self._words = {}
+        self._trigrams = {}
+        self._root = TrieNode()
+        self._keys_by_trigram = {}
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._texts)
+
+    def __contains__(self, key):
+        return key in self._texts
+
+    def add(self, key, *texts):
+        """Index the texts of the key, replacing its previous ones."""
+        with self._lock:
+            if key in self._texts:
+                self.remove(key)
+
+            words = {word for text in texts for word in get_words(text)}
+            trigrams = {trigram for word in words for trigram in get_trigrams(word)}
+            self._texts[key] = texts
+            self._words[key] = words
+            self._trigrams[key] = trigrams
+
+            for word in words:
+                node = self._root
+                for character in word:
+                    node = node.children.setdefault(character, TrieNode())
+                    node.keys.add(key)
+            for trigram in trigrams:
+                self._keys_by_trigram.setdefault(trigram, set()).add(key)
+
+    def remove(self, key):
+        """Remove the key from the index, if it is indexed."""
+        with self._lock:
+            if key not in self._texts:
+                return
+            del self._texts[key]
+
+            for word in self._words.pop(key):
+                node = self._root
+                path = []
+                for character in word:
+                    child = node.children.get(character)
+                    if child is None:
+                        break
+                    child.keys.discard(key)
+                    path.append((node, character, child))
+                    node = child
+                # Prune the branches that do not lead to any key anymore
+                for parent, character, child in reversed(path):
+                    if child.keys:
+                        break
+                    del parent.children[character]
+
+            for trigram in self._trigrams.pop(key):
+                keys = self._keys_by_trigram[trigram]
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_trigram[trigram]
+
+    def update(self, texts_by_key):
+        """Make the index match the texts by key, by only indexing again the keys whose texts have changed."""
+        with self._lock:
+            for key in set(self._texts) - set(texts_by_key):
+                self.remove(key)
+            for key, texts in texts_by_key.items():
+                texts = tuple(texts)
+                if self._texts.get(key) != texts:
+                    self.add(key, *texts)
+
+    def clear(self):
+        with self._lock:
+            self._texts.clear()
+            self._words.clear()
+            self._trigrams.clear()
+            self._keys_by_trigram.clear()
+            self._root = TrieNode()
+
+    def _search_prefixes(self, terms):
+        keys = None
+        for term in terms:
+            node = self._root
+            for character in term:
+                node = node.children.get(character)
+                if node is None:
+                    return set()
+            keys = set(node.keys) if keys is None else keys & node.keys
+            if not keys:
+                break
+        return keys
+
+    def _search_trigrams(self, terms):
+        searched_trigrams = {trigram for term in terms for trigram in get_trigrams(term)}
+        shared_trigrams = Counter(
+            key for trigram in searched_trigrams for key in self._keys_by_trigram.get(trigram, ())
+        )
+        similarities = {}
+        for key, shared_trigrams_number in shared_trigrams.items():
+            similarity = shared_trigrams_number / (
+                len(searched_trigrams) + len(self._trigrams[key]) - shared_trigrams_number
+            )
+            if similarity >= self.min_similarity:
+                similarities[key] = similarity
+        return similarities
+
+    def search(self, search=''):
+        """
+        Return the matching keys with their score: 1 for the keys whose words start with all the searched terms, or the
+        trigram similarity if there is no such key.
+        """
+        terms = get_words(search)
+        with self._lock:
+            if not terms:
+                return dict.fromkeys(self._texts, 1)
+            keys = self._search_prefixes(terms)
+            if keys:
+                return dict.fromkeys(keys, 1)
+            return self._search_trigrams(terms)